@@ -5,12 +5,11 @@ Main entry point for YouTube Shorts Trend Analysis CLI
 
 import sys
 import os
-import asyncio
 
 # Add src directory to Python path for proper imports
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 
-from src.cli import main
+from src.cli import run
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    run()
\ No newline at end of file
@@ -1,7 +1,8 @@
 """Analysis agent for video classification and trend reporting"""
 
+import asyncio
 import logging
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Callable, Collection
 from datetime import datetime
 from collections import Counter
 
@@ -54,7 +55,12 @@ class AnalyzerAgent:
         
         logger.info(f"[{self.agent_name}] Agent initialized with LLM: {self.llm_provider.get_model_info()}")
     
-    async def classify_videos(self, videos: List[YouTubeVideoRaw]) -> List[ClassifiedVideo]:
+    async def classify_videos(
+        self,
+        videos: List[YouTubeVideoRaw],
+        concurrency: int = 1,
+        progress_callback: Optional[Callable[[int, int], None]] = None
+    ) -> List[ClassifiedVideo]:
         """
         Classify videos into categories using AI with optimized batch processing.
         
@@ -62,6 +68,8 @@ class AnalyzerAgent:
         
         Args:
             videos: List of raw video data to classify
+            concurrency: Maximum number of batches classified at the same time
+            progress_callback: Called with (videos_done, total_videos) as batches complete
             
         Returns:
             List of classified videos with AI categorization
@@ -71,72 +79,28 @@ class AnalyzerAgent:
         if not videos:
             return []
         
-        classified_videos = []
         batch_size = 20  # Increased for Gemini 1.5 Flash context window
-        
-        # Process videos in batches
-        for i in range(0, len(videos), batch_size):
-            batch = videos[i:i + batch_size]
-            batch_num = i // batch_size + 1
-            total_batches = (len(videos) + batch_size - 1) // batch_size
-            
-            logger.debug(f"[{self.agent_name}] Processing batch {batch_num}/{total_batches}: {len(batch)} videos")
-            
-            try:
-                # Use new batch classification
-                batch_responses = await self.llm_provider.classify_videos_batch_optimized(batch, batch_size)
-                
-                # Convert to ClassifiedVideo objects
-                for response in batch_responses:
-                    # Find the corresponding video by ID
-                    video = next((v for v in batch if v.video_id == response.video_id), None)
-                    if video:
-                        classified_video = ClassifiedVideo(
-                            video_id=video.video_id,
-                            title=video.snippet.title,
-                            category=response.category,
-                            confidence=response.confidence,
-                            reasoning=response.reasoning,
-                            view_count=video.statistics.view_count if video.statistics else None,
-                            published_at=video.snippet.published_at,
-                            channel_title=video.snippet.channel_title
-                        )
-                        classified_videos.append(classified_video)
-                        
-                        logger.debug(f"[{self.agent_name}] Classified {video.video_id} as {response.category} "
-                                    f"(confidence: {response.confidence:.2f})")
-                
-                self.analysis_stats["classifications_successful"] = (self.analysis_stats["classifications_successful"] or 0) + len(batch_responses)
-                
-            except ClassificationError as e:
-                logger.warning(f"[{self.agent_name}] Batch classification failed for batch {batch_num}: {e}")
-                self.analysis_stats["classifications_failed"] = (self.analysis_stats["classifications_failed"] or 0) + len(batch)
-                
-                # Try fallback individual classification for this batch
-                logger.info(f"[{self.agent_name}] Attempting individual classification fallback for batch {batch_num}")
-                for video in batch:
-                    try:
-                        classification_response = await self.llm_provider.classify_video(video)
-                        
-                        classified_video = ClassifiedVideo(
-                            video_id=video.video_id,
-                            title=video.snippet.title,
-                            category=classification_response.category,
-                            confidence=classification_response.confidence,
-                            reasoning=classification_response.reasoning,
-                            view_count=video.statistics.view_count if video.statistics else None,
-                            published_at=video.snippet.published_at,
-                            channel_title=video.snippet.channel_title
-                        )
-                        
-                        classified_videos.append(classified_video)
-                        self.analysis_stats["classifications_successful"] = (self.analysis_stats["classifications_successful"] or 0) + 1
-                        
-                        logger.debug(f"[{self.agent_name}] Individual fallback classified {video.video_id} as {classification_response.category}")
-                        
-                    except ClassificationError as fallback_error:
-                        logger.warning(f"[{self.agent_name}] Individual fallback also failed for video {video.video_id}: {fallback_error}")
-                        continue
+        batches = [videos[i:i + batch_size] for i in range(0, len(videos), batch_size)]
+        total_batches = len(batches)
+        
+        # Reason: batches are independent LLM calls, so up to `concurrency` of them
+        # wait on the provider at once; gather keeps results in input order.
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+        videos_done = 0
+        
+        async def run_batch(batch_num: int, batch: List[YouTubeVideoRaw]) -> List[ClassifiedVideo]:
+            nonlocal videos_done
+            async with semaphore:
+                batch_results = await self._classify_batch(batch, batch_num, total_batches, batch_size)
+            videos_done += len(batch)
+            if progress_callback:
+                progress_callback(videos_done, len(videos))
+            return batch_results
+        
+        batch_results = await asyncio.gather(
+            *(run_batch(batch_num, batch) for batch_num, batch in enumerate(batches, 1))
+        )
+        classified_videos = [video for results in batch_results for video in results]
         
         # Update statistics
         self.analysis_stats["videos_analyzed"] = (self.analysis_stats["videos_analyzed"] or 0) + len(videos)
@@ -147,10 +111,94 @@ class AnalyzerAgent:
         
         return classified_videos
     
+    async def _classify_batch(
+        self,
+        batch: List[YouTubeVideoRaw],
+        batch_num: int,
+        total_batches: int,
+        batch_size: int
+    ) -> List[ClassifiedVideo]:
+        """
+        Classify one batch, falling back to per-video classification on failure.
+        
+        Args:
+            batch: Videos in this batch
+            batch_num: 1-based batch number (for logging)
+            total_batches: Total number of batches (for logging)
+            batch_size: Batch size passed to the provider
+            
+        Returns:
+            List of classified videos from this batch
+        """
+        logger.debug(f"[{self.agent_name}] Processing batch {batch_num}/{total_batches}: {len(batch)} videos")
+        
+        classified_videos = []
+        
+        try:
+            # Use new batch classification
+            batch_responses = await self.llm_provider.classify_videos_batch_optimized(batch, batch_size)
+            
+            # Convert to ClassifiedVideo objects
+            for response in batch_responses:
+                # Find the corresponding video by ID
+                video = next((v for v in batch if v.video_id == response.video_id), None)
+                if video:
+                    classified_video = ClassifiedVideo(
+                        video_id=video.video_id,
+                        title=video.snippet.title,
+                        category=response.category,
+                        confidence=response.confidence,
+                        reasoning=response.reasoning,
+                        view_count=video.statistics.view_count if video.statistics else None,
+                        published_at=video.snippet.published_at,
+                        channel_title=video.snippet.channel_title
+                    )
+                    classified_videos.append(classified_video)
+                    
+                    logger.debug(f"[{self.agent_name}] Classified {video.video_id} as {response.category} "
+                                f"(confidence: {response.confidence:.2f})")
+            
+            self.analysis_stats["classifications_successful"] = (self.analysis_stats["classifications_successful"] or 0) + len(batch_responses)
+            
+        except ClassificationError as e:
+            logger.warning(f"[{self.agent_name}] Batch classification failed for batch {batch_num}: {e}")
+            self.analysis_stats["classifications_failed"] = (self.analysis_stats["classifications_failed"] or 0) + len(batch)
+            
+            # Try fallback individual classification for this batch
+            logger.info(f"[{self.agent_name}] Attempting individual classification fallback for batch {batch_num}")
+            for video in batch:
+                try:
+                    classification_response = await self.llm_provider.classify_video(video)
+                    
+                    classified_video = ClassifiedVideo(
+                        video_id=video.video_id,
+                        title=video.snippet.title,
+                        category=classification_response.category,
+                        confidence=classification_response.confidence,
+                        reasoning=classification_response.reasoning,
+                        view_count=video.statistics.view_count if video.statistics else None,
+                        published_at=video.snippet.published_at,
+                        channel_title=video.snippet.channel_title
+                    )
+                    
+                    classified_videos.append(classified_video)
+                    self.analysis_stats["classifications_successful"] = (self.analysis_stats["classifications_successful"] or 0) + 1
+                    
+                    logger.debug(f"[{self.agent_name}] Individual fallback classified {video.video_id} as {classification_response.category}")
+                    
+                except ClassificationError as fallback_error:
+                    logger.warning(f"[{self.agent_name}] Individual fallback also failed for video {video.video_id}: {fallback_error}")
+                    continue
+        
+        return classified_videos
+    
     async def classify_videos_with_enhanced_analysis(
         self, 
         videos: List[YouTubeVideoRaw],
-        include_video_content: bool = False
+        include_video_content: bool = False,
+        concurrency: int = 1,
+        progress_callback: Optional[Callable[[int, int], None]] = None,
+        video_content_categories: Optional[Collection[VideoCategory]] = None
     ) -> List[EnhancedClassifiedVideo]:
         """
         비디오를 분류하고 필요시 실제 비디오 콘텐츠 분석도 수행합니다.
@@ -158,6 +206,11 @@ class AnalyzerAgent:
         Args:
             videos: 분석할 비디오 리스트
             include_video_content: 실제 비디오 콘텐츠 분석 여부 (Gemini 사용)
+            concurrency: 동시에 분류할 최대 배치 수
+            progress_callback: 배치 완료 시 (완료 수, 전체 수)로 호출되는 콜백
+            video_content_categories: 비디오 콘텐츠 분석을 수행할 카테고리
+                (None이면 전체). 텍스트 분류 결과가 다른 카테고리인 영상은
+                비싼 Gemini 비디오 분석을 건너뜀
             
         Returns:
             향상된 분석 결과가 포함된 분류된 비디오 리스트
@@ -166,7 +219,9 @@ class AnalyzerAgent:
                    f"(비디오 콘텐츠 분석: {'ON' if include_video_content else 'OFF'})")
         
         # 먼저 기본 텍스트 기반 분류 수행
-        classified_videos = await self.classify_videos(videos)
+        classified_videos = await self.classify_videos(
+            videos, concurrency=concurrency, progress_callback=progress_callback
+        )
         
         enhanced_videos = []
         
@@ -183,8 +238,11 @@ class AnalyzerAgent:
                 analysis_source="text"
             )
             
-            # 비디오 콘텐츠 분석이 요청된 경우
-            if include_video_content:
+            # 비디오 콘텐츠 분석이 요청되었고 대상 카테고리인 경우
+            if include_video_content and (
+                video_content_categories is None or
+                classified_video.category in video_content_categories
+            ):
                 try:
                     logger.debug(f"[{self.agent_name}] 비디오 콘텐츠 분석: {classified_video.video_id}")
                     
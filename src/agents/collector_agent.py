@@ -77,38 +77,65 @@ class CollectorAgent:
         if self.youtube_client is None:
             self.youtube_client = YouTubeClient()
 
-        all_videos = []
-        collected_video_ids = set()
+        # Reason: searches are I/O bound, so queries run concurrently (bounded by the
+        # settings) and wall time tracks the slowest query instead of the sum.
+        semaphore = asyncio.Semaphore(self.settings.max_concurrent_api_calls)
+        stop_collection = asyncio.Event()
+        # Quota units claimed by searches still in flight; the client only counts
+        # a search once its response arrives
+        reserved_quota = 0
 
-        for i, query in enumerate(search_queries):
-            try:
+        async def search_query(i: int, query: str) -> List[YouTubeVideoRaw]:
+            nonlocal reserved_quota
+            async with semaphore:
+                if stop_collection.is_set():
+                    return []
+                
                 logger.info(f"[{self.agent_name}] Query {i+1}/{len(search_queries)}: '{query}'")
                 
                 # Check quota before making expensive search call
-                current_quota = self.youtube_client.get_quota_usage()
+                # Reason: check and reservation happen without an await in between, so
+                # concurrent searches cannot all pass the check against the same usage
+                current_quota = self.youtube_client.get_quota_usage() + reserved_quota
                 if current_quota + 100 > self.settings.max_daily_quota:
                     logger.warning(f"[{self.agent_name}] Quota limit approaching, stopping collection")
-                    break
+                    stop_collection.set()
+                    return []
+                reserved_quota += 100
                 
-                videos = await self.youtube_client.search_trending_shorts(
-                    query=query,
-                    max_results=max_results_per_query,
-                    days=days,
-                    order="viewCount",
-                    region_code=region_code
-                )
-                
-                for video in videos:
-                    if video.video_id not in collected_video_ids:
-                        all_videos.append(video)
-                        collected_video_ids.add(video.video_id)
+                try:
+                    # Quota Cost: 100 units per search (+1 per videos.list page)
+                    return await self.youtube_client.search_trending_shorts(
+                        query=query,
+                        max_results=max_results_per_query,
+                        days=days,
+                        order="viewCount",
+                        region_code=region_code
+                    )
 
-            except QuotaExceededError as e:
-                logger.error(f"[{self.agent_name}] Quota exceeded: {e}. Stopping collection.")
-                break
-            except YouTubeAPIError as e:
-                logger.error(f"[{self.agent_name}] API error for query '{query}': {e}")
-                continue
+                except QuotaExceededError as e:
+                    logger.error(f"[{self.agent_name}] Quota exceeded: {e}. Stopping collection.")
+                    stop_collection.set()
+                    return []
+                except YouTubeAPIError as e:
+                    logger.error(f"[{self.agent_name}] API error for query '{query}': {e}")
+                    return []
+                finally:
+                    # Released either way: on success the client has counted the search
+                    reserved_quota -= 100
+
+        results = await asyncio.gather(
+            *(search_query(i, query) for i, query in enumerate(search_queries))
+        )
+
+        # Merge in query order so de-duplication matches sequential collection
+        all_videos = []
+        collected_video_ids = set()
+        for videos in results:
+            for video in videos:
+                if video.video_id not in collected_video_ids:
+                    all_videos.append(video)
+                    collected_video_ids.add(video.video_id)
 
         if not all_videos:
             logger.warning(f"[{self.agent_name}] No videos found for any query.")
@@ -1,9 +1,12 @@
 """Caching system for the FastAPI application"""
 
+import asyncio
 import json
 import hashlib
 import logging
-from typing import Any, Optional, Dict
+import time
+from functools import wraps
+from typing import Any, Optional, Dict, Tuple
 from datetime import datetime, timedelta
 
 try:
@@ -202,4 +205,49 @@ def cache_result(prefix: str = "result", ttl: int = 3600):
             return result
         
         return wrapper
-    return decorator
\ No newline at end of file
+    return decorator
+
+
+def single_flight(ttl: float):
+    """
+    Decorator caching a coroutine's result in-process for a short TTL.
+    
+    Concurrent callers with the same arguments share one in-flight computation,
+    so N dashboards polling at once trigger a single backend roll-up. Errors are
+    not cached.
+    
+    Args:
+        ttl: Seconds a computed result stays fresh
+    """
+    def decorator(func):
+        entries: Dict[Any, Tuple[Any, float]] = {}
+        locks: Dict[Any, asyncio.Lock] = {}
+        
+        @wraps(func)
+        async def wrapper(*args, **kwargs):
+            key = (args, tuple(sorted(kwargs.items())))
+            
+            entry = entries.get(key)
+            if entry is not None and time.monotonic() < entry[1]:
+                return entry[0]
+            
+            lock = locks.setdefault(key, asyncio.Lock())
+            async with lock:
+                # Reason: another caller may have refreshed the entry while we waited
+                entry = entries.get(key)
+                if entry is not None and time.monotonic() < entry[1]:
+                    return entry[0]
+                
+                result = await func(*args, **kwargs)
+                entries[key] = (result, time.monotonic() + ttl)
+                logger.debug(f"Refreshed single-flight cache for {func.__name__}")
+                return result
+        
+        def cache_clear():
+            """Drop all cached results"""
+            entries.clear()
+            locks.clear()
+        
+        wrapper.cache_clear = cache_clear
+        return wrapper
+    return decorator
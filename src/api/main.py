@@ -14,13 +14,14 @@ from pydantic import BaseModel, Field
 
 from .middleware import RequestLoggingMiddleware, RateLimitMiddleware, SecurityHeadersMiddleware
 from .cache import get_cache_manager, cache_result
-from .monitoring_routes import router as monitoring_router
+from .monitoring_routes import router as monitoring_router, internal_router as monitoring_internal_router
 from .charts_routes import router as charts_router
 
 from ..services.natural_query_service import create_natural_query_service, QueryResponse
+from ..services.notification_service import close_notification_service
 from ..plugins.plugin_manager import create_plugin_manager
 from ..core.settings import get_settings
-from ..core.logging import setup_logging, get_logger
+from ..core.logging import setup_logging, get_logger, shutdown_logging
 from ..core.health import check_health
 
 # Setup logging
@@ -56,6 +57,9 @@ async def lifespan(app: FastAPI):
         raise
     finally:
         logger.info("Shutting down YouTube Trends Analysis Web Service...")
+        await close_notification_service()
+        # Flush queued log records and stop the logging threads
+        shutdown_logging()
 
 
 # FastAPI app instance
@@ -67,9 +71,14 @@ app = FastAPI(
 )
 
 # Add custom middleware (order matters!)
+_trusted_proxies = get_settings().trusted_proxies
 app.add_middleware(SecurityHeadersMiddleware)
-app.add_middleware(RequestLoggingMiddleware)
-app.add_middleware(RateLimitMiddleware, calls_per_minute=100)  # Allow 100 requests per minute
+app.add_middleware(RequestLoggingMiddleware, trusted_proxies=_trusted_proxies)
+app.add_middleware(
+    RateLimitMiddleware,
+    calls_per_minute=100,  # Allow 100 requests per minute
+    trusted_proxies=_trusted_proxies
+)
 
 # CORS middleware
 app.add_middleware(
@@ -82,6 +91,7 @@ app.add_middleware(
 
 # Include monitoring routes
 app.include_router(monitoring_router)
+app.include_router(monitoring_internal_router)
 
 # Include charts routes
 app.include_router(charts_router)
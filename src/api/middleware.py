@@ -1,122 +1,248 @@
-"""Custom middleware for the FastAPI application"""
+"""Custom middleware for the FastAPI application
+
+All middleware here is plain ASGI rather than ``BaseHTTPMiddleware``, which
+spawns a task group and pipes every response through a memory stream.
+"""
 
 import time
+import asyncio
 import logging
-from typing import Callable
-from fastapi import Request, Response
+from collections import deque
+from typing import AbstractSet, Iterable
 from fastapi.responses import JSONResponse
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from cachetools import TTLCache
 
 logger = logging.getLogger(__name__)
 
 
-class RequestLoggingMiddleware(BaseHTTPMiddleware):
+# Socket peers whose X-Forwarded-For header is trusted (the local nginx proxy)
+DEFAULT_TRUSTED_PROXIES = frozenset({"127.0.0.1", "::1"})
+
+
+def _client_ip(scope: Scope, trusted_proxies: AbstractSet[str] = DEFAULT_TRUSTED_PROXIES) -> str:
+    """
+    Resolve the client address straight from the ASGI scope.
+    
+    Behind the nginx proxy the socket peer is the proxy itself, so when the peer
+    is a trusted proxy the right-most ``X-Forwarded-For`` entry (the address the
+    proxy appended) wins. Earlier entries come from the client and are ignored.
+    The header is parsed as bytes to skip decoding every header.
+    
+    Args:
+        scope: ASGI connection scope
+        trusted_proxies: Peer addresses allowed to set X-Forwarded-For
+        
+    Returns:
+        str: Client IP address, or "unknown"
+    """
+    client = scope.get("client")
+    peer = client[0] if client else None
+    
+    # Reason: nginx's $proxy_add_x_forwarded_for appends to whatever the client
+    # sent, so only the last entry of a header from a trusted peer is reliable
+    if peer in trusted_proxies:
+        for name, value in scope.get("headers", ()):
+            if name == b"x-forwarded-for":
+                forwarded = value.rsplit(b",", 1)[-1].strip()
+                if forwarded:
+                    return forwarded.decode("latin-1")
+                break
+    
+    return peer or "unknown"
+
+
+class RequestLoggingMiddleware:
     """Middleware for detailed request logging and metrics"""
     
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
-        start_time = time.time()
+    def __init__(self, app: ASGIApp, trusted_proxies: Iterable[str] = DEFAULT_TRUSTED_PROXIES):
+        self.app = app
+        self.trusted_proxies = frozenset(trusted_proxies)
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
         
-        # Log incoming request
-        logger.info(
-            f"Incoming request: {request.method} {request.url.path} "
-            f"from {request.client.host if request.client else 'unknown'}"
-        )
+        start = time.perf_counter_ns()
+        method = scope["method"]
+        path = scope["path"]
+        status_code = None
+        
+        # Log incoming request (lazy %-formatting is skipped when INFO is disabled)
+        logger.info("Incoming request: %s %s from %s", method, path, _client_ip(scope, self.trusted_proxies))
+        
+        async def send_with_timing(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                
+                # Add processing time header
+                process_time = (time.perf_counter_ns() - start) / 1e9
+                message["headers"] = [
+                    *message.get("headers", ()),
+                    (b"x-process-time", str(process_time).encode("latin-1"))
+                ]
+            await send(message)
         
         # Process request
         try:
-            response = await call_next(request)
-            
-            # Calculate processing time
-            process_time = time.time() - start_time
-            
-            # Log response
-            logger.info(
-                f"Request completed: {request.method} {request.url.path} "
-                f"- Status: {response.status_code} "
-                f"- Time: {process_time:.3f}s"
-            )
-            
-            # Add processing time header
-            response.headers["X-Process-Time"] = str(process_time)
-            
-            return response
+            await self.app(scope, receive, send_with_timing)
             
         except Exception as e:
-            process_time = time.time() - start_time
+            process_time = (time.perf_counter_ns() - start) / 1e9
             
             logger.error(
-                f"Request failed: {request.method} {request.url.path} "
-                f"- Error: {str(e)} "
-                f"- Time: {process_time:.3f}s"
+                "Request failed: %s %s - Error: %s - Time: %.3fs",
+                method,
+                path,
+                e,
+                process_time
             )
             
+            # Reason: once headers are sent the response can no longer be replaced
+            if status_code is not None:
+                raise
+            
             # Return error response
-            return JSONResponse(
+            error_response = JSONResponse(
                 status_code=500,
                 content={
                     "error": "Internal server error",
                     "detail": str(e),
-                    "path": request.url.path,
-                    "method": request.method
+                    "path": path,
+                    "method": method
                 }
             )
+            await error_response(scope, receive, send)
+            return
+        
+        # Calculate processing time
+        process_time = (time.perf_counter_ns() - start) / 1e9
+        
+        # Log response
+        logger.info(
+            "Request completed: %s %s - Status: %d - Time: %.3fs",
+            method,
+            path,
+            status_code,
+            process_time
+        )
 
 
-class RateLimitMiddleware(BaseHTTPMiddleware):
+class RateLimitMiddleware:
     """Simple rate limiting middleware"""
     
-    def __init__(self, app, calls_per_minute: int = 60):
-        super().__init__(app)
+    # Number of lock shards guarding the per-client windows (must be a power of two)
+    LOCK_SHARDS = 16
+    
+    def __init__(
+        self,
+        app: ASGIApp,
+        calls_per_minute: int = 60,
+        trusted_proxies: Iterable[str] = DEFAULT_TRUSTED_PROXIES
+    ):
+        self.app = app
         self.calls_per_minute = calls_per_minute
-        self.requests = {}  # In production, use Redis
+        self.trusted_proxies = frozenset(trusted_proxies)
+        # In production, use Redis. Per-client request timestamps; bounded so that a
+        # long-running process does not keep one entry per IP it has ever seen.
+        self.requests: TTLCache = TTLCache(maxsize=10_000, ttl=120)
+        # Clients already known to be over the limit, keyed by (client_ip, minute bucket)
+        self._blocked: TTLCache = TTLCache(maxsize=10_000, ttl=60)
+        self._locks = [asyncio.Lock() for _ in range(self.LOCK_SHARDS)]
     
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+    def _rate_limited_response(self) -> JSONResponse:
+        """Build the 429 response returned to throttled clients"""
+        return JSONResponse(
+            status_code=429,
+            content={
+                "error": "Rate limit exceeded",
+                "detail": f"Maximum {self.calls_per_minute} requests per minute allowed",
+                "retry_after": 60
+            }
+        )
+    
+    async def _record_request(self, client_ip: str, current_time: float) -> bool:
+        """
+        Record a request in the client's sliding window.
+        
+        Args:
+            client_ip: Client IP address
+            current_time: Request timestamp
+            
+        Returns:
+            bool: False if the client is over the limit (nothing is recorded)
+        """
+        async with self._locks[hash(client_ip) & (self.LOCK_SHARDS - 1)]:
+            timestamps = self.requests.get(client_ip)
+            if timestamps is None:
+                timestamps = deque()
+            
+            # Clean old requests (older than 1 minute); timestamps are in arrival order
+            while timestamps and current_time - timestamps[0] >= 60:
+                timestamps.popleft()
+            
+            if len(timestamps) >= self.calls_per_minute:
+                return False
+            
+            timestamps.append(current_time)
+            # Reason: re-assigning refreshes the entry's TTL in the cache
+            self.requests[client_ip] = timestamps
+            return True
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
         # Get client IP
-        client_ip = request.client.host if request.client else "unknown"
+        client_ip = _client_ip(scope, self.trusted_proxies)
         current_time = time.time()
+        blocked_key = (client_ip, int(current_time // 60))
         
-        # Clean old requests (older than 1 minute)
-        if client_ip in self.requests:
-            self.requests[client_ip] = [
-                req_time for req_time in self.requests[client_ip]
-                if current_time - req_time < 60
-            ]
-        else:
-            self.requests[client_ip] = []
+        # Reason: once a client is over the limit for this window there is no point
+        # re-scanning (or, with a shared backend, re-incrementing) its counters.
+        if self._blocked.get(blocked_key):
+            await self._rate_limited_response()(scope, receive, send)
+            return
         
-        # Check rate limit
-        if len(self.requests[client_ip]) >= self.calls_per_minute:
+        # Check rate limit and record this request
+        if not await self._record_request(client_ip, current_time):
             logger.warning(f"Rate limit exceeded for {client_ip}")
-            return JSONResponse(
-                status_code=429,
-                content={
-                    "error": "Rate limit exceeded",
-                    "detail": f"Maximum {self.calls_per_minute} requests per minute allowed",
-                    "retry_after": 60
-                }
-            )
-        
-        # Record this request
-        self.requests[client_ip].append(current_time)
+            self._blocked[blocked_key] = True
+            await self._rate_limited_response()(scope, receive, send)
+            return
         
         # Process request
-        response = await call_next(request)
-        return response
+        await self.app(scope, receive, send)
 
 
-class SecurityHeadersMiddleware(BaseHTTPMiddleware):
-    """Add security headers to responses"""
+class SecurityHeadersMiddleware:
+    """Add security headers to responses (pure ASGI middleware)"""
     
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
-        response = await call_next(request)
-        
-        # Add security headers
-        response.headers["X-Content-Type-Options"] = "nosniff"
-        response.headers["X-Frame-Options"] = "DENY"
-        response.headers["X-XSS-Protection"] = "1; mode=block"
-        response.headers["Referrer-Policy"] = "strict-origin-when-cross-origin"
+    # Reason: the headers never change, so they are encoded once and appended to
+    # the raw ASGI header list instead of going through MutableHeaders per response.
+    RAW_HEADERS = (
+        (b"x-content-type-options", b"nosniff"),
+        (b"x-frame-options", b"DENY"),
+        (b"x-xss-protection", b"1; mode=block"),
+        (b"referrer-policy", b"strict-origin-when-cross-origin"),
+        # API version header
+        (b"x-api-version", b"1.0.0"),
+    )
+    
+    def __init__(self, app: ASGIApp):
+        self.app = app
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
         
-        # Add API version header
-        response.headers["X-API-Version"] = "1.0.0"
+        async def send_with_headers(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                message["headers"] = [*message.get("headers", ()), *self.RAW_HEADERS]
+            await send(message)
         
-        return response
\ No newline at end of file
+        await self.app(scope, receive, send_with_headers)
@@ -3,11 +3,14 @@
 import asyncio
 from typing import Dict, Any, List, Optional
 from datetime import datetime, timedelta
-from fastapi import APIRouter, HTTPException, BackgroundTasks, Query
+from fastapi import APIRouter, HTTPException, BackgroundTasks, Query, Request, Response
 from pydantic import BaseModel, Field
 
+from .cache import single_flight
+from .responses import ORJSONResponse
+
 from ..core.scheduler import get_scheduler
-from ..services.trend_detector import TrendDetector
+from ..services.trend_detector import get_trend_detector
 from ..services.trend_storage import get_trend_storage
 from ..services.notification_service import get_notification_service
 from ..core.settings import get_settings
@@ -16,7 +19,24 @@ from ..core.logging import get_logger
 logger = get_logger(__name__)
 
 # Create router
-router = APIRouter(prefix="/api/monitoring", tags=["monitoring"])
+router = APIRouter(
+    prefix="/api/monitoring",
+    tags=["monitoring"],
+    default_response_class=ORJSONResponse
+)
+
+# Endpoints polled every few seconds by the dashboard and health probes. They are
+# kept out of the OpenAPI schema and return plain dicts without response_model.
+internal_router = APIRouter(
+    prefix="/api/monitoring",
+    include_in_schema=False,
+    default_response_class=ORJSONResponse
+)
+
+# Freshness windows for polled endpoints (seconds)
+STATUS_CACHE_TTL = 5
+DASHBOARD_CACHE_TTL = 5
+ANALYTICS_CACHE_TTL = 60
 
 
 # Pydantic models for API responses
@@ -76,32 +96,41 @@ class CategoryAnalytics(BaseModel):
     trend_momentum: float
 
 
+@single_flight(ttl=STATUS_CACHE_TTL)
+async def _build_monitoring_status() -> MonitoringStatus:
+    """Assemble the monitoring status shared by concurrent /status polls"""
+    settings = get_settings()
+    scheduler = get_scheduler()
+    trend_detector = get_trend_detector()
+    notification_service = get_notification_service()
+    
+    # Get scheduler status
+    scheduler_status = scheduler.get_all_jobs_status()
+    
+    # Get trend detector stats
+    detector_stats = trend_detector.get_stats()
+    
+    # Get notification stats
+    notification_stats = await notification_service.get_notification_stats()
+    
+    # Values come straight from our own services, so skip field validation
+    return MonitoringStatus.model_construct(
+        monitoring_enabled=settings.monitoring_enabled,
+        scheduler_running=scheduler_status["scheduler_running"],
+        last_detection=detector_stats["detector_stats"]["last_detection"],
+        next_scheduled_run=scheduler_status["statistics"]["next_execution"],
+        total_trends_detected=detector_stats["detector_stats"]["trends_detected"],
+        total_alerts_sent=notification_stats["total_notifications_sent"]
+    )
+
+
 @router.get("/status", response_model=MonitoringStatus)
-async def get_monitoring_status():
+async def get_monitoring_status(response: Response):
     """Get current monitoring system status"""
     try:
-        settings = get_settings()
-        scheduler = get_scheduler()
-        trend_detector = TrendDetector()
-        notification_service = get_notification_service()
-        
-        # Get scheduler status
-        scheduler_status = scheduler.get_all_jobs_status()
-        
-        # Get trend detector stats
-        detector_stats = trend_detector.get_stats()
-        
-        # Get notification stats
-        notification_stats = await notification_service.get_notification_stats()
-        
-        return MonitoringStatus(
-            monitoring_enabled=settings.monitoring_enabled,
-            scheduler_running=scheduler_status["scheduler_running"],
-            last_detection=detector_stats["detector_stats"]["last_detection"],
-            next_scheduled_run=scheduler_status["statistics"]["next_execution"],
-            total_trends_detected=detector_stats["detector_stats"]["trends_detected"],
-            total_alerts_sent=notification_stats["total_notifications_sent"]
-        )
+        status = await _build_monitoring_status()
+        response.headers["Cache-Control"] = f"max-age={STATUS_CACHE_TTL}"
+        return status
         
     except Exception as e:
         logger.error(f"Failed to get monitoring status: {e}")
@@ -155,7 +184,7 @@ async def trigger_trend_detection(background_tasks: BackgroundTasks):
     """Manually trigger trend detection"""
     try:
         async def run_detection():
-            trend_detector = TrendDetector()
+            trend_detector = get_trend_detector()
             notification_service = get_notification_service()
             storage = await get_trend_storage()
             
@@ -180,7 +209,47 @@ async def trigger_trend_detection(background_tasks: BackgroundTasks):
         raise HTTPException(status_code=500, detail=f"Failed to trigger trend detection: {e}")
 
 
-@router.get("/alerts", response_model=List[TrendAlertResponse])
+def _etag_matches(request: Request, response: Response, version: str) -> bool:
+    """
+    Set a weak ETag from a data version and check If-None-Match.
+    
+    Args:
+        request: Incoming request
+        response: Response whose headers receive the ETag
+        version: Value that changes whenever the underlying data changes
+        
+    Returns:
+        bool: True if the client already holds the current representation
+    """
+    etag = f'W/"{version}"'
+    response.headers["ETag"] = etag
+    return request.headers.get("if-none-match") == etag
+
+
+def _instance_version(source: Any) -> str:
+    """
+    Version an in-process service by its ``version`` counter.
+    
+    Only valid for state that lives in this process; the instance id keeps tags
+    from a replaced service instance apart.
+    """
+    return f"{id(source):x}-{source.version}"
+
+
+def _not_modified(response: Response) -> Response:
+    """Build a 304 response carrying the current ETag"""
+    return Response(status_code=304, headers={"ETag": response.headers["ETag"]})
+
+
+def _as_datetime(value: Any) -> Any:
+    """Parse an ISO timestamp string as stored by SQLite (datetimes pass through)"""
+    return datetime.fromisoformat(value) if isinstance(value, str) else value
+
+
+# Reason: alert and keyword rows come from our own storage layer, so the handlers
+# below build responses with model_construct (no per-field validation) and declare
+# the schema via `responses` rather than response_model, which would revalidate.
+@router.get("/alerts", responses={200: {"model": List[TrendAlertResponse]}})
 async def get_recent_alerts(
     hours: int = Query(default=24, ge=1, le=168, description="Hours to look back (1-168)"),
     alert_type: Optional[str] = Query(default=None, description="Filter by alert type"),
@@ -190,16 +259,12 @@ async def get_recent_alerts(
     try:
         storage = await get_trend_storage()
         
-        # Get alerts from storage
-        alerts = await storage.get_recent_alerts(hours=hours, alert_type=alert_type)
-        
-        # Limit results
-        alerts = alerts[:limit]
+        # Get alerts from storage (limited in SQL)
+        alerts = await storage.get_recent_alerts(hours=hours, alert_type=alert_type, limit=limit)
         
         # Convert to response format
-        response_alerts = []
-        for alert in alerts:
-            response_alerts.append(TrendAlertResponse(
+        return [
+            TrendAlertResponse.model_construct(
                 alert_id=alert["alert_id"],
                 alert_type=alert["alert_type"],
                 title=alert["title"],
@@ -207,20 +272,20 @@ async def get_recent_alerts(
                 video_id=alert["video_id"],
                 channel_title=alert["channel_title"],
                 confidence_score=alert["confidence_score"],
-                detected_at=alert["detected_at"],
+                detected_at=_as_datetime(alert["detected_at"]),
                 category=alert["category"],
                 keywords=alert["keywords"],
                 youtube_url=alert["youtube_url"]
-            ))
-        
-        return response_alerts
+            )
+            for alert in alerts
+        ]
         
     except Exception as e:
         logger.error(f"Failed to get recent alerts: {e}")
         raise HTTPException(status_code=500, detail="Failed to get recent alerts")
 
 
-@router.get("/keywords", response_model=List[KeywordTrend])
+@router.get("/keywords", responses={200: {"model": List[KeywordTrend]}})
 async def get_trending_keywords(
     days: int = Query(default=7, ge=1, le=30, description="Days to analyze (1-30)"),
     limit: int = Query(default=20, ge=1, le=100, description="Maximum number of keywords to return")
@@ -233,38 +298,41 @@ async def get_trending_keywords(
         keywords = await storage.get_trending_keywords(days=days, limit=limit)
         
         # Convert to response format
-        response_keywords = []
-        for keyword in keywords:
-            # Calculate trend score (simple frequency-based scoring)
-            trend_score = min(1.0, keyword["frequency"] / 10.0)  # Normalize to 0-1
-            
-            response_keywords.append(KeywordTrend(
+        return [
+            KeywordTrend.model_construct(
                 keyword=keyword["keyword"],
                 category=keyword["category"],
                 frequency=keyword["frequency"],
                 peak_frequency=keyword["peak_frequency"],
-                first_seen=keyword["first_seen"],
-                last_seen=keyword["last_seen"],
-                trend_score=trend_score
-            ))
-        
-        return response_keywords
+                first_seen=_as_datetime(keyword["first_seen"]),
+                last_seen=_as_datetime(keyword["last_seen"]),
+                # Calculate trend score (simple frequency-based scoring)
+                trend_score=min(1.0, keyword["frequency"] / 10.0)  # Normalize to 0-1
+            )
+            for keyword in keywords
+        ]
         
     except Exception as e:
         logger.error(f"Failed to get trending keywords: {e}")
         raise HTTPException(status_code=500, detail="Failed to get trending keywords")
 
 
+@single_flight(ttl=ANALYTICS_CACHE_TTL)
+async def _load_category_analytics(days: int) -> Dict[str, Any]:
+    """Load category analytics, sharing the query across concurrent requests"""
+    storage = await get_trend_storage()
+    return await storage.get_category_analytics(days=days)
+
+
 @router.get("/analytics", response_model=List[CategoryAnalytics])
 async def get_category_analytics(
+    response: Response,
     days: int = Query(default=30, ge=1, le=90, description="Days to analyze (1-90)")
 ):
     """Get category analytics"""
     try:
-        storage = await get_trend_storage()
-        
         # Get category analytics
-        analytics = await storage.get_category_analytics(days=days)
+        analytics = await _load_category_analytics(days)
         
         # Convert to response format
         response_analytics = []
@@ -280,6 +348,7 @@ async def get_category_analytics(
                 trend_momentum=trend_momentum
             ))
         
+        response.headers["Cache-Control"] = f"max-age={ANALYTICS_CACHE_TTL}"
         return response_analytics
         
     except Exception as e:
@@ -287,11 +356,13 @@ async def get_category_analytics(
         raise HTTPException(status_code=500, detail="Failed to get category analytics")
 
 
-@router.get("/jobs")
-async def get_scheduled_jobs():
+@internal_router.get("/jobs")
+async def get_scheduled_jobs(request: Request, response: Response):
     """Get status of all scheduled jobs"""
     try:
         scheduler = get_scheduler()
+        if _etag_matches(request, response, _instance_version(scheduler)):
+            return _not_modified(response)
         return scheduler.get_all_jobs_status()
         
     except Exception as e:
@@ -299,11 +370,14 @@ async def get_scheduled_jobs():
         raise HTTPException(status_code=500, detail="Failed to get scheduled jobs")
 
 
-@router.get("/storage/stats")
-async def get_storage_stats():
+@internal_router.get("/storage/stats")
+async def get_storage_stats(request: Request, response: Response):
     """Get storage statistics"""
     try:
         storage = await get_trend_storage()
+        # Reason: other processes write the same database, so the tag comes from the file
+        if _etag_matches(request, response, storage.data_version()):
+            return _not_modified(response)
         return await storage.get_storage_stats()
         
     except Exception as e:
@@ -369,11 +443,13 @@ async def test_notifications():
         raise HTTPException(status_code=500, detail="Failed to test notifications")
 
 
-@router.get("/notifications/stats")
-async def get_notification_stats():
+@internal_router.get("/notifications/stats")
+async def get_notification_stats(request: Request, response: Response):
     """Get notification statistics"""
     try:
         notification_service = get_notification_service()
+        if _etag_matches(request, response, _instance_version(notification_service)):
+            return _not_modified(response)
         return await notification_service.get_notification_stats()
         
     except Exception as e:
@@ -381,32 +457,56 @@ async def get_notification_stats():
         raise HTTPException(status_code=500, detail="Failed to get notification stats")
 
 
-@router.get("/dashboard/data")
-async def get_dashboard_data():
+@single_flight(ttl=DASHBOARD_CACHE_TTL)
+async def _build_dashboard_data() -> Dict[str, Any]:
+    """Collect dashboard data, coalescing concurrent refreshes into one roll-up"""
+    # Get data from all services
+    storage = await get_trend_storage()
+    notification_service = get_notification_service()
+    trend_detector = get_trend_detector()
+    scheduler = get_scheduler()
+    
+    # Reason: the queries are independent, so run them concurrently and pay
+    # the slowest one instead of the sum of all of them
+    (
+        recent_alerts,
+        trending_keywords,
+        category_analytics,
+        storage_stats,
+        notification_stats
+    ) = await asyncio.gather(
+        storage.get_recent_alerts(hours=24),
+        storage.get_trending_keywords(days=7, limit=10),
+        storage.get_category_analytics(days=30),
+        storage.get_storage_stats(),
+        notification_service.get_notification_stats()
+    )
+    
+    # Collect dashboard data
+    dashboard_data = {
+        "timestamp": datetime.now(),
+        "monitoring_status": {
+            "enabled": get_settings().monitoring_enabled,
+            "scheduler_running": scheduler.is_running,
+            "last_detection": None
+        },
+        "recent_alerts": recent_alerts,
+        "trending_keywords": trending_keywords,
+        "category_analytics": category_analytics,
+        "storage_stats": storage_stats,
+        "notification_stats": notification_stats,
+        "detector_stats": trend_detector.get_stats()
+    }
+    
+    return dashboard_data
+
+
+@internal_router.get("/dashboard/data")
+async def get_dashboard_data(response: Response):
     """Get comprehensive dashboard data"""
     try:
-        # Get data from all services
-        storage = await get_trend_storage()
-        notification_service = get_notification_service()
-        trend_detector = TrendDetector()
-        scheduler = get_scheduler()
-        
-        # Collect dashboard data
-        dashboard_data = {
-            "timestamp": datetime.now(),
-            "monitoring_status": {
-                "enabled": get_settings().monitoring_enabled,
-                "scheduler_running": scheduler.is_running,
-                "last_detection": None
-            },
-            "recent_alerts": await storage.get_recent_alerts(hours=24),
-            "trending_keywords": await storage.get_trending_keywords(days=7, limit=10),
-            "category_analytics": await storage.get_category_analytics(days=30),
-            "storage_stats": await storage.get_storage_stats(),
-            "notification_stats": await notification_service.get_notification_stats(),
-            "detector_stats": trend_detector.get_stats()
-        }
-        
+        dashboard_data = await _build_dashboard_data()
+        response.headers["Cache-Control"] = f"max-age={DASHBOARD_CACHE_TTL}"
         return dashboard_data
         
     except Exception as e:
@@ -414,7 +514,7 @@ async def get_dashboard_data():
         raise HTTPException(status_code=500, detail="Failed to get dashboard data")
 
 
-@router.get("/health")
+@internal_router.get("/health")
 async def monitoring_health_check():
     """Health check for monitoring system"""
     try:
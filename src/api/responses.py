@@ -0,0 +1,19 @@
+"""Response classes for the FastAPI application"""
+
+from typing import Any
+
+import orjson
+from fastapi.responses import JSONResponse
+
+
+class ORJSONResponse(JSONResponse):
+    """
+    JSON response rendered with orjson.
+    
+    orjson encodes dicts, datetimes and UUIDs natively and several times faster
+    than the stdlib encoder; anything it does not know falls back to ``str``.
+    """
+    
+    def render(self, content: Any) -> bytes:
+        """Serialize the response content to JSON bytes"""
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS, default=str)
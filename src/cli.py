@@ -2,42 +2,558 @@
 
 import asyncio
 import argparse
+import contextlib
+import functools
 import json
+import os
 import sys
 import signal
 import logging
+import threading
+import mmap
+import time
+from collections import Counter
+from dataclasses import dataclass
 from datetime import datetime
-from typing import Dict
+from operator import attrgetter
+from typing import Any, Dict, List, Optional
 import atexit
 
-from .agents.collector_agent import create_collector_agent
-from .agents.analyzer_agent import create_analyzer_agent
-from .services.natural_query_service import create_natural_query_service
-from .models.video_models import VideoCategory, ChallengeType
+from pydantic import SerializeAsAny, TypeAdapter, ValidationError
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is listed in requirements.txt
+    orjson = None
+
+try:
+    import ijson
+except ImportError:  # pragma: no cover - large files are parsed in one go instead
+    ijson = None
+
+# Reason: agents, the query service and health checks pull in the LLM/HTTP client
+# chains, so they are imported by the commands that use them to keep --help fast.
+# The models stay here because the module-level TypeAdapters need them.
+from .models.video_models import (
+    VideoCategory, ChallengeType, YouTubeVideoRaw, ClassifiedVideo
+)
 from .core.settings import get_settings
 from .core.exceptions import (
     YouTubeAPIError, QuotaExceededError, ClassificationError
 )
-from .core.logging import setup_logging, get_logger
-from .core.error_handler import get_error_handler
-from .core.health import check_health
-from .core.scheduler import get_scheduler, start_monitoring, stop_monitoring
+from .core.logging import setup_logging, get_logger, shutdown_logging
 
 # Setup logging system
 setup_logging()
 logger = get_logger(__name__)
 
 
+@dataclass(slots=True, frozen=True)
+class ReportArgs:
+    """Arguments for report_command when it is driven by another command"""
+    input: str
+    category: Optional[str]
+    output: str
+    format: str
+
+
+class _CommandExit(Exception):
+    """
+    Raised by a command to end the CLI with a non-zero exit status.
+    
+    Commands run inside a task, where sys.exit would surface as a cancellation;
+    main() turns this into the exit status once the task has finished.
+    """
+    
+    def __init__(self, code: int = 1):
+        super().__init__(code)
+        self.code = code
+
+
+def _no_status(*args: Any, **kwargs: Any) -> None:
+    """Drop a status line (quiet mode)"""
+
+
+# Progress and status lines go through _status so --quiet / TRENDS_QUIET=1 can
+# silence them in one place; results, reports and errors are always printed.
+_status = _no_status if os.environ.get("TRENDS_QUIET") == "1" else print
+
+
+def _set_quiet(quiet: bool) -> None:
+    """Route status lines to stdout, or drop them when quiet"""
+    global _status
+    _status = _no_status if quiet else print
+
+
+# Reason: list adapters validate and dump a whole file in one pass instead of one
+# model call per row. SerializeAsAny keeps the extra fields of EnhancedClassifiedVideo.
+_RAW_ADAPTER = TypeAdapter(List[YouTubeVideoRaw])
+_CLASSIFIED_ADAPTER = TypeAdapter(List[SerializeAsAny[ClassifiedVideo]])
+
+
+# Input files above this size are streamed with ijson, validating a chunk of rows
+# at a time, so the raw dicts and the models are never all in memory together.
+_STREAM_THRESHOLD_BYTES = 64 * 1024 * 1024
+_STREAM_CHUNK_SIZE = 1000
+
+# Smaller files above this size are parsed straight from a read-only memory map
+# instead of being copied into a bytes object first; below it the mapping setup
+# costs more than the copy it saves.
+_MMAP_THRESHOLD_BYTES = 4 * 1024 * 1024
+
+
+def _validate_rows(
+    adapter: TypeAdapter,
+    rows: List[Any],
+    label: str,
+    offset: int = 0
+) -> List[Any]:
+    """
+    Validate a list of rows, dropping only the rows that fail.
+    
+    Args:
+        adapter: List TypeAdapter for the row model
+        rows: Raw row dictionaries
+        label: Row description used in warnings
+        offset: Position of the first row in the file (for warnings)
+        
+    Returns:
+        List of validated models
+    """
+    try:
+        return adapter.validate_python(rows)
+    except ValidationError as e:
+        errors = e.errors()
+        bad_rows = {
+            error['loc'][0] for error in errors
+            if error['loc'] and isinstance(error['loc'][0], int)
+        }
+        if not bad_rows:
+            raise
+        
+        # One summary line per load instead of a warning per bad row
+        indices = sorted(offset + index for index in bad_rows)
+        logger.warning(
+            f"Skipped {len(bad_rows)} invalid {label} rows at indices {indices[:10]}"
+            f"{'...' if len(indices) > 10 else ''}: {errors[0]['msg']}"
+        )
+        
+        return adapter.validate_python(
+            [row for index, row in enumerate(rows) if index not in bad_rows]
+        )
+
+
+def _load_rows(filename: str, key: str, adapter: TypeAdapter, label: str) -> List[Any]:
+    """
+    Load and validate the list stored under `key` in a JSON file.
+    
+    Args:
+        filename: Path of the JSON file
+        key: Top-level key holding the rows
+        adapter: List TypeAdapter for the row model
+        label: Row description used in warnings
+        
+    Returns:
+        List of validated models
+    """
+    if ijson is None or os.path.getsize(filename) <= _STREAM_THRESHOLD_BYTES:
+        data = _load_json_file(filename)
+        return _validate_rows(adapter, data.get(key, []), label)
+    
+    results = []
+    chunk = []
+    offset = 0
+    with open(filename, 'rb') as f:
+        for row in ijson.items(f, f'{key}.item', use_float=True):
+            chunk.append(row)
+            if len(chunk) >= _STREAM_CHUNK_SIZE:
+                results.extend(_validate_rows(adapter, chunk, label, offset))
+                offset += len(chunk)
+                chunk = []
+    
+    if chunk:
+        results.extend(_validate_rows(adapter, chunk, label, offset))
+    
+    return results
+
+
+def _dump_json(data: Any) -> bytes:
+    """
+    Serialize data to indented UTF-8 JSON.
+    
+    Args:
+        data: JSON-compatible data (dump pydantic models with mode="json" first)
+        
+    Returns:
+        bytes: Encoded JSON document
+    """
+    if orjson is not None:
+        return orjson.dumps(
+            data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS, default=str
+        )
+    # Reason: payloads are model dumps, which are trees, so the cycle check is wasted work
+    return json.dumps(
+        data, indent=2, ensure_ascii=False, default=_json_default, check_circular=False
+    ).encode('utf-8')
+
+
+def _json_default(obj: Any) -> Any:
+    """Fallback encoder matching orjson's handling of datetimes and enums"""
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    return getattr(obj, 'value', str(obj))
+
+
+def _format_timestamp(value: datetime) -> str:
+    """Format a datetime as 'YYYY-MM-DD HH:MM:SS' without going through strftime"""
+    return (
+        f"{value.year:04d}-{value.month:02d}-{value.day:02d} "
+        f"{value.hour:02d}:{value.minute:02d}:{value.second:02d}"
+    )
+
+
+def _print_json(data: Any) -> None:
+    """
+    Write data to stdout as indented JSON.
+    
+    Args:
+        data: JSON-compatible data; datetimes and enums are encoded natively
+    """
+    payload = _dump_json(data) + b'\n'
+    stream = getattr(sys.stdout, 'buffer', None)
+    if stream is None:
+        sys.stdout.write(payload.decode('utf-8'))
+        return
+    
+    # Reason: flush pending text output so bytes land after earlier prints
+    sys.stdout.flush()
+    stream.write(payload)
+    stream.flush()
+
+
+def _load_json_file(filename: str) -> Any:
+    """
+    Read and parse a JSON file.
+    
+    Parsed documents are cached by path, modification time and size, so
+    reloading an unchanged file skips the parse. Callers must not mutate the result.
+    
+    Args:
+        filename: Path of the JSON file
+        
+    Returns:
+        Parsed JSON data
+    """
+    stat = os.stat(filename)
+    return _parse_json_file(os.path.abspath(filename), stat.st_mtime_ns, stat.st_size)
+
+
+def _write_rows_file(filename: str, key: str, adapter: TypeAdapter, rows: List[Any]) -> None:
+    """
+    Write models to a JSON file under `key`, with a timestamp and row count.
+    
+    The rows are serialized by pydantic-core straight to JSON bytes, without
+    an intermediate list of dicts, and spliced into the indented envelope.
+    
+    Args:
+        filename: Output path
+        key: Top-level key holding the rows
+        adapter: List TypeAdapter for the row model
+        rows: Models to write
+    """
+    header = _dump_json({"timestamp": datetime.now(), "total_videos": len(rows)})
+    # Reason: JSON strings never contain raw newlines, so this only re-indents
+    # the rows one level to sit inside the envelope.
+    body = adapter.dump_json(rows, indent=2).replace(b'\n', b'\n  ')
+    
+    with open(filename, 'wb') as f:
+        # header ends with b'\n}'; reopen the object to append the rows
+        f.write(header[:-2] + b',\n  "' + key.encode() + b'": ' + body + b'\n}')
+
+
+@functools.lru_cache(maxsize=4)
+def _parse_json_file(path: str, mtime_ns: int, size: int) -> Any:
+    """Parse a JSON file; mtime_ns and size only take part in the cache key"""
+    with open(path, 'rb') as f:
+        if size <= _MMAP_THRESHOLD_BYTES:
+            raw = f.read()
+            return orjson.loads(raw) if orjson is not None else json.loads(raw)
+        
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            if orjson is None:
+                return json.loads(mapped.read())
+            # Reason: the view must be released before the map can close
+            with memoryview(mapped) as view:
+                return orjson.loads(view)
+
+
+def _write_json_file(data: Any, filename: str) -> None:
+    """
+    Write data to a JSON file.
+    
+    Args:
+        data: JSON-compatible data
+        filename: Output path
+    """
+    with open(filename, 'wb') as f:
+        f.write(_dump_json(data))
+
+
+@functools.lru_cache(maxsize=1)
+def _get_query_service():
+    """Return the natural language query service, created once per process"""
+    # Deferred: the query service pulls in the LLM client chain
+    from .services.natural_query_service import create_natural_query_service
+    return create_natural_query_service()
+
+
+# Options shared by several subcommands, as (flag, add_argument keyword arguments)
+_COLLECTION_ARGS = (
+    ('--categories', dict(
+        type=str,
+        default="dance,fitness,tutorial",
+        help='Comma-separated list of categories to search'
+    )),
+    ('--max-per-category', dict(
+        type=int,
+        default=50,
+        help='Maximum videos to fetch per category for analysis (default: 50)'
+    )),
+    ('--days', dict(
+        type=int,
+        default=7,
+        help='Number of past days to search within (default: 7)'
+    )),
+    ('--top-n', dict(
+        type=int,
+        default=10,
+        help='Number of top videos to select for each metric (default: 10)'
+    )),
+    ('--region', dict(
+        type=str,
+        default="US",
+        help='Region code for search (default: US)'
+    )),
+)
+
+_CACHE_ARGS = (
+    ('--no-cache', dict(
+        action='store_true',
+        help='Classify every video again instead of reusing cached classifications'
+    )),
+    ('--cache-dir', dict(
+        type=str,
+        default="data",
+        help='Directory of the classification cache (default: data)'
+    )),
+)
+
+_FORMAT_ARGS = (
+    ('--format', dict(
+        type=str,
+        choices=['json', 'text'],
+        default='text',
+        help='Output format (default: text)'
+    )),
+)
+
+
+def _add_arguments(parser: argparse.ArgumentParser, specs) -> None:
+    """Add shared option specs to a subcommand parser"""
+    for flag, options in specs:
+        parser.add_argument(flag, **options)
+
+
+@functools.lru_cache(maxsize=1)
+def _build_parser() -> argparse.ArgumentParser:
+    """Create command-line argument parser (built once per process)"""
+    parser = argparse.ArgumentParser(
+        description="YouTube Shorts Trend Analysis MVP",
+        formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    
+    parser.add_argument(
+        '--quiet', '-q',
+        action='store_true',
+        help='Suppress progress and status messages (also set by TRENDS_QUIET=1)'
+    )
+    
+    subparsers = parser.add_subparsers(dest='command', help='Available commands')
+    
+    # Collect command
+    collect_parser = subparsers.add_parser(
+        'collect', 
+        help='Collect YouTube Shorts video data'
+    )
+    _add_arguments(collect_parser, _COLLECTION_ARGS)
+    collect_parser.add_argument(
+        '--output',
+        type=str,
+        default="collected_videos.json",
+        help='Output file for collected data (default: collected_videos.json)'
+    )
+    
+    # Analyze command
+    analyze_parser = subparsers.add_parser(
+        'analyze',
+        help='Analyze collected videos using AI classification'
+    )
+    analyze_parser.add_argument(
+        '--input',
+        type=str,
+        default="collected_videos.json",
+        help='Input file with collected videos (default: collected_videos.json)'
+    )
+    analyze_parser.add_argument(
+        '--output',
+        type=str,
+        default="classified_videos.json",
+        help='Output file for classified videos (default: classified_videos.json)'
+    )
+    analyze_parser.add_argument(
+        '--concurrency',
+        type=int,
+        default=4,
+        help='Maximum classification batches sent to the LLM at once (default: 4)'
+    )
+    _add_arguments(analyze_parser, _CACHE_ARGS)
+    
+    # Report command
+    report_parser = subparsers.add_parser(
+        'report',
+        help='Generate trend analysis report'
+    )
+    report_parser.add_argument(
+        '--input',
+        type=str,
+        default="classified_videos.json",
+        help='Input file with classified videos (default: classified_videos.json)'
+    )
+    report_parser.add_argument(
+        '--category',
+        type=str,
+        choices=['Challenge', 'Info/Advice', 'Trending Sounds/BGM'],
+        help='Specific category to analyze (default: all categories)'
+    )
+    report_parser.add_argument(
+        '--output',
+        type=str,
+        default="trend_report.json",
+        help='Output file for trend report (default: trend_report.json)'
+    )
+    _add_arguments(report_parser, _FORMAT_ARGS)
+    
+    # Full pipeline command
+    pipeline_parser = subparsers.add_parser(
+        'pipeline',
+        help='Run complete analysis pipeline (collect -> analyze -> report)'
+    )
+    _add_arguments(pipeline_parser, _COLLECTION_ARGS)
+    pipeline_parser.add_argument(
+        '--include-video-content',
+        action='store_true',
+        help='Enable video content analysis using Gemini (more detailed but slower)'
+    )
+    _add_arguments(pipeline_parser, _CACHE_ARGS)
+    
+    # Health check command
+    health_parser = subparsers.add_parser(
+        'health',
+        help='Check system health and status'
+    )
+    _add_arguments(health_parser, _FORMAT_ARGS)
+    health_parser.add_argument(
+        '--monitor',
+        action='store_true',
+        help='Run continuous health monitoring'
+    )
+    health_parser.add_argument(
+        '--interval',
+        type=int,
+        default=60,
+        help='Monitoring interval in seconds (default: 60)'
+    )
+    
+    # Chat command for natural language queries
+    chat_parser = subparsers.add_parser(
+        'chat',
+        help='Process natural language queries for video analysis'
+    )
+    chat_parser.add_argument(
+        'query',
+        type=str,
+        nargs='?',
+        help='Natural language query (e.g., "댄스 챌린지 TOP 10 찾아줘")'
+    )
+    chat_parser.add_argument(
+        '--interactive',
+        action='store_true',
+        help='Start interactive chat mode'
+    )
+    chat_parser.add_argument(
+        '--output-format',
+        type=str,
+        choices=['markdown', 'json', 'text'],
+        default='markdown',
+        help='Output format for results (default: markdown)'
+    )
+    chat_parser.add_argument(
+        '--save-results',
+        type=str,
+        help='Save results to specified file'
+    )
+    chat_parser.add_argument(
+        '--verbose',
+        action='store_true',
+        help='Show detailed processing information'
+    )
+    
+    return parser
+
+
+# Progress bar width and every possible bar, indexed by filled length
+_PROGRESS_BAR_LENGTH = 30
+_PROGRESS_BARS = tuple(
+    ('█' * filled).ljust(_PROGRESS_BAR_LENGTH, '-') for filled in range(_PROGRESS_BAR_LENGTH + 1)
+)
+
+
 class YouTubeTrendsCLI:
     """Command-line interface for YouTube Shorts trend analysis"""
     
+    # Line-editing history kept between interactive chat sessions
+    CHAT_HISTORY_FILE = os.path.expanduser("~/.trend_navigator_history")
+    CHAT_HISTORY_LENGTH = 1000
+    
+    # Health status value -> individual check icon / overall status line
+    _STATUS_ICONS = {
+        'healthy': '✅',
+        'degraded': '⚠️ ',
+        'unhealthy': '❌'
+    }
+    _SYSTEM_STATUS_LINES = {
+        'healthy': "✅ System Status: HEALTHY",
+        'degraded': "⚠️  System Status: DEGRADED",
+        'unhealthy': "❌ System Status: UNHEALTHY"
+    }
+    
+    # Progress bar redraw throttling (fraction of total, seconds)
+    PROGRESS_MIN_STEP = 0.005
+    PROGRESS_MIN_INTERVAL = 0.1
+    
+    # (current, monotonic time) of the last progress redraw
+    _progress_last = (0, 0.0)
+    
+    # Analyzer shared by every command run on this CLI instance (see _get_analyzer)
+    _analyzer = None
+    
+    # Set by SIGINT/SIGTERM once _setup_signal_handlers has run
+    _shutdown_event: Optional[asyncio.Event] = None
+    
     def __init__(self):
         """Initialize CLI"""
-        self.shutdown_requested = False
-        self.current_tasks = set()
-        
-        # Setup graceful shutdown
-        self._setup_signal_handlers()
+        # Graceful shutdown: signal handlers are installed by main() once the
+        # event loop is running (see _setup_signal_handlers)
         atexit.register(self._cleanup)
         
         try:
@@ -49,20 +565,36 @@ class YouTubeTrendsCLI:
             print("💡 Please check your .env file and ensure all required variables are set.")
             sys.exit(1)
     
-    def _setup_signal_handlers(self):
-        """Setup signal handlers for graceful shutdown"""
-        def signal_handler(signum, frame):
+    @property
+    def shutdown_requested(self) -> bool:
+        """Whether SIGINT/SIGTERM has been received"""
+        return self._shutdown_event is not None and self._shutdown_event.is_set()
+    
+    def _setup_signal_handlers(self) -> None:
+        """
+        Setup signal handlers for graceful shutdown.
+        
+        Must be called from the running event loop. Signals only set the shutdown
+        event; tracked tasks notice it in _handle_task_with_tracking and are
+        cancelled from inside the loop rather than from a signal frame.
+        """
+        loop = asyncio.get_running_loop()
+        self._shutdown_event = asyncio.Event()
+        
+        def request_shutdown(signum: int) -> None:
             signal_name = signal.Signals(signum).name
             logger.info(f"Received {signal_name}, initiating graceful shutdown...")
-            self.shutdown_requested = True
-            
-            # Cancel current tasks
-            for task in self.current_tasks:
-                if not task.done():
-                    task.cancel()
+            self._shutdown_event.set()
         
-        signal.signal(signal.SIGINT, signal_handler)
-        signal.signal(signal.SIGTERM, signal_handler)
+        for signum in (signal.SIGINT, signal.SIGTERM):
+            try:
+                loop.add_signal_handler(signum, request_shutdown, signum)
+            except NotImplementedError:
+                # Windows event loops do not support add_signal_handler
+                signal.signal(
+                    signum,
+                    lambda sig, frame: loop.call_soon_threadsafe(request_shutdown, sig)
+                )
     
     def _cleanup(self):
         """Cleanup resources on exit"""
@@ -70,230 +602,65 @@ class YouTubeTrendsCLI:
         # Any cleanup tasks can be added here
     
     async def _handle_task_with_tracking(self, coro):
-        """Execute a coroutine with task tracking for graceful shutdown"""
-        task = asyncio.create_task(coro)
-        self.current_tasks.add(task)
+        """
+        Await a coroutine, cancelling it if shutdown is requested meanwhile.
         
+        Raises:
+            asyncio.CancelledError: If the coroutine was cancelled by shutdown
+        """
+        task = asyncio.ensure_future(coro)
+        if self._shutdown_event is None:
+            return await task
+        
+        shutdown_wait = asyncio.ensure_future(self._shutdown_event.wait())
         try:
-            result = await task
-            return result
-        except asyncio.CancelledError:
-            logger.info("Task cancelled due to shutdown request")
-            raise
+            await asyncio.wait({task, shutdown_wait}, return_when=asyncio.FIRST_COMPLETED)
         finally:
-            self.current_tasks.discard(task)
-    
-    def create_parser(self) -> argparse.ArgumentParser:
-        """Create command-line argument parser"""
-        parser = argparse.ArgumentParser(
-            description="YouTube Shorts Trend Analysis MVP",
-            formatter_class=argparse.RawDescriptionHelpFormatter
-        )
-        
-        subparsers = parser.add_subparsers(dest='command', help='Available commands')
-        
-        # Collect command
-        collect_parser = subparsers.add_parser(
-            'collect', 
-            help='Collect YouTube Shorts video data'
-        )
-        collect_parser.add_argument(
-            '--categories',
-            type=str,
-            default="dance,fitness,tutorial",
-            help='Comma-separated list of categories to search'
-        )
-        collect_parser.add_argument(
-            '--max-per-category',
-            type=int,
-            default=50,
-            help='Maximum videos to fetch per category for analysis (default: 50)'
-        )
-        collect_parser.add_argument(
-            '--days',
-            type=int,
-            default=7,
-            help='Number of past days to search within (default: 7)'
-        )
-        collect_parser.add_argument(
-            '--top-n',
-            type=int,
-            default=10,
-            help='Number of top videos to select for each metric (default: 10)'
-        )
-        collect_parser.add_argument(
-            '--region',
-            type=str,
-            default="US",
-            help='Region code for search (default: US)'
-        )
-        collect_parser.add_argument(
-            '--output',
-            type=str,
-            default="collected_videos.json",
-            help='Output file for collected data (default: collected_videos.json)'
-        )
-        
-        # Analyze command
-        analyze_parser = subparsers.add_parser(
-            'analyze',
-            help='Analyze collected videos using AI classification'
-        )
-        analyze_parser.add_argument(
-            '--input',
-            type=str,
-            default="collected_videos.json",
-            help='Input file with collected videos (default: collected_videos.json)'
-        )
-        analyze_parser.add_argument(
-            '--output',
-            type=str,
-            default="classified_videos.json",
-            help='Output file for classified videos (default: classified_videos.json)'
-        )
-        
-        # Report command
-        report_parser = subparsers.add_parser(
-            'report',
-            help='Generate trend analysis report'
-        )
-        report_parser.add_argument(
-            '--input',
-            type=str,
-            default="classified_videos.json",
-            help='Input file with classified videos (default: classified_videos.json)'
-        )
-        report_parser.add_argument(
-            '--category',
-            type=str,
-            choices=['Challenge', 'Info/Advice', 'Trending Sounds/BGM'],
-            help='Specific category to analyze (default: all categories)'
-        )
-        report_parser.add_argument(
-            '--output',
-            type=str,
-            default="trend_report.json",
-            help='Output file for trend report (default: trend_report.json)'
-        )
-        report_parser.add_argument(
-            '--format',
-            type=str,
-            choices=['json', 'text'],
-            default='text',
-            help='Output format (default: text)'
-        )
-        
-        # Full pipeline command
-        pipeline_parser = subparsers.add_parser(
-            'pipeline',
-            help='Run complete analysis pipeline (collect -> analyze -> report)'
-        )
-        pipeline_parser.add_argument(
-            '--categories',
-            type=str,
-            default="dance,fitness,tutorial",
-            help='Comma-separated list of categories to search'
-        )
-        pipeline_parser.add_argument(
-            '--max-per-category',
-            type=int,
-            default=50,
-            help='Maximum videos to fetch per category for analysis (default: 50)'
-        )
-        pipeline_parser.add_argument(
-            '--days',
-            type=int,
-            default=7,
-            help='Number of past days to search within (default: 7)'
-        )
-        pipeline_parser.add_argument(
-            '--top-n',
-            type=int,
-            default=10,
-            help='Number of top videos to select for each metric (default: 10)'
-        )
-        pipeline_parser.add_argument(
-            '--region',
-            type=str,
-            default="US",
-            help='Region code for search'
-        )
-        pipeline_parser.add_argument(
-            '--include-video-content',
-            action='store_true',
-            help='Enable video content analysis using Gemini (more detailed but slower)'
-        )
+            shutdown_wait.cancel()
+            if not task.done():
+                logger.info("Task cancelled due to shutdown request")
+                task.cancel()
         
-        # Health check command
-        health_parser = subparsers.add_parser(
-            'health',
-            help='Check system health and status'
-        )
-        health_parser.add_argument(
-            '--format',
-            type=str,
-            choices=['json', 'text'],
-            default='text',
-            help='Output format (default: text)'
-        )
-        health_parser.add_argument(
-            '--monitor',
-            action='store_true',
-            help='Run continuous health monitoring'
-        )
-        health_parser.add_argument(
-            '--interval',
-            type=int,
-            default=60,
-            help='Monitoring interval in seconds (default: 60)'
-        )
-        
-        # Chat command for natural language queries
-        chat_parser = subparsers.add_parser(
-            'chat',
-            help='Process natural language queries for video analysis'
-        )
-        chat_parser.add_argument(
-            'query',
-            type=str,
-            nargs='?',
-            help='Natural language query (e.g., "댄스 챌린지 TOP 10 찾아줘")'
-        )
-        chat_parser.add_argument(
-            '--interactive',
-            action='store_true',
-            help='Start interactive chat mode'
-        )
-        chat_parser.add_argument(
-            '--output-format',
-            type=str,
-            choices=['markdown', 'json', 'text'],
-            default='markdown',
-            help='Output format for results (default: markdown)'
-        )
-        chat_parser.add_argument(
-            '--save-results',
-            type=str,
-            help='Save results to specified file'
-        )
-        chat_parser.add_argument(
-            '--verbose',
-            action='store_true',
-            help='Show detailed processing information'
-        )
+        return await task
+    
+    def _get_analyzer(self):
+        """
+        Return the analyzer agent, creating it on first use.
         
-        return parser
+        The agent and its LLM provider hold no per-command state apart from
+        statistics, so pipeline stages share one instance instead of rebuilding
+        the model client for each stage.
+        """
+        if self._analyzer is None:
+            from .agents.analyzer_agent import create_analyzer_agent
+            self._analyzer = create_analyzer_agent()
+        return self._analyzer
+    
+    def create_parser(self) -> argparse.ArgumentParser:
+        """Return the command-line argument parser, building it on first use"""
+        return _build_parser()
     
-    async def collect_command(self, args) -> None:
-        """Execute collect command"""
-        print(f"🚀 Starting Top {args.top_n} YouTube Shorts data collection from the last {args.days} days...")
+    async def collect_command(self, args, save: bool = True) -> List[YouTubeVideoRaw]:
+        """
+        Execute collect command.
+        
+        Args:
+            args: Parsed command arguments
+            save: Write the collected videos to args.output
+            
+        Returns:
+            List of collected videos (empty on failure)
+        """
+        _status(f"🚀 Starting Top {args.top_n} YouTube Shorts data collection from the last {args.days} days...")
         
         categories = [cat.strip() for cat in args.categories.split(',')]
-        print(f"📋 Target categories: {', '.join(categories)}")
+        _status(f"📋 Target categories: {', '.join(categories)}")
+        
+        from .agents.collector_agent import create_collector_agent
         
         try:
             async with create_collector_agent() as collector:
-                print(f"📊 Fetching up to {args.max_per_category} videos per category for analysis...")
+                _status(f"📊 Fetching up to {args.max_per_category} videos per category for analysis...")
                 
                 videos = await collector.collect_by_category_keywords(
                     categories=categories,
@@ -304,13 +671,20 @@ class YouTubeTrendsCLI:
                 )
                 
                 stats = collector.get_collection_stats()
-                self._save_videos_to_file(videos, args.output)
+                if save:
+                    self._save_videos_to_file(videos, args.output)
                 
-                print("\n✅ Collection complete!")
-                print("📈 Statistics:")
-                print(f"   • Unique top videos collected: {len(videos)}")
-                print(f"   • Quota used: {stats.get('quota_used', 0)}")
-                print(f"   • Output saved to: {args.output}")
+                out = [
+                    "\n✅ Collection complete!",
+                    "📈 Statistics:",
+                    f"   • Unique top videos collected: {len(videos)}",
+                    f"   • Quota used: {stats.get('quota_used', 0)}",
+                ]
+                if save:
+                    out.append(f"   • Output saved to: {args.output}")
+                _status("\n".join(out))
+                
+                return videos
                 
         except QuotaExceededError as e:
             print(f"⚠️  Quota exceeded: {e}")
@@ -320,50 +694,125 @@ class YouTubeTrendsCLI:
         except Exception as e:
             print(f"❌ Unexpected error: {e}")
             logger.exception("Collection command failed")
+        
+        return []
     
-    async def analyze_command(self, args) -> None:
-        """Execute analyze command"""
-        print("🤖 Starting AI-powered video classification...")
+    async def _classify_with_cache(
+        self,
+        analyzer,
+        videos: List[YouTubeVideoRaw],
+        args,
+        **kwargs
+    ) -> List[ClassifiedVideo]:
+        """
+        Classify videos, reusing classifications cached by earlier runs.
+        
+        Args:
+            analyzer: Analyzer agent used for cache misses
+            videos: Videos to classify
+            args: Parsed command arguments (include_video_content, no_cache, cache_dir)
+            **kwargs: Extra options for classify_videos_with_enhanced_analysis
+            
+        Returns:
+            Classified videos in input order
+        """
+        include_video_content = getattr(args, 'include_video_content', False)
+        if getattr(args, 'no_cache', True):
+            return await analyzer.classify_videos_with_enhanced_analysis(
+                videos, include_video_content=include_video_content, **kwargs
+            )
+        
+        from .services.classification_cache import ClassificationCache
+        cache = ClassificationCache(
+            cache_dir=args.cache_dir, model_version=analyzer.llm_provider.model_used
+        )
+        
+        # Reason: runs that restrict video analysis to some categories are cached
+        # apart from full runs, which expect video analysis on every video
+        video_content_categories = kwargs.get('video_content_categories')
+        cached = await cache.get_many(
+            [video.video_id for video in videos], include_video_content, video_content_categories
+        )
+        misses = [video for video in videos if video.video_id not in cached]
+        if cached:
+            _status(f"💾 Reusing {len(cached)} cached classifications")
+        
+        classified = []
+        if misses:
+            classified = await analyzer.classify_videos_with_enhanced_analysis(
+                misses, include_video_content=include_video_content, **kwargs
+            )
+            await cache.set_many(classified, include_video_content, video_content_categories)
+        
+        results = {**cached, **{video.video_id: video for video in classified}}
+        return [results[video.video_id] for video in videos if video.video_id in results]
+    
+    async def analyze_command(
+        self,
+        args,
+        videos: Optional[List[YouTubeVideoRaw]] = None,
+        save: bool = True
+    ) -> List[ClassifiedVideo]:
+        """
+        Execute analyze command.
+        
+        Args:
+            args: Parsed command arguments
+            videos: Already collected videos; loaded from args.input when None
+            save: Write the classified videos to args.output
+            
+        Returns:
+            List of classified videos (empty on failure)
+        """
+        _status("🤖 Starting AI-powered video classification...")
         
         try:
-            # Load collected videos
-            videos = self._load_videos_from_file(args.input)
-            print(f"📂 Loaded {len(videos)} videos from {args.input}")
+            # Load collected videos unless they were handed over in memory
+            if videos is None:
+                videos = self._load_videos_from_file(args.input)
+                _status(f"📂 Loaded {len(videos)} videos from {args.input}")
             
             # Create analyzer agent
-            analyzer = create_analyzer_agent()
+            analyzer = self._get_analyzer()
             
-            print("🔍 Classifying videos...")
+            _status("🔍 Classifying videos...")
             self._show_progress("Classification", 0, len(videos))
             
-            # Classify videos
-            classified_videos = await analyzer.classify_videos_with_enhanced_analysis(
+            # Classify videos; the progress bar advances as batches complete
+            classified_videos = await self._classify_with_cache(
+                analyzer,
                 videos,
-                include_video_content=getattr(args, 'include_video_content', False)
+                args,
+                concurrency=getattr(args, 'concurrency', 1),
+                progress_callback=lambda done, total: self._show_progress("Classification", done, total)
             )
             
             # Get analysis statistics
             stats = analyzer.get_analysis_stats()
             
             # Show classification results
-            category_counts: Dict[str, int] = {}
-            for video in classified_videos:
-                category_counts[video.category.value] = category_counts.get(video.category.value, 0) + 1
+            category_counts = Counter(video.category.value for video in classified_videos)
             
             # Save results
-            self._save_classified_videos_to_file(classified_videos, args.output)
+            if save:
+                self._save_classified_videos_to_file(classified_videos, args.output)
+            
+            out: List[str] = ["\n✅ Analysis complete!", "📊 Classification results:"]
+            total_classified = len(classified_videos) or 1
+            out.extend(
+                f"   • {category}: {count} videos ({count * 100 / total_classified:.1f}%)"
+                for category, count in category_counts.items()
+            )
             
-            print("\n✅ Analysis complete!")
-            print("📊 Classification results:")
-            for category, count in category_counts.items():
-                percentage = (count / len(classified_videos)) * 100
-                print(f"   • {category}: {count} videos ({percentage:.1f}%)")
+            out.append("📈 Statistics:")
+            out.append(f"   • Videos analyzed: {stats.get('videos_analyzed', 0)}")
+            out.append(f"   • Successful classifications: {stats.get('classifications_successful', 0)}")
+            out.append(f"   • Failed classifications: {stats.get('classifications_failed', 0)}")
+            if save:
+                out.append(f"   • Output saved to: {args.output}")
+            _status("\n".join(out))
             
-            print("📈 Statistics:")
-            print(f"   • Videos analyzed: {stats.get('videos_analyzed', 0)}")
-            print(f"   • Successful classifications: {stats.get('classifications_successful', 0)}")
-            print(f"   • Failed classifications: {stats.get('classifications_failed', 0)}")
-            print(f"   • Output saved to: {args.output}")
+            return classified_videos
             
         except FileNotFoundError:
             print(f"❌ Input file not found: {args.input}")
@@ -373,24 +822,36 @@ class YouTubeTrendsCLI:
         except Exception as e:
             print(f"❌ Unexpected error: {e}")
             logger.exception("Analysis command failed")
+        
+        return []
     
-    async def report_command(self, args) -> None:
-        """Execute report command"""
-        print("📈 Generating trend analysis report...")
+    async def report_command(self, args, classified_videos: Optional[List[ClassifiedVideo]] = None):
+        """
+        Execute report command.
+        
+        Args:
+            args: Parsed command arguments or ReportArgs
+            classified_videos: Already classified videos; loaded from args.input when None
+            
+        Returns:
+            The generated report or comprehensive analysis (None on failure)
+        """
+        _status("📈 Generating trend analysis report...")
         
         try:
-            # Load classified videos
-            classified_videos = self._load_classified_videos_from_file(args.input)
-            print(f"📂 Loaded {len(classified_videos)} classified videos from {args.input}")
+            # Load classified videos unless they were handed over in memory
+            if classified_videos is None:
+                classified_videos = self._load_classified_videos_from_file(args.input)
+                _status(f"📂 Loaded {len(classified_videos)} classified videos from {args.input}")
             
             # Create analyzer agent
-            analyzer = create_analyzer_agent()
+            analyzer = self._get_analyzer()
             
             # Parse category if specified
             target_category = None
             if args.category:
                 target_category = VideoCategory(args.category)
-                print(f"🎯 Focusing on category: {target_category.value}")
+                _status(f"🎯 Focusing on category: {target_category.value}")
             
             if target_category:
                 # Generate category-specific report
@@ -402,16 +863,18 @@ class YouTubeTrendsCLI:
                     self._save_report_to_file(report, args.output)
             else:
                 # Generate comprehensive analysis
-                comprehensive_analysis = analyzer.generate_comprehensive_analysis(classified_videos)
+                report = analyzer.generate_comprehensive_analysis(classified_videos)
                 
                 if args.format == 'text':
-                    self._display_comprehensive_analysis(comprehensive_analysis)
+                    self._display_comprehensive_analysis(report)
                 else:
-                    self._save_comprehensive_analysis_to_file(comprehensive_analysis, args.output)
+                    self._save_comprehensive_analysis_to_file(report, args.output)
             
-            print("✅ Report generation complete!")
+            _status("✅ Report generation complete!")
             if args.format == 'json':
-                print(f"📄 Report saved to: {args.output}")
+                _status(f"📄 Report saved to: {args.output}")
+            
+            return report
             
         except FileNotFoundError:
             print(f"❌ Input file not found: {args.input}")
@@ -419,9 +882,13 @@ class YouTubeTrendsCLI:
         except Exception as e:
             print(f"❌ Unexpected error: {e}")
             logger.exception("Report command failed")
+        
+        return None
     
     async def pipeline_command(self, args) -> None:
         """Execute complete pipeline with iterative collection and analysis"""
+        from .agents.collector_agent import create_collector_agent
+        
         logger.info("🔄 Running iterative YouTube Shorts trend analysis pipeline...")
 
         MAX_COLLECTION_ATTEMPTS = 5  # 최대 수집 시도 횟수
@@ -430,138 +897,161 @@ class YouTubeTrendsCLI:
         # "사람들이 쉽게 따라할 수 있는 댄스 챌린지"를 위한 타겟 설정
         target_category = VideoCategory.CHALLENGE
         target_challenge_type = ChallengeType.DANCE
+        is_easy_to_follow = attrgetter('enhanced_analysis.accessibility_analysis.easy_to_follow')
         
         collected_video_ids = set()
         final_classified_videos = []
         
-        print("\n" + "="*50)
-        print("STEP 1 & 2: ITERATIVE DATA COLLECTION & AI CLASSIFICATION")
-        print("="*50)
+        _status("\n" + "="*50)
+        _status("STEP 1 & 2: ITERATIVE DATA COLLECTION & AI CLASSIFICATION")
+        _status("="*50)
 
         async with create_collector_agent() as collector:
-            analyzer = create_analyzer_agent() # AnalyzerAgent는 컨텍스트 매니저가 아님
+            analyzer = self._get_analyzer() # AnalyzerAgent는 컨텍스트 매니저가 아님
+            
+            # Reason: 수집(생산자)과 분류(소비자)를 겹쳐 실행해 N+1번째 수집이
+            # N번째 분류와 동시에 진행되도록 함. 큐 크기로 미리 수집하는 양을 제한.
+            batches: asyncio.Queue = asyncio.Queue(maxsize=2)
 
-            for attempt in range(MAX_COLLECTION_ATTEMPTS):
-                if self.shutdown_requested:
-                    logger.info("Shutdown requested, stopping pipeline.")
-                    break
+            async def produce_batches() -> None:
+                for attempt in range(MAX_COLLECTION_ATTEMPTS):
+                    if self.shutdown_requested:
+                        logger.info("Shutdown requested, stopping pipeline.")
+                        break
 
-                print(f"\n🚀 수집 및 분석 시도 {attempt + 1}/{MAX_COLLECTION_ATTEMPTS} (현재 {len(final_classified_videos)}/{args.top_n}개 확보)")
-                
-                # 1. 데이터 수집
-                print(f"📊 '댄스 챌린지' 관련 최신 영상 {VIDEOS_PER_ATTEMPT}개 수집 중 (지난 {args.days}일)...")
-                new_raw_videos = await self._handle_task_with_tracking(
-                    collector.collect_by_category_keywords(
+                    _status(f"\n🚀 수집 시도 {attempt + 1}/{MAX_COLLECTION_ATTEMPTS} (현재 {len(final_classified_videos)}/{args.top_n}개 확보)")
+                    
+                    # 1. 데이터 수집
+                    _status(f"📊 '댄스 챌린지' 관련 최신 영상 {VIDEOS_PER_ATTEMPT}개 수집 중 (지난 {args.days}일)...")
+                    new_raw_videos = await collector.collect_by_category_keywords(
                         categories=["dance challenge"], # 고정된 카테고리
                         max_results_per_category=VIDEOS_PER_ATTEMPT,
                         days=args.days,
                         top_n=VIDEOS_PER_ATTEMPT, # 수집 단계에서는 최대한 많이 가져와서 분석 단계에서 필터링
                         region_code=args.region
                     )
-                )
-                
-                # 이미 처리된 영상 제외
-                videos_to_analyze = []
-                for video in new_raw_videos:
-                    if video.video_id not in collected_video_ids:
-                        videos_to_analyze.append(video)
-                        collected_video_ids.add(video.video_id)
+                    
+                    # 이미 처리된 영상 제외 (수집 결과는 video_id 기준으로 이미 중복 제거됨)
+                    new_ids = {video.video_id for video in new_raw_videos} - collected_video_ids
+                    videos_to_analyze = [video for video in new_raw_videos if video.video_id in new_ids]
+                    collected_video_ids.update(new_ids)
+                    
+                    if not videos_to_analyze:
+                        _status("ℹ️ 새로운 수집 영상이 없습니다. 다음 시도로 넘어갑니다.")
+                        continue
+                    
+                    await batches.put(videos_to_analyze)
                 
-                if not videos_to_analyze:
-                    print("ℹ️ 새로운 수집 영상이 없습니다. 다음 시도로 넘어갑니다.")
-                    continue
+                # 수집 종료 신호
+                await batches.put(None)
 
-                print(f"🔍 새로운 영상 {len(videos_to_analyze)}개 AI 분류 및 비디오 콘텐츠 분석 중...")
-                
-                # 2. AI 분류 및 비디오 콘텐츠 분석
-                classified_batch = await self._handle_task_with_tracking(
-                    analyzer.classify_videos_with_enhanced_analysis(
-                        videos_to_analyze,
-                        include_video_content=args.include_video_content
+            async def consume_batches() -> None:
+                while (videos_to_analyze := await batches.get()) is not None:
+                    _status(f"🔍 새로운 영상 {len(videos_to_analyze)}개 AI 분류 및 비디오 콘텐츠 분석 중...")
+                    
+                    # 2. AI 분류 및 비디오 콘텐츠 분석
+                    # 텍스트 분류가 챌린지가 아닌 영상은 비디오 분석 단계를 건너뜀
+                    classified_batch = await self._classify_with_cache(
+                        analyzer, videos_to_analyze, args,
+                        video_content_categories={target_category}
                     )
-                )
-                
-                # 3. 조건에 맞는 영상 필터링 및 추가
-                for video in classified_batch:
-                    if len(final_classified_videos) >= args.top_n:
-                        break # 목표 개수 달성 시 중단
                     
-                    # '댄스 챌린지' 카테고리이면서, 비디오 분석이 수행되었고,
-                    # 챌린지 타입이 'DANCE'이며, 'easy_to_follow'가 True인 영상만 선택
-                    if (video.category == target_category and
-                        video.has_video_analysis and
-                        video.challenge_type_detailed == target_challenge_type and
-                        video.enhanced_analysis.accessibility_analysis.easy_to_follow):
+                    # 3. 조건에 맞는 영상 필터링 및 추가
+                    for video in classified_batch:
+                        if len(final_classified_videos) >= args.top_n:
+                            break # 목표 개수 달성 시 중단
                         
-                        final_classified_videos.append(video)
-                        print(f"✅ 조건에 맞는 영상 발견: {video.title} (현재 {len(final_classified_videos)}/{args.top_n}개)")
-                
-                if len(final_classified_videos) >= args.top_n:
-                    print(f"🎉 목표 개수 ({args.top_n}개) 달성! 수집 및 분석을 중단합니다.")
-                    break
-                else:
-                    print(f"➡️ 목표 개수 ({args.top_n}개) 미달. 다음 수집 시도를 진행합니다.")
+                        # '댄스 챌린지' 카테고리이면서, 비디오 분석이 수행되었고,
+                        # 챌린지 타입이 'DANCE'이며, 'easy_to_follow'가 True인 영상만 선택
+                        # (enum 멤버는 싱글턴이므로 is로 비교)
+                        if (video.category is target_category and
+                            video.challenge_type_detailed is target_challenge_type and
+                            video.has_video_analysis and
+                            is_easy_to_follow(video)):
+                            
+                            final_classified_videos.append(video)
+                            _status(f"✅ 조건에 맞는 영상 발견: {video.title} (현재 {len(final_classified_videos)}/{args.top_n}개)")
+                    
+                    if len(final_classified_videos) >= args.top_n:
+                        _status(f"🎉 목표 개수 ({args.top_n}개) 달성! 수집 및 분석을 중단합니다.")
+                        return
+                    
+                    _status(f"➡️ 목표 개수 ({args.top_n}개) 미달. 다음 수집 결과를 분석합니다.")
+
+            # 한쪽이 실패하면 TaskGroup이 다른 쪽도 취소함
+            try:
+                async with asyncio.TaskGroup() as task_group:
+                    producer = task_group.create_task(produce_batches())
+                    await consume_batches()
+                    # 목표 달성 시 남은 수집 중단
+                    producer.cancel()
+            except* Exception as eg:
+                # Reason: ExceptionGroup의 메시지 대신 실제 원인(할당량 초과, API 오류 등)을 표시
+                raise eg.exceptions[0] from eg
             
             if not final_classified_videos:
                 print("❌ 조건에 맞는 영상을 찾지 못했습니다. 파이프라인을 종료합니다.")
                 return
 
-            # 최종 분류된 영상 저장
+            # 최종 분류된 영상 저장 (리포트 단계는 메모리의 결과를 그대로 사용)
             classified_output_file = "classified_videos.json"
             self._save_classified_videos_to_file(final_classified_videos, classified_output_file)
-            print(f"✅ 최종 분류된 영상 {len(final_classified_videos)}개 저장 완료: {classified_output_file}")
+            _status(f"✅ 최종 분류된 영상 {len(final_classified_videos)}개 저장 완료: {classified_output_file}")
 
         # Step 3: Report
-        print("\n" + "="*50)
-        print("STEP 3: TREND REPORTING")
-        print("="*50)
+        _status("\n" + "="*50)
+        _status("STEP 3: TREND REPORTING")
+        _status("="*50)
         # Create args object for report command
-        report_args = argparse.Namespace(
+        report_args = ReportArgs(
             input="classified_videos.json",
             category=target_category.value, # 댄스 챌린지 카테고리로 리포트 생성
             output="trend_report.json",
             format="text"
         )
-        await self.report_command(report_args)
+        await self.report_command(report_args, classified_videos=final_classified_videos)
         
-        print("\n🎉 파이프라인 완료! 모든 분석 단계가 성공적으로 완료되었습니다.")
+        _status("\n🎉 파이프라인 완료! 모든 분석 단계가 성공적으로 완료되었습니다.")
     
     async def health_command(self, args) -> None:
         """Execute health check command"""
-        from .core.health import monitor_health
+        from .core.health import check_health, monitor_health
         
         if args.monitor:
-            print(f"🔍 Starting health monitoring (checking every {args.interval}s)")
-            print("Press Ctrl+C to stop monitoring")
+            _status(f"🔍 Starting health monitoring (checking every {args.interval}s)")
+            _status("Press Ctrl+C to stop monitoring")
             try:
                 await monitor_health(args.interval)
             except KeyboardInterrupt:
                 print("\n⏹️ Health monitoring stopped")
         else:
-            print("🔍 Running system health check...")
+            _status("🔍 Running system health check...")
             health_status = await check_health()
             
             if args.format == 'json':
-                print(json.dumps(health_status, indent=2))
+                _print_json(health_status)
             else:
                 self._display_health_status(health_status)
             
             # Exit with error code if unhealthy
             if health_status['status'] == 'unhealthy':
-                sys.exit(1)
+                raise _CommandExit(1)
     
     async def chat_command(self, args) -> None:
         """Execute natural language chat command"""
+        if args.interactive or args.query:
+            query_service = _get_query_service()
+        
         if args.interactive:
-            await self._interactive_chat_mode(args)
+            await self._interactive_chat_mode(args, query_service)
         elif args.query:
-            await self._process_single_query(args.query, args)
+            await self._process_single_query(args.query, args, query_service)
         else:
             print("❌ 자연어 쿼리를 입력하거나 --interactive 모드를 사용하세요.")
             print("💡 예시: python cli.py chat \"댄스 챌린지 TOP 10 찾아줘\"")
-            sys.exit(1)
+            raise _CommandExit(1)
     
-    async def _interactive_chat_mode(self, args) -> None:
+    async def _interactive_chat_mode(self, args, query_service) -> None:
         """Run interactive chat mode"""
         print("🤖 자연어 비디오 분석 채팅 모드")
         print("=" * 50)
@@ -573,12 +1063,30 @@ class YouTubeTrendsCLI:
         print("\n🔚 종료하려면 'quit', 'exit', '종료' 입력")
         print("-" * 50)
         
-        query_service = create_natural_query_service()
+        # readline이 있으면 input()에 줄 편집과 이전 질문 기록(↑)이 적용됨
+        try:
+            import readline
+        except ImportError:  # pragma: no cover - Windows without pyreadline3
+            readline = None
+        
+        if readline is not None:
+            readline.set_history_length(self.CHAT_HISTORY_LENGTH)
+            with contextlib.suppress(OSError):
+                readline.read_history_file(self.CHAT_HISTORY_FILE)
         
+        try:
+            await self._chat_loop(args, query_service)
+        finally:
+            if readline is not None:
+                with contextlib.suppress(OSError):
+                    readline.write_history_file(self.CHAT_HISTORY_FILE)
+    
+    async def _chat_loop(self, args, query_service) -> None:
+        """Read and answer questions until the user exits"""
         while True:
             try:
                 # Get user input
-                user_input = input("\n💭 질문: ").strip()
+                user_input = (await self._read_line("\n💭 질문: ")).strip()
                 
                 # Check for exit commands
                 if user_input.lower() in ['quit', 'exit', '종료', 'q']:
@@ -592,24 +1100,60 @@ class YouTubeTrendsCLI:
                 # Process query
                 await self._process_single_query(user_input, args, query_service)
                 
-            except KeyboardInterrupt:
+            except (EOFError, KeyboardInterrupt):
                 print("\n\n👋 채팅을 종료합니다.")
                 break
             except Exception as e:
                 print(f"❌ 오류가 발생했습니다: {e}")
                 logger.exception("Interactive chat error")
     
-    async def _process_single_query(self, query: str, args, query_service=None) -> None:
-        """Process a single natural language query"""
-        if query_service is None:
-            query_service = create_natural_query_service()
+    @staticmethod
+    async def _read_line(prompt: str) -> str:
+        """
+        Read one line from the terminal without blocking the event loop.
         
+        Args:
+            prompt: Prompt shown before the cursor
+            
+        Returns:
+            The line without its trailing newline
+            
+        Raises:
+            EOFError: When stdin is closed (Ctrl+D)
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        
+        def settle(line: Optional[str], error: Optional[BaseException]) -> None:
+            if future.done():
+                return
+            if error is not None:
+                future.set_exception(error)
+            else:
+                future.set_result(line)
+        
+        def read() -> None:
+            try:
+                line = input(prompt)
+            except BaseException as e:
+                loop.call_soon_threadsafe(settle, None, e)
+            else:
+                loop.call_soon_threadsafe(settle, line, None)
+        
+        # Reason: a blocking input() on the loop thread would hold off the SIGINT
+        # handler until Enter. A daemon thread (not the default executor) is used so
+        # an unanswered prompt never delays interpreter exit.
+        threading.Thread(target=read, name="chat-input", daemon=True).start()
+        return await future
+    
+    async def _process_single_query(self, query: str, args, query_service) -> None:
+        """Process a single natural language query"""
         try:
             if args.verbose:
-                print(f"🔍 쿼리 처리 중: '{query}'")
+                _status(f"🔍 쿼리 처리 중: '{query}'")
             
             # Show progress indicator
-            print("⏳ 자연어 분석 및 비디오 검색 중...")
+            _status("⏳ 자연어 분석 및 비디오 검색 중...")
             
             # Process the query
             response = await query_service.process_query(query)
@@ -629,7 +1173,7 @@ class YouTubeTrendsCLI:
             # Save results if requested
             if args.save_results:
                 await self._save_query_results(response, args.save_results, args.output_format)
-                print(f"💾 결과가 저장되었습니다: {args.save_results}")
+                _status(f"💾 결과가 저장되었습니다: {args.save_results}")
             
         except Exception as e:
             print(f"❌ 쿼리 처리 중 오류 발생: {e}")
@@ -642,67 +1186,90 @@ class YouTubeTrendsCLI:
             "success": response.success,
             "total_found": response.total_found,
             "processing_time": response.processing_time,
-            "results": []
+            "results": [
+                self._result_row(rank, video, include_analysis=True)
+                for rank, video in enumerate(response.results, 1)
+            ]
         }
         
-        for video in response.results:
-            video_data = {
-                "rank": len(result_data["results"]) + 1,
-                "video_id": video.video_id,
-                "title": video.title,
-                "channel": video.channel_title,
-                "view_count": video.view_count,
-                "confidence": video.confidence,
-                "youtube_url": f"https://www.youtube.com/watch?v={video.video_id}",
-                "published_at": video.published_at.isoformat()
-            }
-            
-            if video.has_video_analysis:
-                video_data["analysis"] = {
-                    "difficulty": video.enhanced_analysis.accessibility_analysis.difficulty_level.value,
-                    "safety": video.enhanced_analysis.accessibility_analysis.safety_level.value,
-                    "music_genre": video.enhanced_analysis.music_analysis.genre,
-                    "easy_to_follow": video.enhanced_analysis.accessibility_analysis.easy_to_follow
-                }
-            
-            result_data["results"].append(video_data)
+        _print_json(result_data)
+    
+    @classmethod
+    def _result_row(cls, rank: int, video, include_analysis: bool = False) -> Dict[str, Any]:
+        """
+        Build the JSON row for one query result.
         
-        print(json.dumps(result_data, ensure_ascii=False, indent=2))
+        Args:
+            rank: 1-based position in the results
+            video: Result video
+            include_analysis: Add the content analysis summary when available
+            
+        Returns:
+            Row dictionary (plus "analysis" when requested and available)
+        """
+        row = {
+            "rank": rank,
+            "video_id": video.video_id,
+            "title": video.title,
+            "channel": video.channel_title,
+            "view_count": video.view_count,
+            "confidence": video.confidence,
+            "youtube_url": f"https://www.youtube.com/watch?v={video.video_id}",
+            "published_at": video.published_at
+        }
+        if include_analysis and video.has_video_analysis:
+            row["analysis"] = cls._analysis_summary(video)
+        return row
+    
+    @staticmethod
+    def _analysis_summary(video) -> Dict[str, Any]:
+        """Condense a video's content analysis for JSON output"""
+        analysis = video.enhanced_analysis
+        return {
+            "difficulty": analysis.accessibility_analysis.difficulty_level.value,
+            "safety": analysis.accessibility_analysis.safety_level.value,
+            "music_genre": analysis.music_analysis.genre,
+            "easy_to_follow": analysis.accessibility_analysis.easy_to_follow
+        }
     
     async def _display_text_results(self, response, args) -> None:
         """Display results in simple text format"""
-        print("\n" + "="*60)
-        print("🎯 자연어 쿼리 결과")
-        print("="*60)
+        out: List[str] = []
+        out.append("\n" + "="*60)
+        out.append("🎯 자연어 쿼리 결과")
+        out.append("="*60)
         
         if response.parsed_request:
-            print(f"📝 원본 질문: {response.parsed_request.original_input}")
-            print(f"🔍 분석된 액션: {response.parsed_request.action_type.value}")
-            print(f"📊 요청 개수: {response.parsed_request.quantity_filter.count}개")
+            out.append(f"📝 원본 질문: {response.parsed_request.original_input}")
+            out.append(f"🔍 분석된 액션: {response.parsed_request.action_type.value}")
+            out.append(f"📊 요청 개수: {response.parsed_request.quantity_filter.count}개")
         
-        print(f"✅ 찾은 결과: {response.total_found}개")
-        print(f"⏱️ 처리 시간: {response.processing_time:.2f}초")
+        out.append(f"✅ 찾은 결과: {response.total_found}개")
+        out.append(f"⏱️ 처리 시간: {response.processing_time:.2f}초")
         
         if response.summary:
-            print(f"\n📋 요약:")
-            print(response.summary)
+            out.append(f"\n📋 요약:")
+            out.append(response.summary)
         
-        print(f"\n🏆 상위 결과:")
-        print("-" * 60)
+        out.append(f"\n🏆 상위 결과:")
+        out.append("-" * 60)
         
         for i, video in enumerate(response.results[:5], 1):  # Show top 5 in text mode
-            print(f"{i}. {video.title}")
-            print(f"   📺 채널: {video.channel_title}")
-            print(f"   👀 조회수: {video.view_count:,}회")
-            print(f"   🎯 신뢰도: {video.confidence:.2f}")
-            print(f"   🔗 https://www.youtube.com/watch?v={video.video_id}")
+            out.append(f"{i}. {video.title}")
+            out.append(f"   📺 채널: {video.channel_title}")
+            out.append(f"   👀 조회수: {video.view_count:,}회")
+            out.append(f"   🎯 신뢰도: {video.confidence:.2f}")
+            out.append(f"   🔗 https://www.youtube.com/watch?v={video.video_id}")
             
             if video.has_video_analysis:
                 analysis = video.enhanced_analysis
-                print(f"   ⭐ 난이도: {analysis.accessibility_analysis.difficulty_level.value}")
-                print(f"   🎵 음악: {analysis.music_analysis.genre or 'Unknown'}")
+                out.append(f"   ⭐ 난이도: {analysis.accessibility_analysis.difficulty_level.value}")
+                out.append(f"   🎵 음악: {analysis.music_analysis.genre or 'Unknown'}")
             
-            print()
+            out.append("")
+        
+        # Reason: one write for the whole listing instead of a print per line
+        sys.stdout.write("\n".join(out) + "\n")
     
     async def _display_markdown_results(self, response, args) -> None:
         """Display results in markdown format"""
@@ -729,31 +1296,25 @@ class YouTubeTrendsCLI:
     async def _save_query_results(self, response, filename: str, format_type: str) -> None:
         """Save query results to file"""
         try:
-            with open(filename, 'w', encoding='utf-8') as f:
-                if format_type == 'json':
-                    result_data = {
-                        "query": response.parsed_request.original_input if response.parsed_request else "",
-                        "success": response.success,
-                        "total_found": response.total_found,
-                        "processing_time": response.processing_time,
-                        "timestamp": datetime.now().isoformat(),
-                        "results": [
-                            {
-                                "rank": i + 1,
-                                "video_id": video.video_id,
-                                "title": video.title,
-                                "channel": video.channel_title,
-                                "view_count": video.view_count,
-                                "confidence": video.confidence,
-                                "youtube_url": f"https://www.youtube.com/watch?v={video.video_id}",
-                                "published_at": video.published_at.isoformat()
-                            }
-                            for i, video in enumerate(response.results)
-                        ]
-                    }
-                    json.dump(result_data, f, ensure_ascii=False, indent=2)
-                else:  # markdown or text
-                    f.write(response.detailed_report)
+            if format_type == 'json':
+                result_data = {
+                    "query": response.parsed_request.original_input if response.parsed_request else "",
+                    "success": response.success,
+                    "total_found": response.total_found,
+                    "processing_time": response.processing_time,
+                    "timestamp": datetime.now(),
+                    "results": [
+                        self._result_row(rank, video)
+                        for rank, video in enumerate(response.results, 1)
+                    ]
+                }
+                payload = _dump_json(result_data)
+            else:  # markdown or text
+                payload = response.detailed_report.encode('utf-8')
+            
+            # Reason: one binary write instead of chunked text-mode encoding
+            with open(filename, 'wb') as f:
+                f.write(payload)
                     
         except Exception as e:
             logger.error(f"Failed to save results: {e}")
@@ -761,204 +1322,215 @@ class YouTubeTrendsCLI:
     
     def _display_health_status(self, health_status: Dict) -> None:
         """Display health status in human-readable format"""
-        status = health_status['status']
-        
-        # Status indicator
-        if status == 'healthy':
-            print("✅ System Status: HEALTHY")
-        elif status == 'degraded':
-            print("⚠️  System Status: DEGRADED")
-        else:
-            print("❌ System Status: UNHEALTHY")
-        
-        print(f"📅 Check Time: {health_status['timestamp']}")
-        
-        # Summary
         summary = health_status['summary']
-        print(f"\n📊 Check Summary:")
-        print(f"   • Total checks: {summary['total_checks']}")
-        print(f"   • Healthy: {summary['healthy']}")
-        print(f"   • Degraded: {summary['degraded']}")
-        print(f"   • Unhealthy: {summary['unhealthy']}")
-        
-        # Individual checks
-        print(f"\n🔍 Individual Checks:")
+        out: List[str] = [
+            # Status indicator
+            self._SYSTEM_STATUS_LINES.get(health_status['status'], "❌ System Status: UNHEALTHY"),
+            f"📅 Check Time: {health_status['timestamp']}",
+            # Summary
+            "\n📊 Check Summary:",
+            f"   • Total checks: {summary['total_checks']}",
+            f"   • Healthy: {summary['healthy']}",
+            f"   • Degraded: {summary['degraded']}",
+            f"   • Unhealthy: {summary['unhealthy']}",
+            # Individual checks
+            "\n🔍 Individual Checks:"
+        ]
         for check in health_status['checks']:
-            status_icon = {
-                'healthy': '✅',
-                'degraded': '⚠️ ',
-                'unhealthy': '❌'
-            }.get(check['status'], '❓')
+            # Reason: checks carry HealthStatus members, the overall status a plain string
+            status_icon = self._STATUS_ICONS.get(getattr(check['status'], 'value', check['status']), '❓')
             
-            print(f"   {status_icon} {check['name']}: {check['message']}")
+            out.append(f"   {status_icon} {check['name']}: {check['message']}")
             if check.get('response_time'):
-                print(f"      Response time: {check['response_time']:.2f}s")
+                out.append(f"      Response time: {check['response_time']:.2f}s")
+        
+        sys.stdout.write("\n".join(out) + "\n")
     
     def _save_videos_to_file(self, videos, filename: str) -> None:
         """Save videos to JSON file"""
-        data = {
-            "timestamp": datetime.now().isoformat(),
-            "total_videos": len(videos),
-            "videos": [video.model_dump() for video in videos]
-        }
-        
-        with open(filename, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False, default=str)
+        _write_rows_file(filename, 'videos', _RAW_ADAPTER, videos)
     
     def _load_videos_from_file(self, filename: str):
         """Load videos from JSON file"""
-        from .models.video_models import YouTubeVideoRaw
-        
-        with open(filename, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-        
-        videos = []
-        for video_data in data.get('videos', []):
-            try:
-                video = YouTubeVideoRaw(**video_data)
-                videos.append(video)
-            except Exception as e:
-                logger.warning(f"Failed to parse video data: {e}")
-                continue
-        
-        return videos
+        return _load_rows(filename, 'videos', _RAW_ADAPTER, "video")
     
     def _save_classified_videos_to_file(self, videos, filename: str) -> None:
         """Save classified videos to JSON file"""
-        data = {
-            "timestamp": datetime.now().isoformat(),
-            "total_videos": len(videos),
-            "classified_videos": [video.model_dump() for video in videos]
-        }
-        
-        with open(filename, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False, default=str)
+        _write_rows_file(filename, 'classified_videos', _CLASSIFIED_ADAPTER, videos)
     
     def _load_classified_videos_from_file(self, filename: str):
         """Load classified videos from JSON file"""
-        from .models.video_models import ClassifiedVideo
-        
-        with open(filename, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-        
-        videos = []
-        for video_data in data.get('classified_videos', []):
-            try:
-                video = ClassifiedVideo(**video_data)
-                videos.append(video)
-            except Exception as e:
-                logger.warning(f"Failed to parse classified video data: {e}")
-                continue
-        
-        return videos
+        return _load_rows(filename, 'classified_videos', _CLASSIFIED_ADAPTER, "classified video")
     
     def _save_report_to_file(self, report, filename: str) -> None:
         """Save trend report to JSON file"""
-        with open(filename, 'w', encoding='utf-8') as f:
-            json.dump(report.model_dump(), f, indent=2, ensure_ascii=False, default=str)
+        _write_json_file(report.model_dump(mode="json"), filename)
     
     def _save_comprehensive_analysis_to_file(self, analysis, filename: str) -> None:
         """Save comprehensive analysis to JSON file"""
-        with open(filename, 'w', encoding='utf-8') as f:
-            json.dump(analysis.model_dump(), f, indent=2, ensure_ascii=False, default=str)
+        _write_json_file(analysis.model_dump(mode="json"), filename)
     
     def _display_trend_report(self, report) -> None:
         """Display trend report in readable format"""
-        print(f"\n📈 TREND REPORT: {report.category.value.upper()}")
-        print("="*60)
+        out: List[str] = []
+        out.append(f"\n📈 TREND REPORT: {report.category.value.upper()}")
+        out.append("="*60)
         
-        print("\n📋 Summary:")
-        print(f"   {report.trend_summary}")
+        out.append("\n📋 Summary:")
+        out.append(f"   {report.trend_summary}")
         
-        print("\n🔥 Key Insights:")
+        out.append("\n🔥 Key Insights:")
         for insight in report.key_insights:
-            print(f"   • {insight}")
+            out.append(f"   • {insight}")
         
-        print("\n💡 Recommended Actions:")
+        out.append("\n💡 Recommended Actions:")
         for action in report.recommended_actions:
-            print(f"   • {action}")
+            out.append(f"   • {action}")
         
         if report.top_videos:
-            print("\n🏆 Top Performing Videos:")
+            out.append("\n🏆 Top Performing Videos:")
             for i, video in enumerate(report.top_videos[:3], 1):
                 views_text = f" ({video.view_count:,} views)" if video.view_count else ""
-                print(f"   {i}. {video.title}{views_text}")
-                print(f"      Confidence: {video.confidence:.1%}")
+                out.append(f"   {i}. {video.title}{views_text}")
+                out.append(f"      Confidence: {video.confidence:.1%}")
         
-        print("\n📊 Analysis Details:")
-        print(f"   • Videos analyzed: {report.total_videos_analyzed}")
-        print(f"   • Analysis period: {report.analysis_period}")
-        print(f"   • Generated: {report.generated_at.strftime('%Y-%m-%d %H:%M:%S')}")
+        out.append("\n📊 Analysis Details:")
+        out.append(f"   • Videos analyzed: {report.total_videos_analyzed}")
+        out.append(f"   • Analysis period: {report.analysis_period}")
+        out.append(f"   • Generated: {_format_timestamp(report.generated_at)}")
+        
+        sys.stdout.write("\n".join(out) + "\n")
     
     def _display_comprehensive_analysis(self, analysis) -> None:
         """Display comprehensive analysis in readable format"""
-        print("\n📊 COMPREHENSIVE TREND ANALYSIS")
-        print("="*60)
+        out: List[str] = []
+        out.append("\n📊 COMPREHENSIVE TREND ANALYSIS")
+        out.append("="*60)
         
-        print("\n🎯 Overview:")
-        print(f"   • Total videos analyzed: {analysis.total_videos_analyzed}")
-        print(f"   • Analysis period: {analysis.analysis_period}")
-        print(f"   • Dominant category: {analysis.dominant_category.value}")
+        out.append("\n🎯 Overview:")
+        out.append(f"   • Total videos analyzed: {analysis.total_videos_analyzed}")
+        out.append(f"   • Analysis period: {analysis.analysis_period}")
+        out.append(f"   • Dominant category: {analysis.dominant_category.value}")
         
-        print("\n📈 Category Breakdown:")
+        out.append("\n📈 Category Breakdown:")
+        total_videos = analysis.total_videos_analyzed or 1
         for insights in analysis.category_insights:
-            percentage = (insights.video_count / analysis.total_videos_analyzed) * 100
-            print(f"   • {insights.category.value}: {insights.video_count} videos ({percentage:.1f}%)")
-            print(f"     Average confidence: {insights.average_confidence:.1%}")
+            percentage = insights.video_count * 100 / total_videos
+            out.append(f"   • {insights.category.value}: {insights.video_count} videos ({percentage:.1f}%)")
+            out.append(f"     Average confidence: {insights.average_confidence:.1%}")
             if insights.common_keywords:
-                print(f"     Keywords: {', '.join(insights.common_keywords[:3])}")
+                out.append(f"     Keywords: {', '.join(insights.common_keywords[:3])}")
         
-        print("\n🚀 Emerging Trends:")
+        out.append("\n🚀 Emerging Trends:")
         for trend in analysis.emerging_trends:
-            print(f"   • {trend}")
+            out.append(f"   • {trend}")
         
-        print("\n💡 Content Strategy Recommendations:")
+        out.append("\n💡 Content Strategy Recommendations:")
         for strategy in analysis.recommended_content_strategy:
-            print(f"   • {strategy}")
+            out.append(f"   • {strategy}")
+        
+        out.append("\n🔧 Analysis Info:")
+        out.append(f"   • Model version: {analysis.model_version}")
+        out.append(f"   • Generated: {_format_timestamp(analysis.analyzed_at)}")
         
-        print("\n🔧 Analysis Info:")
-        print(f"   • Model version: {analysis.model_version}")
-        print(f"   • Generated: {analysis.analyzed_at.strftime('%Y-%m-%d %H:%M:%S')}")
+        sys.stdout.write("\n".join(out) + "\n")
     
     def _show_progress(self, task: str, current: int, total: int) -> None:
-        """Show progress indicator"""
+        """
+        Show progress indicator.
+        
+        Redraws are throttled to every PROGRESS_MIN_STEP of the total or
+        PROGRESS_MIN_INTERVAL seconds; the first and final states are always drawn.
+        """
+        now = time.monotonic()
+        last_current, last_time = self._progress_last
+        if 0 < current < total:
+            step = max(1, int(total * self.PROGRESS_MIN_STEP))
+            if current - last_current < step and now - last_time < self.PROGRESS_MIN_INTERVAL:
+                return
+        self._progress_last = (current, now)
+        
         percentage = (current / total) * 100 if total > 0 else 0
-        bar_length = 30
-        filled_length = int(bar_length * current // total) if total > 0 else 0
-        bar = '█' * filled_length + '-' * (bar_length - filled_length)
-        print(f'\r{task}: |{bar}| {percentage:.1f}% ({current}/{total})', end='', flush=True)
+        filled_length = min(_PROGRESS_BAR_LENGTH * current // total, _PROGRESS_BAR_LENGTH) if total > 0 else 0
+        bar = _PROGRESS_BARS[filled_length]
+        _status(f'\r{task}: |{bar}| {percentage:.1f}% ({current}/{total})', end='', flush=True)
 
 
-async def main():
-    """Main CLI entry point"""
-    cli = YouTubeTrendsCLI()
-    parser = cli.create_parser()
-    args = parser.parse_args()
+# Subcommand name -> YouTubeTrendsCLI handler, looked up once per invocation
+COMMANDS = {
+    'collect': YouTubeTrendsCLI.collect_command,
+    'analyze': YouTubeTrendsCLI.analyze_command,
+    'report': YouTubeTrendsCLI.report_command,
+    'pipeline': YouTubeTrendsCLI.pipeline_command,
+    'health': YouTubeTrendsCLI.health_command,
+    'chat': YouTubeTrendsCLI.chat_command,
+}
+
+
+async def main(argv: Optional[List[str]] = None):
+    """
+    Main CLI entry point.
+    
+    Args:
+        argv: Command-line arguments (defaults to sys.argv[1:])
+    """
+    # Reason: parse before constructing the CLI so --help and usage errors exit
+    # without loading settings or installing signal handlers.
+    parser = _build_parser()
+    args = parser.parse_args(argv)
     
     if not args.command:
         parser.print_help()
         return
     
+    # Reason: status lines would corrupt JSON written to stdout
+    json_to_stdout = (
+        (args.command == 'health' and args.format == 'json') or
+        (args.command == 'chat' and args.output_format == 'json')
+    )
+    if args.quiet or json_to_stdout:
+        _set_quiet(True)
+    
+    cli = YouTubeTrendsCLI()
+    cli._setup_signal_handlers()
+    
+    exit_code = 0
     try:
-        if args.command == 'collect':
-            await cli.collect_command(args)
-        elif args.command == 'analyze':
-            await cli.analyze_command(args)
-        elif args.command == 'report':
-            await cli.report_command(args)
-        elif args.command == 'pipeline':
-            await cli.pipeline_command(args)
-        elif args.command == 'health':
-            await cli.health_command(args)
-        elif args.command == 'chat':
-            await cli.chat_command(args)
-    except KeyboardInterrupt:
+        await cli._handle_task_with_tracking(COMMANDS[args.command](cli, args))
+    except _CommandExit as e:
+        exit_code = e.code
+    except (KeyboardInterrupt, asyncio.CancelledError):
         print("\n⚠️  Operation cancelled by user")
     except Exception as e:
         print(f"\n❌ Fatal error: {e}")
         logger.exception("CLI command failed")
         sys.exit(1)
+    finally:
+        # Flush queued log records before the process exits
+        shutdown_logging()
+    
+    if exit_code:
+        sys.exit(exit_code)
+
+
+def run() -> None:
+    """
+    Run the CLI on the fastest available event loop.
+    
+    uvloop (installed with uvicorn[standard]) is used when present; it is not
+    available on Windows, where the default asyncio loop is kept.
+    """
+    if sys.platform != 'win32':
+        try:
+            import uvloop
+        except ImportError:
+            pass
+        else:
+            uvloop.run(main())
+            return
+    
+    asyncio.run(main())
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    run()
\ No newline at end of file
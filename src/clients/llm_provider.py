@@ -2,14 +2,24 @@
 
 import logging
 import asyncio
+import hashlib
+import re
 from datetime import datetime
 from typing import Optional, Dict, List, Any
-from pydantic import BaseModel
+from cachetools import LRUCache
+from pydantic import BaseModel, Field, ValidationError
 from pydantic_ai import Agent, RunContext
 import google.generativeai as genai
+from google.api_core import exceptions as google_exceptions
+
+try:
+    import redis.asyncio as redis
+except ImportError:  # pragma: no cover - results are then only cached in-process
+    redis = None
 
 from ..core.settings import get_settings
 from ..core.exceptions import LLMProviderError, ClassificationError
+from ..core.rate_limiter import AsyncTokenBucket, backoff_delay, get_status_code
 from ..models.video_models import VideoCategory, YouTubeVideoRaw
 from ..models.classification_models import ClassificationResponse
 
@@ -17,6 +27,199 @@ from ..models.classification_models import ClassificationResponse
 logger = logging.getLogger(__name__)
 
 
+# System prompt for the classification agent (fixed, so built once at import)
+_CLASSIFICATION_SYSTEM_PROMPT = """You are an expert YouTube Shorts content classifier. Analyze video metadata to categorize content accurately.
+
+CLASSIFICATION CATEGORIES:
+1. Challenge - Dance challenges, fitness challenges, viral challenges, trending activities
+2. Info/Advice - Educational content, tutorials, tips, how-to videos, informational content
+3. Trending Sounds/BGM - Music-focused content, sound trends, audio-centric videos, song covers
+
+ANALYSIS GUIDELINES:
+- Focus on title keywords and description content
+- Consider channel type and content style
+- Look for challenge-related terms (challenge, dance, workout, viral)
+- Identify educational markers (how to, tutorial, tips, learn, guide)
+- Spot music/audio focus (song, music, sound, beat, audio, cover)
+
+OUTPUT REQUIREMENTS:
+- Provide confidence score (0.0-1.0) based on certainty
+- Include clear reasoning for classification decision
+- Extract key classification keywords from title/description
+- Be decisive but honest about uncertainty
+
+QUALITY STANDARDS:
+- Confidence > 0.8 for clear categorizations
+- Confidence 0.6-0.8 for probable categorizations  
+- Confidence < 0.6 for uncertain cases (mark as best guess)"""
+
+
+# Number of classify_video results kept per provider instance
+RESULT_CACHE_SIZE = 4096
+
+# Limits for one batch request: video count and estimated prompt tokens
+MAX_BATCH_SIZE = 50
+MAX_BATCH_PROMPT_TOKENS = 8000
+# Characters a batch prompt adds per video besides its text ("VIDEO n:", labels)
+_BATCH_ENTRY_OVERHEAD_CHARS = 40
+
+# Per-video classification input (title, channel, description)
+_CLASSIFICATION_INPUT_TEMPLATE = """Classify this YouTube Short:
+
+Title: %s
+Channel: %s
+Description: %s
+
+Analyze the content and classify into one of the three categories: Challenge, Info/Advice, or Trending Sounds/BGM."""
+
+# Changes whenever the classification prompts do, so cached results from an
+# older prompt are not reused
+PROMPT_VERSION = hashlib.blake2b(
+    (_CLASSIFICATION_SYSTEM_PROMPT + _CLASSIFICATION_INPUT_TEMPLATE).encode(), digest_size=8
+).hexdigest()
+
+# Response format instructions appended after the videos in a batch prompt
+_BATCH_PROMPT_INSTRUCTIONS = """For each video, respond with a JSON object where keys are 'video_1', 'video_2', etc., and values are JSON objects with the following structure:
+{
+  "category": "<Category>",
+  "confidence": <0.0-1.0>,
+  "reasoning": "<Reasoning for classification>"
+}
+
+Categories must be exactly one of: Challenge, Info/Advice, Trending Sounds/BGM
+Confidence must be between 0.0 and 1.0
+Provide clear reasoning for each classification.
+
+YOUR RESPONSE MUST BE A VALID JSON OBJECT, CONTAINING ONLY THE JSON. DO NOT INCLUDE ANY OTHER TEXT OR MARKDOWN OUTSIDE THE JSON BLOCK."""
+
+# Gemini video analysis prompts by analysis type
+_COMPREHENSIVE_VIDEO_PROMPT = """
+        Analyze this YouTube Shorts video and provide detailed information about:
+
+        1. **Music/Sound Analysis:**
+           - Background music genre or style
+           - Any viral sounds or specific tracks mentioned
+           - Audio elements (voice, effects, music)
+
+        2. **Challenge Type Classification:**
+           - Specific challenge category (dance, food, game, fitness, creative, etc.)
+           - Challenge mechanics and rules
+           - Target audience
+
+        3. **Accessibility & Difficulty:**
+           - Difficulty level (Easy/Medium/Hard)
+           - Required tools, materials, or space
+           - Can average person easily follow along?
+           - Safety considerations
+
+        4. **Content Details:**
+           - Number of participants
+           - Setting/environment
+           - Key visual elements
+           - Estimated duration to complete
+
+        5. **Trend Analysis:**
+           - Viral potential assessment
+           - Cultural relevance
+           - Appeal factors
+
+        Please provide a clear, structured response focusing on practical information.
+        """
+
+_CHALLENGE_VIDEO_PROMPT = """
+        Analyze this YouTube Shorts video focusing on challenge aspects:
+
+        1. **Challenge Type**: What kind of challenge is this? (dance, food, game, fitness, creative, etc.)
+        2. **Difficulty**: How hard would this be for a regular person to recreate? (Easy/Medium/Hard)
+        3. **Requirements**: What tools, materials, space, or skills are needed?
+        4. **Music/Sound**: What audio elements are present? Any specific tracks or viral sounds?
+        5. **Accessibility**: Can most people easily follow along at home?
+        6. **Safety**: Are there any safety concerns or considerations?
+
+        Keep the response concise and practical for someone wanting to try this challenge.
+        """
+
+_QUICK_VIDEO_PROMPT = """
+        Briefly analyze this YouTube Shorts video and answer:
+        1. What type of content/challenge is this?
+        2. What music or sounds do you hear?
+        3. How difficult would this be for someone to recreate?
+        4. What would someone need to try this themselves?
+
+        Keep the response short and practical.
+        """
+
+
+# Category label in LLM output -> VideoCategory
+_CATEGORY_MAP: Dict[str, VideoCategory] = {category.value: category for category in VideoCategory}
+
+# Keywords per category; analyze_keywords reports them in this order
+_CATEGORY_KEYWORDS = {
+    VideoCategory.CHALLENGE: (
+        "challenge", "dance", "workout", "fitness", "viral", "trending",
+        "try", "attempt", "competition", "game", "test"
+    ),
+    VideoCategory.INFO_ADVICE: (
+        "how", "tutorial", "guide", "tips", "learn", "teach", "explain",
+        "advice", "help", "review", "fact", "truth", "secret"
+    ),
+    VideoCategory.TRENDING_SOUNDS: (
+        "music", "song", "sound", "audio", "beat", "remix", "cover",
+        "singing", "rap", "melody", "rhythm", "track", "bgm"
+    )
+}
+_CLASSIFICATION_KEYWORDS = tuple(
+    keyword for keywords in _CATEGORY_KEYWORDS.values() for keyword in keywords
+)
+_KEYWORD_ORDER = {keyword: index for index, keyword in enumerate(_CLASSIFICATION_KEYWORDS)}
+# Reason: the lookahead reports matches at every position, so keywords inside
+# other words or overlapping each other are found just like a substring test
+_KEYWORD_PATTERN = re.compile(
+    "(?=(" + "|".join(map(re.escape, _CLASSIFICATION_KEYWORDS)) + "))"
+)
+
+# Whole-word patterns for the keyword prefilter; unlike analyze_keywords it
+# must not count 'how' in 'show' or 'rap' in 'trap' as evidence
+_CATEGORY_PATTERNS = {
+    category: re.compile(r"\b(" + "|".join(map(re.escape, keywords)) + r")\b")
+    for category, keywords in _CATEGORY_KEYWORDS.items()
+}
+# A category wins outright with at least this many distinct keywords, and
+# at least this many more than any other category
+PREFILTER_MIN_MATCHES = 2
+PREFILTER_MIN_LEAD = 2
+PREFILTER_CONFIDENCE = 0.85
+
+
+# Transient provider failures worth retrying: rate limiting and unavailability
+_RETRYABLE_STATUS_CODES = frozenset({429, 503, 504})
+_RETRYABLE_GOOGLE_ERRORS = (
+    google_exceptions.ServiceUnavailable,
+    google_exceptions.ResourceExhausted,
+    google_exceptions.DeadlineExceeded
+)
+# Fallback for errors that reach us without an HTTP status attached
+_RETRYABLE_MESSAGE_MARKERS = ("503", "Service Unavailable", "429", "Rate Limit")
+
+
+def _truncate(text: str, limit: int) -> str:
+    """Cut text to `limit` characters, appending an ellipsis when it is cut"""
+    return text if len(text) <= limit else text[:limit] + "..."
+
+
+def _is_retryable_error(error: Exception) -> bool:
+    """Whether a failed LLM call should be retried after a backoff"""
+    if isinstance(error, _RETRYABLE_GOOGLE_ERRORS):
+        return True
+    
+    status_code = get_status_code(error)
+    if status_code is not None:
+        return status_code in _RETRYABLE_STATUS_CODES
+    
+    message = str(error)
+    return any(marker in message for marker in _RETRYABLE_MESSAGE_MARKERS)
+
+
 class ClassificationDependencies(BaseModel):
     """Dependencies for classification agent"""
     video: YouTubeVideoRaw
@@ -26,33 +229,26 @@ class ClassificationDependencies(BaseModel):
         arbitrary_types_allowed = True
 
 
+# Reason: batch responses carry one entry per video ('video_1', 'video_2', ...)
+# and single-video responses carry category/confidence/reasoning directly, so
+# every key is accepted as an extra field instead of declaring video_1..N
 class ClassificationResult(BaseModel):
     """Structured output for video classification"""
-    video_1: Optional[Dict[str, Any]] = None
-    video_2: Optional[Dict[str, Any]] = None
-    video_3: Optional[Dict[str, Any]] = None
-    video_4: Optional[Dict[str, Any]] = None
-    video_5: Optional[Dict[str, Any]] = None
-    video_6: Optional[Dict[str, Any]] = None
-    video_7: Optional[Dict[str, Any]] = None
-    video_8: Optional[Dict[str, Any]] = None
-    video_9: Optional[Dict[str, Any]] = None
-    video_10: Optional[Dict[str, Any]] = None
-    video_11: Optional[Dict[str, Any]] = None
-    video_12: Optional[Dict[str, Any]] = None
-    video_13: Optional[Dict[str, Any]] = None
-    video_14: Optional[Dict[str, Any]] = None
-    video_15: Optional[Dict[str, Any]] = None
-    video_16: Optional[Dict[str, Any]] = None
-    video_17: Optional[Dict[str, Any]] = None
-    video_18: Optional[Dict[str, Any]] = None
-    video_19: Optional[Dict[str, Any]] = None
-    video_20: Optional[Dict[str, Any]] = None
 
     class Config:
         extra = "allow" # Allow extra fields for flexibility
 
 
+class _BatchVideoResult(BaseModel):
+    """Shape of one video_N entry in a batch classification result"""
+    
+    # Reason: unknown categories are mapped to Challenge by the parser rather than
+    # rejected, so only confidence and reasoning are type-checked here
+    category: Any = "Challenge"
+    confidence: float = Field(default=0.5, ge=0.0, le=1.0)
+    reasoning: str = "Batch classification"
+
+
 class LLMProvider:
     """
     LLM Provider for video classification and analysis.
@@ -68,6 +264,25 @@ class LLMProvider:
         self.model_name = self.settings.llm_model
         self.api_key = self.settings.llm_api_key
         
+        # Fixed for the provider's lifetime, so resolved once
+        self.model_string = self._resolve_model_string()
+        self.model_used = f"{self.provider_name}/{self.model_name}"
+        
+        # Successful single-video classifications, keyed by "video_id:model"
+        self._result_cache: LRUCache = LRUCache(maxsize=RESULT_CACHE_SIZE)
+        
+        # Results shared across processes and runs, only when Redis is configured
+        self._redis = None
+        if redis is not None and self.settings.enable_cache and self.settings.redis_url:
+            self._redis = redis.from_url(self.settings.redis_url)
+        
+        # Paces requests below the provider's rate limit instead of waiting for 429s;
+        # a burst of up to llm_max_concurrency requests is allowed
+        self.rate_limiter = AsyncTokenBucket(
+            rate=self.settings.llm_requests_per_minute / 60,
+            capacity=self.settings.llm_max_concurrency
+        )
+        
         # Initialize provider-specific clients
         self._setup_provider()
         
@@ -89,50 +304,28 @@ class LLMProvider:
             # Anthropic setup would go here
             self.video_analysis_model = None
     
-    def _create_classification_agent(self) -> Agent:
-        """Create classification agent with provider-specific model"""
+    def _resolve_model_string(self) -> str:
+        """Get the pydantic-ai model string for the configured provider"""
         if self.provider_name == "google-generativeai":
-            model_string = self.model_name  # Use model name directly
+            return self.model_name  # Use model name directly
         elif self.provider_name == "openai":
-            model_string = f"openai:{self.model_name}"
+            return f"openai:{self.model_name}"
         elif self.provider_name == "anthropic":
-            model_string = f"anthropic:{self.model_name}"
-        else:
-            raise LLMProviderError(f"Unsupported provider: {self.provider_name}")
-        
+            return f"anthropic:{self.model_name}"
+        raise LLMProviderError(f"Unsupported provider: {self.provider_name}")
+    
+    def _create_classification_agent(self) -> Agent:
+        """Create classification agent with provider-specific model"""
         return Agent(
-            model_string,
+            self.model_string,
             deps_type=ClassificationDependencies,
             result_type=ClassificationResult,
-            system_prompt=self._get_classification_prompt()
+            system_prompt=_CLASSIFICATION_SYSTEM_PROMPT
         )
     
     def _get_classification_prompt(self) -> str:
         """Get system prompt for video classification"""
-        return """You are an expert YouTube Shorts content classifier. Analyze video metadata to categorize content accurately.
-
-CLASSIFICATION CATEGORIES:
-1. Challenge - Dance challenges, fitness challenges, viral challenges, trending activities
-2. Info/Advice - Educational content, tutorials, tips, how-to videos, informational content
-3. Trending Sounds/BGM - Music-focused content, sound trends, audio-centric videos, song covers
-
-ANALYSIS GUIDELINES:
-- Focus on title keywords and description content
-- Consider channel type and content style
-- Look for challenge-related terms (challenge, dance, workout, viral)
-- Identify educational markers (how to, tutorial, tips, learn, guide)
-- Spot music/audio focus (song, music, sound, beat, audio, cover)
-
-OUTPUT REQUIREMENTS:
-- Provide confidence score (0.0-1.0) based on certainty
-- Include clear reasoning for classification decision
-- Extract key classification keywords from title/description
-- Be decisive but honest about uncertainty
-
-QUALITY STANDARDS:
-- Confidence > 0.8 for clear categorizations
-- Confidence 0.6-0.8 for probable categorizations  
-- Confidence < 0.6 for uncertain cases (mark as best guess)"""
+        return _CLASSIFICATION_SYSTEM_PROMPT
 
     async def classify_video(self, video: YouTubeVideoRaw) -> ClassificationResponse:
         """
@@ -147,15 +340,32 @@ QUALITY STANDARDS:
         Raises:
             ClassificationError: If classification fails
         """
+        cache_key = f"{video.video_id}:{self.model_name}"
+        cached = self._result_cache.get(cache_key)
+        if cached is not None:
+            logger.debug(f"Using cached classification for video: {video.video_id}")
+            return cached
+        
+        cached = await self._get_shared_result(video.video_id)
+        if cached is not None:
+            self._result_cache[cache_key] = cached
+            return cached
+        
+        if self.settings.llm_keyword_prefilter:
+            shortcut = self._fast_classify(video)
+            if shortcut is not None:
+                return shortcut
+        
+        # Reason: input and deps do not change between attempts, so build them once
+        input_text = self._prepare_classification_input(video)
+        deps = ClassificationDependencies(video=video, provider=self)
+        
         for attempt in range(3):
             try:
                 logger.debug(f"Classifying video: {video.video_id} - {video.snippet.title} (attempt {attempt + 1})")
                 
-                # Prepare input for classification
-                input_text = self._prepare_classification_input(video)
-                
                 # Run classification agent
-                deps = ClassificationDependencies(video=video, provider=self)
+                await self.rate_limiter.acquire()
                 result = await self.classification_agent.run(
                     input_text,
                     deps=deps
@@ -170,19 +380,21 @@ QUALITY STANDARDS:
                     confidence=classification_result.confidence,
                     reasoning=classification_result.reasoning,
                     alternative_categories=[],  # Could be enhanced later
-                    model_used=f"{self.provider_name}/{self.model_name}",
+                    model_used=self.model_used,
                     processing_time=0.0  # Would need timing implementation
                 )
                 
                 logger.debug(f"Classification result: {classification_result.category} (confidence: {classification_result.confidence})")
+                self._result_cache[cache_key] = response
+                await self._set_shared_result(response)
                 return response
                 
             except Exception as e:
-                error_str = str(e)
-                if "503" in error_str or "Service Unavailable" in error_str or "429" in error_str or "Rate Limit" in error_str:
+                if _is_retryable_error(e):
                     if attempt < 2:
-                        wait_time = 2 ** attempt  # Exponential backoff: 1s, 2s, 4s
-                        logger.warning(f"Service unavailable/rate limited for video {video.video_id}, retrying in {wait_time}s (attempt {attempt + 1}/3)")
+                        # Server's Retry-After if sent, else jittered exponential backoff
+                        wait_time = backoff_delay(attempt, e, self.settings.max_retry_delay)
+                        logger.warning(f"Service unavailable/rate limited for video {video.video_id}, retrying in {wait_time:.1f}s (attempt {attempt + 1}/3)")
                         await asyncio.sleep(wait_time)
                         continue
                     logger.error(f"Classification failed for video {video.video_id} after retries: {e}")
@@ -194,31 +406,93 @@ QUALITY STANDARDS:
         # Should never reach here due to the retry logic
         raise ClassificationError(f"Unexpected error in classify_video for {video.video_id}")
     
-    async def classify_videos_batch(self, videos: List[YouTubeVideoRaw]) -> List[ClassificationResponse]:
+    def _shared_cache_key(self, video_id: str) -> str:
+        """Redis key for a video's classification by this model and prompt version"""
+        return f"cls:{self.model_name}:{PROMPT_VERSION}:{video_id}"
+    
+    async def _get_shared_result(self, video_id: str) -> Optional[ClassificationResponse]:
+        """Look up a classification in Redis; cache errors count as a miss"""
+        if self._redis is None:
+            return None
+        
+        try:
+            payload = await self._redis.get(self._shared_cache_key(video_id))
+        except Exception as e:
+            logger.warning(f"Classification cache lookup failed for video {video_id}: {e}")
+            return None
+        
+        if payload is None:
+            return None
+        
+        try:
+            response = ClassificationResponse.model_validate_json(payload)
+        except ValidationError as e:
+            # Corrupt or old-schema entry: drop it so the live result replaces it
+            logger.warning(f"Discarding invalid cached classification for video {video_id}: {e}")
+            try:
+                await self._redis.delete(self._shared_cache_key(video_id))
+            except Exception as delete_error:
+                logger.warning(f"Classification cache delete failed for video {video_id}: {delete_error}")
+            return None
+        
+        logger.debug(f"Using shared cached classification for video: {video_id}")
+        return response
+    
+    async def _set_shared_result(self, response: ClassificationResponse) -> None:
+        """Store a classification in Redis with the configured TTL"""
+        if self._redis is None:
+            return
+        
+        try:
+            await self._redis.set(
+                self._shared_cache_key(response.video_id),
+                response.model_dump_json(),
+                ex=self.settings.classification_cache_ttl
+            )
+        except Exception as e:
+            logger.warning(f"Classification cache write failed for video {response.video_id}: {e}")
+    
+    async def classify_videos_batch(
+        self,
+        videos: List[YouTubeVideoRaw],
+        max_concurrency: Optional[int] = None
+    ) -> List[ClassificationResponse]:
         """
-        Classify multiple videos in batch (legacy sequential method).
+        Classify multiple videos with one request per video, run concurrently.
         
         Args:
             videos: List of videos to classify
+            max_concurrency: Maximum number of classification requests in flight
+                (defaults to the llm_max_concurrency setting)
             
         Returns:
-            List of classification responses
+            List of classification responses (failed videos are skipped)
         """
-        logger.info(f"Starting legacy batch classification of {len(videos)} videos")
+        logger.info(f"Starting concurrent batch classification of {len(videos)} videos")
         
-        results = []
-        for video in videos:
-            try:
-                result = await self.classify_video(video)
-                results.append(result)
-            except ClassificationError as e:
-                logger.warning(f"Skipping failed classification: {e}")
-                continue
+        # Reason: each call waits on the LLM API, so overlapping them hides the
+        # per-request latency while the semaphore caps load on the provider
+        semaphore = asyncio.Semaphore(max(1, max_concurrency or self.settings.llm_max_concurrency))
+        
+        async def classify_one(video: YouTubeVideoRaw) -> Optional[ClassificationResponse]:
+            async with semaphore:
+                try:
+                    return await self.classify_video(video)
+                except ClassificationError as e:
+                    logger.warning(f"Skipping failed classification: {e}")
+                    return None
+        
+        responses = await asyncio.gather(*(classify_one(video) for video in videos))
+        results = [response for response in responses if response is not None]
         
         logger.info(f"Completed batch classification: {len(results)}/{len(videos)} successful")
         return results
     
-    async def classify_videos_batch_optimized(self, videos: List[YouTubeVideoRaw], batch_size: int = 5) -> List[ClassificationResponse]:
+    async def classify_videos_batch_optimized(
+        self,
+        videos: List[YouTubeVideoRaw],
+        batch_size: Optional[int] = None
+    ) -> List[ClassificationResponse]:
         """
         Classify multiple videos using true batching with retry logic.
         Reduces API calls by sending multiple videos in single prompt.
@@ -227,7 +501,8 @@ QUALITY STANDARDS:
         
         Args:
             videos: List of videos to classify
-            batch_size: Number of videos to process in each batch (5-10 recommended)
+            batch_size: Maximum number of videos in each batch (defaults to
+                MAX_BATCH_SIZE); batches also close once MAX_BATCH_PROMPT_TOKENS is reached
             
         Returns:
             List of classification responses
@@ -238,51 +513,154 @@ QUALITY STANDARDS:
         if not videos:
             return []
         
-        logger.info(f"Starting optimized batch classification of {len(videos)} videos (batch_size={batch_size})")
+        # Videos with unambiguous keywords are answered without the LLM
+        if self.settings.llm_keyword_prefilter:
+            shortcuts = [self._fast_classify(video) for video in videos]
+        else:
+            shortcuts = [None] * len(videos)
+        llm_videos = [video for video, shortcut in zip(videos, shortcuts) if shortcut is None]
+        
+        batches = self._pack_batches(llm_videos, batch_size or MAX_BATCH_SIZE)
+        total_batches = len(batches)
+        logger.info(
+            f"Starting optimized batch classification of {len(videos)} videos in {total_batches} batches "
+            f"({len(videos) - len(llm_videos)} classified by keywords)"
+        )
         
-        all_results = []
+        # Reason: batch prompts are independent, so they are sent concurrently
+        # (bounded by settings) instead of waiting on one round trip at a time
+        semaphore = asyncio.Semaphore(self.settings.llm_max_concurrency)
         
-        # Process videos in batches
-        for i in range(0, len(videos), batch_size):
-            batch = videos[i:i + batch_size]
-            batch_num = i // batch_size + 1
-            total_batches = (len(videos) + batch_size - 1) // batch_size
-            
-            logger.debug(f"Processing batch {batch_num}/{total_batches}: {len(batch)} videos")
-            
-            for attempt in range(3):
-                try:
-                    # Create batch prompt with multiple videos
-                    batch_prompt = self._create_batch_classification_prompt(batch)
-                    
-                    # Single API call for entire batch
-                    deps = ClassificationDependencies(video=batch[0], provider=self)  # Use first video for deps
-                    result = await self.classification_agent.run(batch_prompt, deps=deps)
-                    
-                    # Parse batch response back to individual classifications
-                    batch_results = self._parse_batch_classification_result(result.data, batch)
-                    all_results.extend(batch_results)
-                    
-                    logger.debug(f"Batch {batch_num} completed successfully: {len(batch_results)} classifications")
-                    break
-                    
-                except Exception as e:
-                    error_str = str(e)
-                    if "503" in error_str or "Service Unavailable" in error_str or "429" in error_str or "Rate Limit" in error_str:
-                        if attempt < 2:
-                            wait_time = 2 ** attempt  # Exponential backoff: 1s, 2s, 4s
-                            logger.warning(f"Service unavailable/rate limited for batch {batch_num}, retrying in {wait_time}s (attempt {attempt + 1}/3)")
-                            await asyncio.sleep(wait_time)
-                            continue
-                        logger.error(f"Batch {batch_num} failed after retries: {e}")
-                        raise ClassificationError(f"Service unavailable after retries for batch {batch_num}: {str(e)}")
-                    else:
-                        logger.error(f"Batch {batch_num} classification failed: {e}")
-                        raise ClassificationError(f"Failed to classify batch {batch_num}: {str(e)}")
+        async def run_batch(batch: List[YouTubeVideoRaw], batch_num: int) -> List[ClassificationResponse]:
+            async with semaphore:
+                logger.debug(f"Processing batch {batch_num}/{total_batches}: {len(batch)} videos")
+                
+                # Create batch prompt with multiple videos
+                batch_prompt = self._create_batch_classification_prompt(batch)
+                deps = ClassificationDependencies(video=batch[0], provider=self)  # Use first video for deps
+                
+                for attempt in range(3):
+                    try:
+                        # Single API call for entire batch
+                        await self.rate_limiter.acquire()
+                        result = await self.classification_agent.run(batch_prompt, deps=deps)
+                        
+                        # Parse batch response back to individual classifications
+                        batch_results = self._parse_batch_classification_result(result.data, batch)
+                        
+                        logger.debug(f"Batch {batch_num} completed successfully: {len(batch_results)} classifications")
+                        return batch_results
+                        
+                    except Exception as e:
+                        if _is_retryable_error(e):
+                            if attempt < 2:
+                                # Server's Retry-After if sent, else jittered exponential backoff
+                                wait_time = backoff_delay(attempt, e, self.settings.max_retry_delay)
+                                logger.warning(f"Service unavailable/rate limited for batch {batch_num}, retrying in {wait_time:.1f}s (attempt {attempt + 1}/3)")
+                                await asyncio.sleep(wait_time)
+                                continue
+                            logger.error(f"Batch {batch_num} failed after retries: {e}")
+                            raise ClassificationError(f"Service unavailable after retries for batch {batch_num}: {str(e)}")
+                        else:
+                            logger.error(f"Batch {batch_num} classification failed: {e}")
+                            raise ClassificationError(f"Failed to classify batch {batch_num}: {str(e)}")
+                
+                # Should never reach here due to the retry logic
+                raise ClassificationError(f"Unexpected error in batch {batch_num}")
+        
+        tasks = [
+            asyncio.ensure_future(run_batch(batch, batch_num))
+            for batch_num, batch in enumerate(batches, 1)
+        ]
+        try:
+            batch_results = await asyncio.gather(*tasks)
+        except BaseException:
+            # Reason: once one batch fails the other results are discarded, so stop them
+            for task in tasks:
+                task.cancel()
+            raise
+        
+        # Results stay in input order: gather preserves the batch order and the
+        # parser returns one response per video, so LLM results slot back in sequence
+        llm_results = iter([response for batch in batch_results for response in batch])
+        all_results = [
+            shortcut if shortcut is not None else next(llm_results)
+            for shortcut in shortcuts
+        ]
         
         logger.info(f"Optimized batch classification complete: {len(all_results)}/{len(videos)} successful")
         return all_results
     
+    def _fast_classify(self, video: YouTubeVideoRaw) -> Optional[ClassificationResponse]:
+        """
+        Classify a video from its keywords alone when one category clearly dominates.
+        
+        Args:
+            video: Video to check
+            
+        Returns:
+            Keyword-based classification, or None if the LLM is needed
+        """
+        snippet = video.snippet
+        text = f"{snippet.title} {_truncate(snippet.description, 500)}".lower()
+        
+        matches = {
+            category: set(pattern.findall(text))
+            for category, pattern in _CATEGORY_PATTERNS.items()
+        }
+        ranked = sorted(matches, key=lambda category: len(matches[category]), reverse=True)
+        best, runner_up = len(matches[ranked[0]]), len(matches[ranked[1]])
+        if best < PREFILTER_MIN_MATCHES or best - runner_up < PREFILTER_MIN_LEAD:
+            return None
+        
+        category = ranked[0]
+        logger.debug(f"Keyword prefilter classified video {video.video_id} as {category}")
+        return ClassificationResponse(
+            video_id=video.video_id,
+            category=category,
+            confidence=PREFILTER_CONFIDENCE,
+            reasoning=f"Keyword match: {', '.join(sorted(matches[category]))}",
+            alternative_categories=[],
+            model_used="keyword-prefilter",
+            processing_time=0.0
+        )
+    
+    @staticmethod
+    def _estimate_prompt_tokens(video: YouTubeVideoRaw) -> int:
+        """Rough token count of a video's entry in the batch prompt (~4 chars per token)"""
+        snippet = video.snippet
+        # Descriptions are cut to 200 characters (plus "...") in the batch prompt
+        chars = len(snippet.title) + len(snippet.channel_title) + min(len(snippet.description), 203)
+        return (chars + _BATCH_ENTRY_OVERHEAD_CHARS) >> 2
+    
+    def _pack_batches(self, videos: List[YouTubeVideoRaw], max_videos: int) -> List[List[YouTubeVideoRaw]]:
+        """
+        Split videos into consecutive batches bounded by count and prompt size.
+        
+        Args:
+            videos: Videos to split, in order
+            max_videos: Maximum number of videos per batch
+            
+        Returns:
+            Batches in input order; each holds at least one video
+        """
+        batches: List[List[YouTubeVideoRaw]] = []
+        current: List[YouTubeVideoRaw] = []
+        current_tokens = 0
+        
+        for video in videos:
+            tokens = self._estimate_prompt_tokens(video)
+            if current and (len(current) >= max_videos or current_tokens + tokens > MAX_BATCH_PROMPT_TOKENS):
+                batches.append(current)
+                current = []
+                current_tokens = 0
+            current.append(video)
+            current_tokens += tokens
+        
+        if current:
+            batches.append(current)
+        return batches
+    
     def _prepare_classification_input(self, video: YouTubeVideoRaw) -> str:
         """
         Prepare input text for classification.
@@ -293,23 +671,11 @@ QUALITY STANDARDS:
         Returns:
             Formatted input text for LLM
         """
-        title = video.snippet.title
-        description = video.snippet.description
-        channel = video.snippet.channel_title
-        
+        snippet = video.snippet
         # Truncate description to avoid token limits
-        if len(description) > 500:
-            description = description[:500] + "..."
+        description = _truncate(snippet.description, 500)
         
-        input_text = f"""Classify this YouTube Short:
-
-Title: {title}
-Channel: {channel}
-Description: {description}
-
-Analyze the content and classify into one of the three categories: Challenge, Info/Advice, or Trending Sounds/BGM."""
-
-        return input_text
+        return _CLASSIFICATION_INPUT_TEMPLATE % (snippet.title, snippet.channel_title, description)
     
     def _create_batch_classification_prompt(self, videos: List[YouTubeVideoRaw]) -> str:
         """
@@ -321,33 +687,23 @@ Analyze the content and classify into one of the three categories: Challenge, In
         Returns:
             Formatted batch prompt for LLM
         """
-        batch_text = "Classify the following YouTube Shorts videos:\n\n"
+        parts = ["Classify the following YouTube Shorts videos:\n\n"]
         
         for i, video in enumerate(videos, 1):
-            batch_text += f"VIDEO {i}:\n"
-            batch_text += f"Title: {video.snippet.title}\n"
-            batch_text += f"Channel: {video.snippet.channel_title}\n"
-            
+            snippet = video.snippet
             # Truncate description to avoid token limits
-            description = video.snippet.description
-            if len(description) > 200:
-                description = description[:200] + "..."
-            batch_text += f"Description: {description}\n\n"
-        
-        batch_text += """For each video, respond with a JSON object where keys are 'video_1', 'video_2', etc., and values are JSON objects with the following structure:
-{
-  "category": "<Category>",
-  "confidence": <0.0-1.0>,
-  "reasoning": "<Reasoning for classification>"
-}
-
-Categories must be exactly one of: Challenge, Info/Advice, Trending Sounds/BGM
-Confidence must be between 0.0 and 1.0
-Provide clear reasoning for each classification.
-
-YOUR RESPONSE MUST BE A VALID JSON OBJECT, CONTAINING ONLY THE JSON. DO NOT INCLUDE ANY OTHER TEXT OR MARKDOWN OUTSIDE THE JSON BLOCK."""
+            description = _truncate(snippet.description, 200)
+            
+            parts.append(
+                f"VIDEO {i}:\n"
+                f"Title: {snippet.title}\n"
+                f"Channel: {snippet.channel_title}\n"
+                f"Description: {description}\n\n"
+            )
         
-        return batch_text
+        parts.append(_BATCH_PROMPT_INSTRUCTIONS)
+        # Reason: one join instead of re-copying the growing prompt for every video
+        return "".join(parts)
     
     def _parse_batch_classification_result(self, result_data: ClassificationResult, videos: List[YouTubeVideoRaw]) -> List[ClassificationResponse]:
         """
@@ -364,50 +720,50 @@ YOUR RESPONSE MUST BE A VALID JSON OBJECT, CONTAINING ONLY THE JSON. DO NOT INCL
             ClassificationError: If parsing fails
         """
         try:
-            # result_data is now a ClassificationResult object with video_X fields
-            batch_data = result_data.model_dump(exclude_unset=True) # Convert to dict
+            # Reason: every video_X entry is an extra field, so read them as-is
+            # instead of re-serializing the whole model
+            batch_data = result_data.model_extra or {}
             
             results = []
             for i, video in enumerate(videos, 1):
                 video_key = f"video_{i}"
-                if video_key in batch_data:
-                    video_result = batch_data[video_key]
-                    
-                    # Map category string to enum
-                    category_str = video_result.get("category", "Challenge")
-                    try:
-                        category = VideoCategory(category_str)
-                    except ValueError:
-                        logger.warning(f"Invalid category string '{category_str}' for video {video.video_id}, falling back to Challenge")
-                        category = VideoCategory.CHALLENGE
-                    
-                    response = ClassificationResponse(
-                        video_id=video.video_id,
-                        category=category,
-                        confidence=float(video_result.get("confidence", 0.5)),
-                        reasoning=video_result.get("reasoning", "Batch classification"),
-                        alternative_categories=[],
-                        model_used=f"{self.provider_name}/{self.model_name}",
-                        processing_time=0.0
-                    )
-                    results.append(response)
-                else:
-                    # Create fallback response if video not in batch result
-                    logger.warning(f"Video {i} not found in batch result, creating fallback")
-                    response = ClassificationResponse(
+                try:
+                    video_result = _BatchVideoResult.model_validate(batch_data[video_key])
+                except (KeyError, ValidationError) as e:
+                    # Reason: one missing or malformed entry only costs that video
+                    # its classification, not the whole batch
+                    logger.warning(f"Video {i} missing or malformed in batch result, creating fallback: {e}")
+                    results.append(ClassificationResponse(
                         video_id=video.video_id,
                         category=VideoCategory.CHALLENGE,
                         confidence=0.5,
                         reasoning="Fallback classification due to parsing error",
                         alternative_categories=[],
-                        model_used=f"{self.provider_name}/{self.model_name}",
+                        model_used=self.model_used,
                         processing_time=0.0
-                    )
-                    results.append(response)
+                    ))
+                    continue
+                
+                # Map category string to enum
+                category_str = video_result.category
+                category = _CATEGORY_MAP.get(category_str) if isinstance(category_str, str) else None
+                if category is None:
+                    logger.warning(f"Invalid category string '{category_str}' for video {video.video_id}, falling back to Challenge")
+                    category = VideoCategory.CHALLENGE
+                
+                results.append(ClassificationResponse(
+                    video_id=video.video_id,
+                    category=category,
+                    confidence=video_result.confidence,
+                    reasoning=video_result.reasoning,
+                    alternative_categories=[],
+                    model_used=self.model_used,
+                    processing_time=0.0
+                ))
             
             return results
             
-        except (KeyError, ValueError) as e:
+        except (KeyError, ValueError, TypeError, AttributeError) as e:
             logger.warning(f"Failed to parse batch classification result: {e}")
             # Create fallback responses for parsing failures
             return self._create_fallback_responses(videos)
@@ -438,7 +794,7 @@ YOUR RESPONSE MUST BE A VALID JSON OBJECT, CONTAINING ONLY THE JSON. DO NOT INCL
                     confidence=0.3,
                     reasoning=f"Classification failed: {str(e)}",
                     alternative_categories=[],
-                    model_used=f"{self.provider_name}/{self.model_name}",
+                    model_used=self.model_used,
                     processing_time=0.0
                 )
                 results.append(response)
@@ -465,7 +821,7 @@ YOUR RESPONSE MUST BE A VALID JSON OBJECT, CONTAINING ONLY THE JSON. DO NOT INCL
                 confidence=0.3,
                 reasoning="Fallback classification due to parsing error",
                 alternative_categories=[],
-                model_used=f"{self.provider_name}/{self.model_name}",
+                model_used=self.model_used,
                 processing_time=0.0
             )
             results.append(response)
@@ -510,8 +866,8 @@ YOUR RESPONSE MUST BE A VALID JSON OBJECT, CONTAINING ONLY THE JSON. DO NOT INCL
         try:
             logger.debug(f"Analyzing YouTube video: {video_id} ({analysis_type})")
             
-            # Analyze video with Gemini
-            response = self.video_analysis_model.generate_content([
+            # Analyze video with Gemini (async call so other analyses keep running)
+            response = await self.video_analysis_model.generate_content_async([
                 genai.protos.Part(
                     file_data=genai.protos.FileData(
                         file_uri=youtube_url
@@ -542,81 +898,15 @@ YOUR RESPONSE MUST BE A VALID JSON OBJECT, CONTAINING ONLY THE JSON. DO NOT INCL
     
     def _get_comprehensive_video_prompt(self) -> str:
         """Get comprehensive video analysis prompt"""
-        return """
-        Analyze this YouTube video comprehensively and provide detailed insights about:
-        
-        **Music/Sound Analysis:**
-        - Background music genre and style
-        - Audio quality and clarity
-        - Musical elements (tempo, rhythm, instruments)
-        - Sound effects or special audio features
-        
-        **Challenge Type Classification:**
-        - Challenge category (dance, food, fitness, creative, game, etc.)
-        - Difficulty level assessment
-        - Required skills or equipment
-        - Safety considerations
-        
-        **Accessibility & Difficulty:**
-        - How easy it is for regular people to follow
-        - Age appropriateness
-        - Physical requirements
-        - Learning curve assessment
-        
-        **Content Details:**
-        - Visual style and quality
-        - Setting/environment
-        - Participants (number, demographics)
-        - Props or special items used
-        
-        **Trend Analysis:**
-        - Viral potential indicators
-        - Trending elements used
-        - Social media appeal factors
-        - Shareability assessment
-        
-        Please provide structured analysis with specific observations and assessments.
-        """
+        return _COMPREHENSIVE_VIDEO_PROMPT
     
     def _get_challenge_video_prompt(self) -> str:
         """Get challenge-focused video analysis prompt"""
-        return """
-        Analyze this YouTube video specifically for challenge characteristics:
-        
-        **Challenge Assessment:**
-        - Challenge type and category
-        - Difficulty level (Easy/Medium/Hard)
-        - Steps or instructions clarity
-        - Required materials or setup
-        
-        **Followability:**
-        - How easily can average people follow this?
-        - Age groups that can participate
-        - Physical demands and limitations
-        - Safety considerations
-        
-        **Viral Potential:**
-        - Trending elements present
-        - Shareability factors
-        - Engagement potential
-        - Uniqueness or innovation
-        
-        Focus on practical aspects that determine if this is a good challenge for regular people to attempt.
-        """
+        return _CHALLENGE_VIDEO_PROMPT
     
     def _get_quick_video_prompt(self) -> str:
         """Get quick video analysis prompt"""
-        return """
-        Provide a quick analysis of this YouTube video focusing on:
-        
-        1. **Content Type:** What kind of video is this?
-        2. **Challenge Factor:** Is this a challenge? If so, what type?
-        3. **Difficulty:** How hard would this be for average people?
-        4. **Key Elements:** What makes this video notable or trending?
-        5. **Recommendation:** Would you recommend this for viral challenge content?
-        
-        Keep the analysis concise but informative.
-        """
+        return _QUICK_VIDEO_PROMPT
 
 
 # Classification agent tool functions
@@ -663,31 +953,10 @@ async def analyze_keywords(ctx: RunContext[ClassificationDependencies], text: st
     Returns:
         List of relevant keywords
     """
-    # Simple keyword extraction (could be enhanced with NLP libraries)
-    challenge_keywords = [
-        "challenge", "dance", "workout", "fitness", "viral", "trending",
-        "try", "attempt", "competition", "game", "test"
-    ]
-    
-    info_keywords = [
-        "how", "tutorial", "guide", "tips", "learn", "teach", "explain",
-        "advice", "help", "review", "fact", "truth", "secret"
-    ]
+    # Reason: one pass over the text finds every keyword; sorting restores list order
+    found_keywords = {match.group(1) for match in _KEYWORD_PATTERN.finditer(text.lower())}
     
-    sound_keywords = [
-        "music", "song", "sound", "audio", "beat", "remix", "cover",
-        "singing", "rap", "melody", "rhythm", "track", "bgm"
-    ]
-    
-    text_lower = text.lower()
-    found_keywords = []
-    
-    # Check for keywords in each category
-    for keyword in challenge_keywords + info_keywords + sound_keywords:
-        if keyword in text_lower:
-            found_keywords.append(keyword)
-    
-    return found_keywords[:10]  # Limit to top 10 keywords
+    return sorted(found_keywords, key=_KEYWORD_ORDER.__getitem__)[:10]  # Limit to top 10 keywords
 
 
 # Factory function for easy instantiation
@@ -719,134 +988,3 @@ def create_llm_provider(model_name: Optional[str] = None):
             
     except Exception as e:
         raise LLMProviderError(f"Failed to create LLM provider: {str(e)}")
-
-
-# Add YouTube video analysis methods to LLMProvider class
-def _patch_video_analysis():
-    """Add video analysis methods to LLMProvider class"""
-    
-    async def analyze_youtube_video(self, video_id: str, analysis_type: str = "comprehensive") -> Dict[str, Any]:
-        """
-        Analyze YouTube video content using Gemini 1.5 Flash.
-        
-        Args:
-            video_id: YouTube video ID
-            analysis_type: Type of analysis ("comprehensive", "challenge", "quick")
-            
-        Returns:
-            Dictionary with analysis results
-            
-        Raises:
-            ClassificationError: If video analysis fails
-        """
-        if not self.video_analysis_model:
-            raise ClassificationError("Video analysis not available - Google API key not configured")
-        
-        youtube_url = f"https://youtube.com/watch?v={video_id}"
-        
-        # Select prompt based on analysis type
-        if analysis_type == "comprehensive":
-            prompt = self._get_comprehensive_video_prompt()
-        elif analysis_type == "challenge":
-            prompt = self._get_challenge_video_prompt()
-        else:  # quick
-            prompt = self._get_quick_video_prompt()
-        
-        try:
-            logger.debug(f"Analyzing YouTube video: {video_id} ({analysis_type})")
-            
-            # Analyze video with Gemini
-            response = self.video_analysis_model.generate_content([
-                genai.protos.Part(
-                    file_data=genai.protos.FileData(
-                        file_uri=youtube_url
-                    )
-                ),
-                genai.protos.Part(text=prompt)
-            ])
-            
-            logger.debug(f"Video analysis completed for {video_id}")
-            
-            # Parse response
-            return {
-                "video_id": video_id,
-                "analysis_type": analysis_type,
-                "content": response.text,
-                "success": True
-            }
-            
-        except Exception as e:
-            logger.error(f"Video analysis failed for {video_id}: {e}")
-            raise ClassificationError(f"Video analysis failed: {str(e)}")
-    
-    def _get_comprehensive_video_prompt(self) -> str:
-        """Get comprehensive video analysis prompt"""
-        return """
-        Analyze this YouTube Shorts video and provide detailed information about:
-
-        1. **Music/Sound Analysis:**
-           - Background music genre or style
-           - Any viral sounds or specific tracks mentioned
-           - Audio elements (voice, effects, music)
-
-        2. **Challenge Type Classification:**
-           - Specific challenge category (dance, food, game, fitness, creative, etc.)
-           - Challenge mechanics and rules
-           - Target audience
-
-        3. **Accessibility & Difficulty:**
-           - Difficulty level (Easy/Medium/Hard)
-           - Required tools, materials, or space
-           - Can average person easily follow along?
-           - Safety considerations
-
-        4. **Content Details:**
-           - Number of participants
-           - Setting/environment
-           - Key visual elements
-           - Estimated duration to complete
-
-        5. **Trend Analysis:**
-           - Viral potential assessment
-           - Cultural relevance
-           - Appeal factors
-
-        Please provide a clear, structured response focusing on practical information.
-        """
-    
-    def _get_challenge_video_prompt(self) -> str:
-        """Get challenge-focused video analysis prompt"""
-        return """
-        Analyze this YouTube Shorts video focusing on challenge aspects:
-
-        1. **Challenge Type**: What kind of challenge is this? (dance, food, game, fitness, creative, etc.)
-        2. **Difficulty**: How hard would this be for a regular person to recreate? (Easy/Medium/Hard)
-        3. **Requirements**: What tools, materials, space, or skills are needed?
-        4. **Music/Sound**: What audio elements are present? Any specific tracks or viral sounds?
-        5. **Accessibility**: Can most people easily follow along at home?
-        6. **Safety**: Are there any safety concerns or considerations?
-
-        Keep the response concise and practical for someone wanting to try this challenge.
-        """
-    
-    def _get_quick_video_prompt(self) -> str:
-        """Get quick video analysis prompt"""
-        return """
-        Briefly analyze this YouTube Shorts video and answer:
-        1. What type of content/challenge is this?
-        2. What music or sounds do you hear?
-        3. How difficult would this be for someone to recreate?
-        4. What would someone need to try this themselves?
-
-        Keep the response short and practical.
-        """
-    
-    # Add methods to LLMProvider class
-    LLMProvider.analyze_youtube_video = analyze_youtube_video
-    LLMProvider._get_comprehensive_video_prompt = _get_comprehensive_video_prompt
-    LLMProvider._get_challenge_video_prompt = _get_challenge_video_prompt  
-    LLMProvider._get_quick_video_prompt = _get_quick_video_prompt
-
-
-# Apply the patch
-_patch_video_analysis()
\ No newline at end of file
@@ -2,6 +2,7 @@
 
 import httpx
 import asyncio
+import importlib.util
 import logging
 import re
 from typing import List, Dict, Any, Optional
@@ -17,6 +18,9 @@ logger = logging.getLogger(__name__)
 # YouTube API constants
 YOUTUBE_API_BASE_URL = "https://www.googleapis.com/youtube/v3"
 
+# httpx only speaks HTTP/2 when the optional h2 package (httpx[http2]) is installed
+_HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
 
 class YouTubeClient:
     """
@@ -37,13 +41,16 @@ class YouTubeClient:
         if not self.api_key or self.api_key == "":
             raise ValueError("YouTube API key is required")
         
-        # Configure HTTP client with limits and timeout
+        # Configure HTTP client with limits and timeout. Keep-alive connections are
+        # reused across concurrent searches; HTTP/2 is used when h2 is installed.
         self.client = httpx.AsyncClient(
             limits=httpx.Limits(
-                max_connections=10,
-                max_keepalive_connections=5
+                max_connections=20,
+                max_keepalive_connections=20,
+                keepalive_expiry=60.0
             ),
-            timeout=30.0
+            timeout=30.0,
+            http2=_HTTP2_AVAILABLE
         )
         
         self.base_url = YOUTUBE_API_BASE_URL
@@ -1,8 +1,10 @@
 """Advanced logging system with structured logging and performance metrics"""
 
+import atexit
 import json
 import logging
 import logging.handlers
+import queue
 import time
 from datetime import datetime
 from typing import Dict, Any, Optional, Union
@@ -134,6 +136,23 @@ class PerformanceMetrics:
 performance_metrics = PerformanceMetrics()
 
 
+class InProcessQueueHandler(logging.handlers.QueueHandler):
+    """
+    Queue handler for a listener living in the same process.
+    
+    The stock ``QueueHandler.prepare`` flattens the record for pickling and drops
+    ``exc_info``; records here never leave the process, so only the message is
+    merged and exception details stay available to the structured formatter.
+    """
+    
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """Merge message arguments eagerly but keep exception info intact"""
+        record.message = record.getMessage()
+        record.msg = record.message
+        record.args = None
+        return record
+
+
 class LoggingManager:
     """
     Centralized logging configuration and management.
@@ -145,6 +164,41 @@ class LoggingManager:
         self.settings = get_settings()
         self.configured = False
         self.loggers = {}
+        self.listeners = []
+        self.queue_handlers = []
+    
+    def _attach_queue(self, logger: logging.Logger, *handlers: logging.Handler):
+        """
+        Route a logger's records through a queue drained by a background thread.
+        
+        Args:
+            logger: Logger that receives the enqueueing handler
+            *handlers: Real (blocking) handlers owned by the listener thread
+        """
+        # Reason: stream/file writes take a lock and block; doing them on a
+        # listener thread keeps the event loop's logging cost to an enqueue.
+        log_queue: queue.SimpleQueue = queue.SimpleQueue()
+        listener = logging.handlers.QueueListener(
+            log_queue, *handlers, respect_handler_level=True
+        )
+        listener.start()
+        self.listeners.append(listener)
+        queue_handler = InProcessQueueHandler(log_queue)
+        logger.addHandler(queue_handler)
+        self.queue_handlers.append((logger, queue_handler))
+    
+    def shutdown(self):
+        """Flush queued records and stop the background listener threads"""
+        # Reason: detach the queue handlers first so records logged after shutdown
+        # are not queued with nothing left to drain them
+        for logger, queue_handler in self.queue_handlers:
+            logger.removeHandler(queue_handler)
+        self.queue_handlers.clear()
+        
+        for listener in self.listeners:
+            listener.stop()
+        self.listeners.clear()
+        self.configured = False
     
     def setup_logging(self):
         """Configure logging system"""
@@ -175,8 +229,6 @@ class LoggingManager:
             console_format = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
             console_handler.setFormatter(logging.Formatter(console_format))
         
-        root_logger.addHandler(console_handler)
-        
         # File handler with rotation
         file_handler = logging.handlers.RotatingFileHandler(
             log_dir / "application.log",
@@ -185,7 +237,6 @@ class LoggingManager:
         )
         file_handler.setLevel(logging.INFO)
         file_handler.setFormatter(StructuredFormatter())
-        root_logger.addHandler(file_handler)
         
         # Error file handler
         error_handler = logging.handlers.RotatingFileHandler(
@@ -195,7 +246,8 @@ class LoggingManager:
         )
         error_handler.setLevel(logging.ERROR)
         error_handler.setFormatter(StructuredFormatter())
-        root_logger.addHandler(error_handler)
+        
+        self._attach_queue(root_logger, console_handler, file_handler, error_handler)
         
         # Performance metrics file handler
         metrics_handler = logging.handlers.RotatingFileHandler(
@@ -208,10 +260,11 @@ class LoggingManager:
         
         # Create metrics logger
         metrics_logger = logging.getLogger('metrics')
-        metrics_logger.addHandler(metrics_handler)
+        self._attach_queue(metrics_logger, metrics_handler)
         metrics_logger.setLevel(logging.INFO)
         metrics_logger.propagate = False
         
+        atexit.register(self.shutdown)
         self.configured = True
         
         # Log startup
@@ -412,6 +465,11 @@ def setup_logging():
     logging_manager.setup_logging()
 
 
+def shutdown_logging():
+    """Flush pending log records and stop background logging threads"""
+    logging_manager.shutdown()
+
+
 def get_performance_metrics(operation: Optional[str] = None) -> Dict[str, Any]:
     """Get performance metrics"""
     return performance_metrics.get_metrics(operation)
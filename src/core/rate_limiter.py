@@ -0,0 +1,142 @@
+"""Client-side rate limiting for outbound API calls"""
+
+import time
+import random
+import asyncio
+import logging
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncTokenBucket:
+    """
+    Token bucket that paces async callers to a steady request rate.
+    
+    Tokens refill continuously at `rate` per second up to `capacity`, so
+    short bursts are allowed while the long-run rate stays bounded.
+    Callers wait in arrival order when the bucket is empty.
+    """
+    
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        """
+        Initialize token bucket.
+        
+        Args:
+            rate: Tokens added per second
+            capacity: Maximum tokens held (defaults to one second's worth)
+        """
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        
+        self.rate = rate
+        self.capacity = max(1.0, capacity if capacity is not None else rate)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+    
+    def _refill(self) -> None:
+        """Add the tokens accrued since the last update"""
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+    
+    async def acquire(self, tokens: float = 1.0) -> None:
+        """
+        Wait until `tokens` are available and take them.
+        
+        Args:
+            tokens: Number of tokens to take
+        """
+        # Reason: holding the lock while sleeping queues later callers behind
+        # this one, so waiters are served in order instead of racing on refill
+        async with self._lock:
+            self._refill()
+            if self._tokens < tokens:
+                wait_time = (tokens - self._tokens) / self.rate
+                logger.debug(f"Rate limit reached, waiting {wait_time:.2f}s")
+                await asyncio.sleep(wait_time)
+                self._refill()
+            self._tokens -= tokens
+
+
+def get_status_code(error: Exception) -> Optional[int]:
+    """
+    Read the HTTP status code from an API error, if it carries one.
+    
+    Args:
+        error: SDK exception (status_code attribute) or HTTP error (response.status_code)
+    
+    Returns:
+        The status code, or None if the error has no HTTP status
+    """
+    status_code = getattr(error, "status_code", None)
+    if status_code is None:
+        status_code = getattr(getattr(error, "response", None), "status_code", None)
+    return status_code if isinstance(status_code, int) else None
+
+
+def get_retry_after(error: Exception) -> Optional[float]:
+    """
+    Read the Retry-After delay from an HTTP error, if the server sent one.
+    
+    Args:
+        error: Exception that may carry a `response` with headers
+    
+    Returns:
+        Seconds to wait, or None if the header is missing or unparseable
+    """
+    headers = getattr(getattr(error, "response", None), "headers", None)
+    if not headers:
+        return None
+    
+    value = headers.get("retry-after") or headers.get("Retry-After")
+    if value is None:
+        return None
+    
+    try:
+        return max(0.0, float(value))
+    except (TypeError, ValueError):
+        pass
+    
+    # Retry-After may also be an HTTP date
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+# Upper bound on a single retry delay when the caller does not configure one
+DEFAULT_MAX_RETRY_DELAY = 60.0
+
+
+def backoff_delay(
+    attempt: int,
+    error: Optional[Exception] = None,
+    max_delay: float = DEFAULT_MAX_RETRY_DELAY
+) -> float:
+    """
+    Delay before retrying a rate-limited or unavailable call.
+    
+    Args:
+        attempt: Zero-based attempt number that just failed
+        error: The failure, checked for a Retry-After header
+        max_delay: Longest delay returned, whatever the server asks for
+    
+    Returns:
+        The server's Retry-After if given, otherwise exponential backoff
+        (1s, 2s, 4s, ...) scaled by random jitter between 50% and 100%,
+        capped at max_delay
+    """
+    retry_after = get_retry_after(error) if error is not None else None
+    if retry_after is not None:
+        # Reason: a bogus or hostile Retry-After must not stall a worker for hours
+        return min(retry_after, max_delay)
+    
+    # Jitter keeps concurrent callers from retrying in lockstep
+    return min((2 ** attempt) * (0.5 + random.random() * 0.5), max_delay)
@@ -2,6 +2,7 @@
 
 import asyncio
 import logging
+import time
 from typing import Optional, Callable, Dict, Any
 from datetime import datetime, timedelta
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
@@ -21,6 +22,9 @@ class MonitoringScheduler:
     Manages periodic data collection, trend detection, and notification tasks.
     """
     
+    # Seconds a job status snapshot is reused by the polled monitoring endpoints
+    STATUS_CACHE_TTL = 1.0
+    
     def __init__(self):
         """Initialize monitoring scheduler"""
         self.settings = get_settings()
@@ -38,6 +42,10 @@ class MonitoringScheduler:
             "chart_collections": 0,
             "last_chart_collection": None
         }
+        # Incremented whenever job or scheduler state changes (used for HTTP ETags)
+        self.version = 0
+        # (version, expires_at, status) of the last get_all_jobs_status() result
+        self._status_cache: Optional[tuple] = None
         
         logger.info("Monitoring scheduler initialized")
     
@@ -55,6 +63,7 @@ class MonitoringScheduler:
             self.scheduler.start()
             self.is_running = True
             self.stats["scheduler_started"] = datetime.now()
+            self.version += 1
             
             logger.info("Monitoring scheduler started successfully")
             
@@ -70,6 +79,7 @@ class MonitoringScheduler:
         try:
             self.scheduler.shutdown(wait=True)
             self.is_running = False
+            self.version += 1
             
             logger.info("Monitoring scheduler stopped")
             
@@ -155,6 +165,7 @@ class MonitoringScheduler:
             "run_count": 0,
             "error_count": 0
         }
+        self.version += 1
         
         logger.info(f"Added periodic job '{job_id}': {description} (every {minutes} minutes)")
     
@@ -204,6 +215,7 @@ class MonitoringScheduler:
             "run_count": 0,
             "error_count": 0
         }
+        self.version += 1
         
         logger.info(f"Added cron job '{job_id}': {description} ({trigger})")
     
@@ -213,6 +225,7 @@ class MonitoringScheduler:
             self.scheduler.remove_job(job_id)
             if job_id in self.tasks:
                 del self.tasks[job_id]
+            self.version += 1
             logger.info(f"Removed job '{job_id}'")
         except Exception as e:
             logger.error(f"Failed to remove job '{job_id}': {e}")
@@ -251,6 +264,9 @@ class MonitoringScheduler:
                     self.tasks[job_id]["error_count"] += 1
                 
                 # Don't re-raise to prevent scheduler from stopping
+            
+            finally:
+                self.version += 1
         
         return wrapper
     
@@ -260,12 +276,12 @@ class MonitoringScheduler:
         
         try:
             # Import here to avoid circular imports
-            from ..services.trend_detector import TrendDetector
-            from ..services.notification_service import NotificationService
+            from ..services.trend_detector import get_trend_detector
+            from ..services.notification_service import get_notification_service
             
-            # Initialize services
-            trend_detector = TrendDetector()
-            notification_service = NotificationService()
+            # Reuse the process-wide services
+            trend_detector = get_trend_detector()
+            notification_service = get_notification_service()
             
             # Run trend detection
             trends = await trend_detector.detect_trends()
@@ -286,9 +302,9 @@ class MonitoringScheduler:
         
         try:
             # Import here to avoid circular imports
-            from ..services.trend_storage import TrendStorage
+            from ..services.trend_storage import get_trend_storage
             
-            storage = TrendStorage()
+            storage = await get_trend_storage()
             await storage.cleanup_old_data()
             
             logger.info("Daily cleanup completed")
@@ -338,11 +354,11 @@ class MonitoringScheduler:
         
         try:
             # Import here to avoid circular imports
-            from ..services.trend_detector import TrendDetector
-            from ..services.notification_service import NotificationService
+            from ..services.trend_detector import get_trend_detector
+            from ..services.notification_service import get_notification_service
             
-            trend_detector = TrendDetector()
-            notification_service = NotificationService()
+            trend_detector = get_trend_detector()
+            notification_service = get_notification_service()
             
             # Generate weekly report
             report = await trend_detector.generate_weekly_report()
@@ -378,8 +394,18 @@ class MonitoringScheduler:
         }
     
     def get_all_jobs_status(self) -> Dict[str, Any]:
-        """Get status of all jobs"""
-        return {
+        """
+        Get status of all jobs.
+        
+        /status, /jobs, /health and the dashboard all poll this, so a snapshot is
+        reused for STATUS_CACHE_TTL seconds unless the scheduler state changed.
+        """
+        now = time.monotonic()
+        cached = self._status_cache
+        if cached is not None and cached[0] == self.version and now < cached[1]:
+            return cached[2]
+        
+        status = {
             "scheduler_running": self.is_running,
             "total_jobs": len(self.tasks),
             "statistics": self.stats,
@@ -388,6 +414,8 @@ class MonitoringScheduler:
                 for job_id in self.tasks
             }
         }
+        self._status_cache = (self.version, now + self.STATUS_CACHE_TTL, status)
+        return status
 
 
 # Global scheduler instance
@@ -45,6 +45,29 @@ class Settings(BaseSettings):
         alias="LLM_MODEL",
         description="LLM model to use for classification"
     )
+    llm_max_concurrency: int = Field(
+        default=8,
+        ge=1,
+        alias="LLM_MAX_CONCURRENCY",
+        description="Maximum classification requests in flight to the LLM provider"
+    )
+    llm_requests_per_minute: int = Field(
+        default=120,
+        ge=1,
+        alias="LLM_REQUESTS_PER_MINUTE",
+        description="Client-side cap on LLM classification requests per minute"
+    )
+    llm_keyword_prefilter: bool = Field(
+        default=False,
+        alias="LLM_KEYWORD_PREFILTER",
+        description="Classify videos with unambiguous keyword matches without calling the LLM"
+    )
+    max_retry_delay: float = Field(
+        default=60.0,
+        gt=0,
+        alias="MAX_RETRY_DELAY",
+        description="Longest wait in seconds before retrying a rate-limited call, even if Retry-After asks for more"
+    )
     
     # Google API Key (required by pydantic-ai for Google models)
     google_api_key: str = Field(
@@ -62,6 +85,11 @@ class Settings(BaseSettings):
         default=10,
         description="Maximum API requests per second"
     )
+    max_concurrent_api_calls: int = Field(
+        default=4,
+        ge=1,
+        description="Maximum YouTube search requests in flight during collection"
+    )
     
     # Development Settings
     debug: bool = Field(
@@ -112,6 +140,12 @@ class Settings(BaseSettings):
         alias="REDIS_URL",
         description="Redis connection URL for caching"
     )
+    classification_cache_ttl: int = Field(
+        default=86400,
+        ge=1,
+        alias="CLASSIFICATION_CACHE_TTL",
+        description="Seconds a video classification stays in the Redis cache"
+    )
     
     # Security Settings
     secret_key: Optional[str] = Field(
@@ -122,6 +156,11 @@ class Settings(BaseSettings):
         default=["localhost", "127.0.0.1"],
         description="Allowed hosts for the application"
     )
+    trusted_proxies: List[str] = Field(
+        default=["127.0.0.1", "::1"],
+        alias="TRUSTED_PROXIES",
+        description="Proxy addresses whose X-Forwarded-For header is trusted"
+    )
     
     # Database Settings (for future use)
     database_url: Optional[str] = Field(
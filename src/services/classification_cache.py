@@ -0,0 +1,176 @@
+"""Disk-backed cache of video classification results"""
+
+import time
+import aiosqlite
+import orjson
+from pathlib import Path
+from pydantic import ValidationError
+from typing import Collection, Dict, List, Optional
+
+from ..clients.llm_provider import PROMPT_VERSION
+from ..models.video_models import EnhancedClassifiedVideo, VideoCategory
+from ..core.logging import get_logger
+
+logger = get_logger(__name__)
+
+DEFAULT_TTL_SECONDS = 7 * 24 * 3600
+
+_CREATE_TABLE_SQL = """
+    CREATE TABLE IF NOT EXISTS classifications (
+        cache_key TEXT PRIMARY KEY,
+        payload BLOB NOT NULL,
+        expires_at REAL NOT NULL
+    )
+"""
+
+
+class ClassificationCache:
+    """
+    SQLite-backed cache of classified videos keyed by video ID.
+    
+    Classifications survive across CLI runs so videos seen before do not
+    trigger another LLM call until their entry expires.
+    """
+    
+    def __init__(self, cache_dir: str = "data", ttl: int = DEFAULT_TTL_SECONDS, model_version: str = ""):
+        """
+        Initialize the classification cache.
+        
+        Args:
+            cache_dir: Directory holding the cache database
+            ttl: Seconds a classification stays valid
+            model_version: Model that produced the classifications ("provider/model")
+        """
+        directory = Path(cache_dir)
+        directory.mkdir(parents=True, exist_ok=True)
+        self.db_path = directory / "classification_cache.db"
+        self.ttl = ttl
+        # Reason: like the Redis cache, entries are scoped to the model and prompt
+        # so switching either does not serve stale classifications until expiry
+        self._key_prefix = f"{model_version}:{PROMPT_VERSION}:"
+    
+    def _key(
+        self,
+        video_id: str,
+        include_video_content: bool,
+        video_content_categories: Optional[Collection[VideoCategory]] = None
+    ) -> str:
+        """
+        Build the cache key.
+        
+        Text-only, full video and category-restricted video analyses are cached
+        separately, since a restricted run leaves other categories without
+        video analysis.
+        """
+        if not include_video_content:
+            mode = "text"
+        elif video_content_categories is None:
+            mode = "video"
+        else:
+            mode = f"video[{','.join(sorted(category.value for category in video_content_categories))}]"
+        return f"{self._key_prefix}{video_id}:{mode}"
+    
+    async def get_many(
+        self,
+        video_ids: List[str],
+        include_video_content: bool = False,
+        video_content_categories: Optional[Collection[VideoCategory]] = None
+    ) -> Dict[str, EnhancedClassifiedVideo]:
+        """
+        Look up unexpired classifications.
+        
+        Args:
+            video_ids: Videos to look up
+            include_video_content: Whether video content analysis was requested
+            video_content_categories: Categories video analysis was restricted to
+        
+        Returns:
+            Cached classifications by video ID (misses are omitted)
+        """
+        if not video_ids:
+            return {}
+        
+        keys = [
+            self._key(video_id, include_video_content, video_content_categories)
+            for video_id in video_ids
+        ]
+        placeholders = ",".join("?" * len(keys))
+        
+        try:
+            async with aiosqlite.connect(self.db_path) as db:
+                await db.execute(_CREATE_TABLE_SQL)
+                cursor = await db.execute(
+                    f"SELECT cache_key, payload FROM classifications "
+                    f"WHERE cache_key IN ({placeholders}) AND expires_at > ?",
+                    (*keys, time.time())
+                )
+                rows = await cursor.fetchall()
+        except Exception as e:
+            logger.warning(f"Classification cache lookup failed: {e}")
+            return {}
+        
+        hits = {}
+        invalid_keys = []
+        for cache_key, payload in rows:
+            try:
+                video = EnhancedClassifiedVideo.model_validate(orjson.loads(payload))
+            except (orjson.JSONDecodeError, ValidationError) as e:
+                # Corrupt or old-schema row: treat as a miss so it is classified again
+                logger.warning(f"Discarding invalid cached classification {cache_key}: {e}")
+                invalid_keys.append((cache_key,))
+                continue
+            hits[video.video_id] = video
+        
+        if invalid_keys:
+            await self._delete(invalid_keys)
+        
+        return hits
+    
+    async def _delete(self, keys: List[tuple]) -> None:
+        """Remove entries by cache key; failures only leave them to expire"""
+        try:
+            async with aiosqlite.connect(self.db_path) as db:
+                await db.executemany("DELETE FROM classifications WHERE cache_key = ?", keys)
+                await db.commit()
+        except Exception as e:
+            logger.warning(f"Classification cache delete failed: {e}")
+    
+    async def set_many(
+        self,
+        videos: List[EnhancedClassifiedVideo],
+        include_video_content: bool = False,
+        video_content_categories: Optional[Collection[VideoCategory]] = None
+    ) -> None:
+        """
+        Store classifications and drop expired entries.
+        
+        Args:
+            videos: Classified videos to store
+            include_video_content: Whether video content analysis was requested
+            video_content_categories: Categories video analysis was restricted to
+        """
+        if not videos:
+            return
+        
+        now = time.time()
+        rows = [
+            (
+                self._key(video.video_id, include_video_content, video_content_categories),
+                orjson.dumps(video.model_dump(mode="json")),
+                now + self.ttl
+            )
+            for video in videos
+        ]
+        
+        try:
+            async with aiosqlite.connect(self.db_path) as db:
+                await db.execute(_CREATE_TABLE_SQL)
+                await db.executemany(
+                    "INSERT OR REPLACE INTO classifications (cache_key, payload, expires_at) "
+                    "VALUES (?, ?, ?)",
+                    rows
+                )
+                await db.execute("DELETE FROM classifications WHERE expires_at <= ?", (now,))
+                await db.commit()
+        except Exception as e:
+            logger.warning(f"Classification cache write failed: {e}")
@@ -27,7 +27,16 @@ class NotificationService:
     def __init__(self):
         """Initialize notification service"""
         self.settings = get_settings()
-        self.http_client = httpx.AsyncClient(timeout=30.0)
+        # Reason: one pooled keep-alive client per process, so webhook posts reuse
+        # connections instead of paying a TCP+TLS handshake each time
+        self.http_client = httpx.AsyncClient(
+            timeout=30.0,
+            limits=httpx.Limits(
+                max_connections=50,
+                max_keepalive_connections=20,
+                keepalive_expiry=60.0
+            )
+        )
         
         # Notification statistics
         self.stats = {
@@ -38,6 +47,8 @@ class NotificationService:
             "failed_notifications": 0,
             "last_notification_sent": None
         }
+        # Incremented whenever the statistics change (used for HTTP ETags)
+        self.version = 0
         
         logger.info("Notification service initialized")
     
@@ -62,22 +73,25 @@ class NotificationService:
             "errors": []
         }
         
-        # Send to each configured channel
+        # Send to each configured channel concurrently
+        channel_sends = {}
         if self.settings.email_notifications_enabled:
-            email_result = await self._send_email_alerts(alerts)
-            results["channels"]["email"] = email_result
+            channel_sends["email"] = self._send_email_alerts(alerts)
         
         if self.settings.slack_webhook_url:
-            slack_result = await self._send_slack_alerts(alerts)
-            results["channels"]["slack"] = slack_result
+            channel_sends["slack"] = self._send_slack_alerts(alerts)
         
         if self.settings.discord_webhook_url:
-            discord_result = await self._send_discord_alerts(alerts)
-            results["channels"]["discord"] = discord_result
+            channel_sends["discord"] = self._send_discord_alerts(alerts)
+        
+        # Each channel sender catches its own errors and returns a result dict
+        channel_results = await asyncio.gather(*channel_sends.values())
+        results["channels"] = dict(zip(channel_sends, channel_results))
         
         # Update statistics
         self.stats["total_notifications_sent"] += len(alerts)
         self.stats["last_notification_sent"] = datetime.now()
+        self.version += 1
         
         logger.info(f"Trend alerts sent successfully to {len(results['channels'])} channels")
         return results
@@ -715,4 +729,12 @@ def get_notification_service() -> NotificationService:
     global _notification_service
     if _notification_service is None:
         _notification_service = NotificationService()
-    return _notification_service
\ No newline at end of file
+    return _notification_service
+
+
+async def close_notification_service():
+    """Close the global notification service and its HTTP connection pool"""
+    global _notification_service
+    if _notification_service is not None:
+        await _notification_service.close()
+        _notification_service = None
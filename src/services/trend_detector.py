@@ -477,4 +477,16 @@ class TrendDetector:
                 "growth_threshold": self.growth_threshold,
                 "monitoring_enabled": self.settings.monitoring_enabled
             }
-        }
\ No newline at end of file
+        }
+
+
+# Global trend detector instance
+_trend_detector = None
+
+
+def get_trend_detector() -> TrendDetector:
+    """Get the global trend detector instance"""
+    global _trend_detector
+    if _trend_detector is None:
+        _trend_detector = TrendDetector()
+    return _trend_detector
@@ -1,9 +1,11 @@
 """Trend data storage and management system"""
 
+import os
 import asyncio
 import logging
 import json
 import aiosqlite
+import orjson
 from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime, timedelta
 from pathlib import Path
@@ -14,6 +16,14 @@ from ..core.logging import get_logger
 
 logger = get_logger(__name__)
 
+_INSERT_ALERT_SQL = """
+    INSERT OR REPLACE INTO trend_alerts (
+        alert_id, alert_type, title, description, video_id, channel_title,
+        current_stats, growth_metrics, confidence_score, detected_at,
+        category, keywords, youtube_url, thumbnail_url
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
 
 class TrendStorage:
     """
@@ -48,7 +58,6 @@ class TrendStorage:
             "oldest_record": None,
             "newest_record": None
         }
-        
         logger.info(f"Trend storage initialized with database: {self.db_path}")
     
     async def initialize(self):
@@ -145,6 +154,26 @@ class TrendStorage:
         
         await db.commit()
     
+    @staticmethod
+    def _alert_row(alert: TrendAlert) -> Tuple:
+        """Convert a trend alert into the trend_alerts insert parameters"""
+        return (
+            alert.alert_id,
+            alert.alert_type,
+            alert.title,
+            alert.description,
+            alert.video_id,
+            alert.channel_title,
+            json.dumps(alert.current_stats),
+            json.dumps(alert.growth_metrics),
+            alert.confidence_score,
+            alert.detected_at,
+            alert.category,
+            json.dumps(alert.keywords),
+            alert.youtube_url,
+            alert.thumbnail_url
+        )
+    
     async def store_trend_alert(self, alert: TrendAlert) -> bool:
         """
         Store a trend alert in the database.
@@ -157,34 +186,13 @@ class TrendStorage:
         """
         try:
             async with aiosqlite.connect(self.db_path) as db:
-                await db.execute("""
-                    INSERT OR REPLACE INTO trend_alerts (
-                        alert_id, alert_type, title, description, video_id, channel_title,
-                        current_stats, growth_metrics, confidence_score, detected_at,
-                        category, keywords, youtube_url, thumbnail_url
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """, (
-                    alert.alert_id,
-                    alert.alert_type,
-                    alert.title,
-                    alert.description,
-                    alert.video_id,
-                    alert.channel_title,
-                    json.dumps(alert.current_stats),
-                    json.dumps(alert.growth_metrics),
-                    alert.confidence_score,
-                    alert.detected_at,
-                    alert.category,
-                    json.dumps(alert.keywords),
-                    alert.youtube_url,
-                    alert.thumbnail_url
-                ))
-                
-                await db.commit()
+                await db.execute(_INSERT_ALERT_SQL, self._alert_row(alert))
                 
                 # Update keyword trends
                 await self._update_keyword_trends(db, alert.keywords, alert.category)
                 
+                await db.commit()
+                
                 self.stats["total_alerts_stored"] += 1
                 logger.info(f"Stored trend alert: {alert.alert_id}")
                 
@@ -198,17 +206,41 @@ class TrendStorage:
         """
         Store multiple trend alerts.
         
+        All alerts are written with one executemany on a single connection and
+        committed once; if the batch fails, alerts are retried one by one so a
+        single bad alert does not drop the rest.
+        
         Args:
             alerts: List of TrendAlert objects
             
         Returns:
             int: Number of alerts stored successfully
         """
-        stored_count = 0
+        if not alerts:
+            return 0
         
-        for alert in alerts:
-            if await self.store_trend_alert(alert):
-                stored_count += 1
+        try:
+            async with aiosqlite.connect(self.db_path) as db:
+                await db.executemany(
+                    _INSERT_ALERT_SQL,
+                    [self._alert_row(alert) for alert in alerts]
+                )
+                
+                for alert in alerts:
+                    await self._update_keyword_trends(db, alert.keywords, alert.category)
+                
+                await db.commit()
+            
+            stored_count = len(alerts)
+            self.stats["total_alerts_stored"] += stored_count
+            
+        except Exception as e:
+            logger.warning(f"Batch alert insert failed, storing individually: {e}")
+            
+            stored_count = 0
+            for alert in alerts:
+                if await self.store_trend_alert(alert):
+                    stored_count += 1
         
         logger.info(f"Stored {stored_count}/{len(alerts)} trend alerts")
         return stored_count
@@ -243,13 +275,19 @@ class TrendStorage:
                     VALUES (?, ?, 1, ?, ?, 1, ?)
                 """, (keyword, category, current_time, current_time, current_time))
     
-    async def get_recent_alerts(self, hours: int = 24, alert_type: Optional[str] = None) -> List[Dict[str, Any]]:
+    async def get_recent_alerts(
+        self,
+        hours: int = 24,
+        alert_type: Optional[str] = None,
+        limit: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
         """
         Get recent trend alerts.
         
         Args:
             hours: Number of hours to look back
             alert_type: Filter by alert type (optional)
+            limit: Maximum number of alerts to return, newest first (optional)
             
         Returns:
             List of alert dictionaries
@@ -272,6 +310,10 @@ class TrendStorage:
                 
                 query += " ORDER BY detected_at DESC"
                 
+                if limit is not None:
+                    query += " LIMIT ?"
+                    params.append(limit)
+                
                 cursor = await db.execute(query, params)
                 rows = await cursor.fetchall()
                 
@@ -467,6 +509,22 @@ class TrendStorage:
         except Exception as e:
             logger.error(f"Failed to update stats: {e}")
     
+    def data_version(self) -> str:
+        """
+        Get a validator that changes whenever the database file is written.
+        
+        Derived from the file itself rather than an in-memory counter because the
+        CLI pipeline and health monitor write the same database from other processes.
+        
+        Returns:
+            str: Modification time and size of the database file
+        """
+        try:
+            stat = os.stat(self.db_path)
+        except FileNotFoundError:
+            return "0"
+        return f"{stat.st_mtime_ns:x}-{stat.st_size:x}"
+    
     async def get_storage_stats(self) -> Dict[str, Any]:
         """Get storage statistics"""
         await self._update_stats()
@@ -520,9 +578,9 @@ class TrendStorage:
                     "keywords": keywords
                 }
                 
-                # Write to file
-                with open(output_path, 'w', encoding='utf-8') as f:
-                    json.dump(export_data, f, indent=2, default=str)
+                # Reason: a multi-MB dump would stall the event loop, so encode and
+                # write it on a worker thread
+                await asyncio.to_thread(self._write_export_file, output_path, export_data)
                 
                 logger.info(f"Exported {len(alerts)} alerts and {len(keywords)} keywords to {output_path}")
                 return True
@@ -531,6 +589,24 @@ class TrendStorage:
             logger.error(f"Failed to export data: {e}")
             return False
 
+    
+    @staticmethod
+    def _write_export_file(output_path: str, export_data: Dict[str, Any]):
+        """
+        Encode export data with orjson and write it in one buffered write.
+        
+        Args:
+            output_path: Path to output JSON file
+            export_data: Export payload
+        """
+        payload = orjson.dumps(
+            export_data,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS,
+            default=str
+        )
+        with open(output_path, 'wb', buffering=65536) as f:
+            f.write(payload)
+
 
 # Global storage instance
 _storage = None
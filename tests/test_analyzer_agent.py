@@ -1,7 +1,8 @@
 """Tests for analysis agent"""
 
+import asyncio
 import pytest
-from unittest.mock import Mock, patch
+from unittest.mock import AsyncMock, Mock, patch
 from datetime import datetime
 
 from src.agents.analyzer_agent import AnalyzerAgent, create_analyzer_agent
@@ -570,6 +571,48 @@ class TestAnalyzerAgent:
         # Verify batch method was called multiple times (once per batch)
         assert mock_llm_provider.classify_videos_batch_optimized.call_count >= 2  # At least 2 batches for 12 videos
     
+    @pytest.mark.asyncio
+    async def test_classify_videos_concurrent_batches(self, analyzer_agent, mock_llm_provider):
+        """Test concurrent batches keep input order and report progress on completion"""
+        videos = [
+            YouTubeVideoRaw(
+                video_id=f"video_{i}",
+                snippet=VideoSnippet(
+                    title=f"Test Video {i}",
+                    published_at=datetime.now(),
+                    thumbnail_url="https://example.com/thumb.jpg"
+                )
+            )
+            for i in range(45)
+        ]
+        
+        async def mock_batch_response(batch, batch_size):
+            # Reason: earlier batches finish later to check result ordering
+            await asyncio.sleep(0.03 if batch[0].video_id == "video_0" else 0.01)
+            return [
+                ClassificationResponse(
+                    video_id=video.video_id,
+                    category=VideoCategory.CHALLENGE,
+                    confidence=0.85,
+                    reasoning="Batch classification",
+                    alternative_categories=[],
+                    model_used="test/model",
+                    processing_time=0.0
+                )
+                for video in batch
+            ]
+        
+        mock_llm_provider.classify_videos_batch_optimized.side_effect = mock_batch_response
+        progress = []
+        
+        result = await analyzer_agent.classify_videos(
+            videos, concurrency=3, progress_callback=lambda done, total: progress.append((done, total))
+        )
+        
+        assert [video.video_id for video in result] == [video.video_id for video in videos]
+        assert mock_llm_provider.classify_videos_batch_optimized.call_count == 3
+        assert progress == [(20, 45), (25, 45), (45, 45)]
+    
     @pytest.mark.asyncio
     async def test_classify_videos_empty_batch_optimization(self, analyzer_agent, mock_llm_provider):
         """Test batch processing with empty video list"""
@@ -584,4 +627,19 @@ class TestAnalyzerAgent:
         stats = analyzer_agent.get_analysis_stats()
         assert stats["videos_analyzed"] == 0
         assert stats["classifications_successful"] == 0
-        assert stats["classifications_failed"] == 0
\ No newline at end of file
+        assert stats["classifications_failed"] == 0
+    
+    @pytest.mark.asyncio
+    async def test_video_content_analysis_limited_to_categories(self, analyzer_agent, mock_llm_provider, sample_classified_videos):
+        """Only videos in the requested categories get the video content pass"""
+        mock_llm_provider.analyze_youtube_video = AsyncMock(side_effect=RuntimeError("quota"))
+        
+        with patch.object(analyzer_agent, 'classify_videos', AsyncMock(return_value=sample_classified_videos)):
+            result = await analyzer_agent.classify_videos_with_enhanced_analysis(
+                [], include_video_content=True, video_content_categories={VideoCategory.CHALLENGE}
+            )
+        
+        assert [video.video_id for video in result] == [video.video_id for video in sample_classified_videos]
+        mock_llm_provider.analyze_youtube_video.assert_awaited_once_with(
+            video_id="challenge123", analysis_type="comprehensive"
+        )
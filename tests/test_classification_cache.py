@@ -0,0 +1,91 @@
+"""Tests for the disk-backed classification cache"""
+
+import pytest
+import aiosqlite
+import orjson
+
+from src.models.video_models import EnhancedClassifiedVideo, VideoCategory
+from src.services.classification_cache import ClassificationCache
+
+
+@pytest.fixture
+def enhanced_video(sample_classified_video):
+    """Classified video in the shape returned by the analyzer"""
+    return EnhancedClassifiedVideo(**sample_classified_video.model_dump())
+
+
+class TestClassificationCache:
+    """Test suite for ClassificationCache"""
+
+    @pytest.mark.asyncio
+    async def test_round_trip(self, tmp_path, enhanced_video):
+        """Stored classifications are returned by video ID"""
+        cache = ClassificationCache(cache_dir=str(tmp_path))
+
+        await cache.set_many([enhanced_video])
+        hits = await cache.get_many(["abc123", "missing"])
+
+        assert list(hits) == ["abc123"]
+        assert hits["abc123"] == enhanced_video
+
+    @pytest.mark.asyncio
+    async def test_expired_entries_are_misses(self, tmp_path, enhanced_video):
+        """Entries past their TTL are not returned"""
+        cache = ClassificationCache(cache_dir=str(tmp_path), ttl=-1)
+
+        await cache.set_many([enhanced_video])
+
+        assert await cache.get_many(["abc123"]) == {}
+
+    @pytest.mark.asyncio
+    async def test_analysis_modes_cached_separately(self, tmp_path, enhanced_video):
+        """A text-only classification does not satisfy a video analysis lookup"""
+        cache = ClassificationCache(cache_dir=str(tmp_path))
+
+        await cache.set_many([enhanced_video], include_video_content=False)
+
+        assert await cache.get_many(["abc123"], include_video_content=True) == {}
+        assert "abc123" in await cache.get_many(["abc123"], include_video_content=False)
+
+    @pytest.mark.asyncio
+    async def test_category_restricted_analysis_cached_separately(self, tmp_path, enhanced_video):
+        """Video analysis restricted to some categories does not satisfy a full lookup"""
+        cache = ClassificationCache(cache_dir=str(tmp_path))
+        categories = {VideoCategory.CHALLENGE}
+
+        await cache.set_many([enhanced_video], True, video_content_categories=categories)
+
+        assert await cache.get_many(["abc123"], include_video_content=True) == {}
+        assert "abc123" in await cache.get_many(["abc123"], True, video_content_categories=categories)
+
+    @pytest.mark.asyncio
+    async def test_entries_scoped_to_model(self, tmp_path, enhanced_video):
+        """Classifications from another model are misses"""
+        await ClassificationCache(str(tmp_path), model_version="openai/gpt-4o-mini").set_many([enhanced_video])
+
+        other_model = ClassificationCache(str(tmp_path), model_version="gemini/gemini-2.5-flash")
+
+        assert await other_model.get_many(["abc123"]) == {}
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("payload", [
+        b'{"video_id": "abc123", "categ',
+        orjson.dumps({"video_id": "abc123", "category": "Unknown"})
+    ], ids=["corrupt", "old_schema"])
+    async def test_invalid_rows_are_deleted_misses(self, tmp_path, enhanced_video, payload):
+        """Unreadable rows are dropped without failing the other lookups"""
+        cache = ClassificationCache(cache_dir=str(tmp_path))
+        await cache.set_many([enhanced_video])
+        bad_key = cache._key("broken", False)
+        async with aiosqlite.connect(cache.db_path) as db:
+            await db.execute(
+                "INSERT INTO classifications VALUES (?, ?, ?)", (bad_key, payload, 2 ** 40)
+            )
+            await db.commit()
+
+        hits = await cache.get_many(["abc123", "broken"])
+
+        assert list(hits) == ["abc123"]
+        async with aiosqlite.connect(cache.db_path) as db:
+            cursor = await db.execute("SELECT COUNT(*) FROM classifications WHERE cache_key = ?", (bad_key,))
+            assert (await cursor.fetchone())[0] == 0
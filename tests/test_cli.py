@@ -0,0 +1,657 @@
+"""Tests for the command-line interface helpers"""
+
+import json
+import asyncio
+import argparse
+import pytest
+from datetime import datetime
+from unittest.mock import AsyncMock, Mock, patch
+
+from src import cli as cli_module
+from src.cli import YouTubeTrendsCLI
+from src.core.exceptions import QuotaExceededError
+from src.models.video_models import ChallengeType, EnhancedClassifiedVideo, VideoCategory
+
+
+@pytest.fixture
+def cli():
+    """CLI instance without signal handlers or settings side effects"""
+    return YouTubeTrendsCLI.__new__(YouTubeTrendsCLI)
+
+
+class TestFilePersistence:
+    """Test suite for the JSON save/load helpers"""
+
+    def test_videos_round_trip(self, cli, tmp_path, sample_youtube_videos):
+        """Collected videos survive a save/load round trip"""
+        output_path = str(tmp_path / "collected.json")
+
+        cli._save_videos_to_file(sample_youtube_videos, output_path)
+        loaded = cli._load_videos_from_file(output_path)
+
+        assert loaded == sample_youtube_videos
+
+    def test_classified_videos_round_trip(self, cli, tmp_path, sample_classified_videos):
+        """Classified videos survive a save/load round trip"""
+        output_path = str(tmp_path / "classified.json")
+
+        cli._save_classified_videos_to_file(sample_classified_videos, output_path)
+        loaded = cli._load_classified_videos_from_file(output_path)
+
+        assert loaded == sample_classified_videos
+
+    def test_saved_file_is_plain_json(self, cli, tmp_path, sample_classified_videos):
+        """Saved files are readable by the stdlib parser with JSON-native values"""
+        output_path = tmp_path / "classified.json"
+
+        cli._save_classified_videos_to_file(sample_classified_videos, str(output_path))
+        data = json.loads(output_path.read_text(encoding="utf-8"))
+
+        assert data["total_videos"] == 3
+        assert data["classified_videos"][0]["category"] == "Challenge"
+        assert data["classified_videos"][0]["published_at"] == "2024-01-15T10:00:00Z"
+
+    def test_enhanced_fields_are_saved(self, cli, tmp_path, sample_classified_video):
+        """Pipeline results keep their EnhancedClassifiedVideo fields on disk"""
+        output_path = tmp_path / "classified.json"
+        enhanced = EnhancedClassifiedVideo(
+            **sample_classified_video.model_dump(), analysis_source="video"
+        )
+
+        cli._save_classified_videos_to_file([enhanced], str(output_path))
+        data = json.loads(output_path.read_text(encoding="utf-8"))
+
+        assert data["classified_videos"][0]["analysis_source"] == "video"
+        assert data["classified_videos"][0]["enhanced_analysis"] is None
+
+    def test_invalid_videos_are_skipped(self, cli, tmp_path, sample_youtube_videos):
+        """Rows that fail validation are dropped, the rest are kept"""
+        output_path = tmp_path / "collected.json"
+        cli._save_videos_to_file(sample_youtube_videos, str(output_path))
+        data = json.loads(output_path.read_text(encoding="utf-8"))
+        del data["videos"][1]["snippet"]
+        output_path.write_text(json.dumps(data), encoding="utf-8")
+
+        loaded = cli._load_videos_from_file(str(output_path))
+
+        assert [video.video_id for video in loaded] == ["challenge123", "music789"]
+
+    def test_invalid_classified_videos_are_skipped(self, cli, tmp_path, sample_classified_videos, caplog):
+        """Several bad rows are dropped in one validation pass"""
+        output_path = tmp_path / "classified.json"
+        cli._save_classified_videos_to_file(sample_classified_videos, str(output_path))
+        data = json.loads(output_path.read_text(encoding="utf-8"))
+        data["classified_videos"][0]["confidence"] = 2.0
+        data["classified_videos"][2]["category"] = "Unknown"
+        output_path.write_text(json.dumps(data), encoding="utf-8")
+
+        with caplog.at_level("WARNING", logger="src.cli"):
+            loaded = cli._load_classified_videos_from_file(str(output_path))
+
+        assert [video.video_id for video in loaded] == ["tips456"]
+        warnings = [r.getMessage() for r in caplog.records if r.levelname == "WARNING"]
+        assert len(warnings) == 1
+        assert "Skipped 2 invalid classified video rows at indices [0, 2]" in warnings[0]
+
+    def test_large_files_are_streamed(self, cli, tmp_path, sample_classified_videos, monkeypatch):
+        """Files above the threshold are validated chunk by chunk with the same result"""
+        pytest.importorskip("ijson")
+        output_path = tmp_path / "classified.json"
+        cli._save_classified_videos_to_file(sample_classified_videos, str(output_path))
+        data = json.loads(output_path.read_text(encoding="utf-8"))
+        data["classified_videos"][2]["confidence"] = 2.0
+        output_path.write_text(json.dumps(data), encoding="utf-8")
+        monkeypatch.setattr(cli_module, "_STREAM_THRESHOLD_BYTES", 0)
+        monkeypatch.setattr(cli_module, "_STREAM_CHUNK_SIZE", 2)
+
+        loaded = cli._load_classified_videos_from_file(str(output_path))
+
+        assert loaded == sample_classified_videos[:2]
+        assert isinstance(loaded[0].confidence, float)
+
+    def test_large_files_are_memory_mapped(self, cli, tmp_path, sample_classified_videos, monkeypatch):
+        """Files above the mmap threshold load the same rows"""
+        output_path = str(tmp_path / "classified.json")
+        cli._save_classified_videos_to_file(sample_classified_videos, output_path)
+        monkeypatch.setattr(cli_module, "_MMAP_THRESHOLD_BYTES", 0)
+        monkeypatch.setattr(cli_module, "_STREAM_THRESHOLD_BYTES", 1 << 30)
+
+        loaded = cli._load_classified_videos_from_file(output_path)
+
+        assert loaded == sample_classified_videos
+
+    def test_unchanged_file_parsed_once(self, cli, tmp_path, sample_classified_videos):
+        """Reloading an unchanged file reuses the parsed document until it is rewritten"""
+        output_path = str(tmp_path / "classified.json")
+        cli._save_classified_videos_to_file(sample_classified_videos, output_path)
+
+        first = cli_module._load_json_file(output_path)
+        second = cli_module._load_json_file(output_path)
+        cli._save_classified_videos_to_file(sample_classified_videos[:1], output_path)
+        third = cli_module._load_json_file(output_path)
+
+        assert second is first
+        assert third["total_videos"] == 1
+
+    def test_saved_rows_nested_in_envelope(self, cli, tmp_path, sample_classified_videos):
+        """Rows serialized by pydantic are indented inside the file envelope"""
+        output_path = tmp_path / "classified.json"
+
+        cli._save_classified_videos_to_file(sample_classified_videos, str(output_path))
+        cli._save_videos_to_file([], str(tmp_path / "empty.json"))
+
+        text = output_path.read_text(encoding="utf-8")
+        assert '\n  "classified_videos": [\n    {\n      "video_id": "challenge123"' in text
+        assert json.loads(text)["total_videos"] == 3
+        assert json.loads((tmp_path / "empty.json").read_text())["videos"] == []
+
+    def test_stdlib_fallback_matches_orjson(self, monkeypatch, sample_classified_video):
+        """Without orjson the stdlib encoder produces the same document"""
+        data = {"timestamp": sample_classified_video.published_at, "category": VideoCategory.CHALLENGE}
+        expected = json.loads(cli_module._dump_json(data))
+
+        monkeypatch.setattr(cli_module, "orjson", None)
+
+        assert json.loads(cli_module._dump_json(data)) == expected
+
+    def test_missing_file_raises(self, cli, tmp_path):
+        """A missing input file surfaces as FileNotFoundError for the commands"""
+        with pytest.raises(FileNotFoundError):
+            cli._load_videos_from_file(str(tmp_path / "missing.json"))
+
+
+class TestSaveQueryResults:
+    """Test suite for saving natural language query results"""
+
+    @pytest.mark.asyncio
+    async def test_save_json_results(self, cli, tmp_path, sample_classified_video):
+        """JSON results are written as UTF-8 with one row per video"""
+        response = Mock(
+            success=True,
+            total_found=1,
+            processing_time=0.5,
+            results=[sample_classified_video]
+        )
+        response.parsed_request.original_input = "댄스 챌린지"
+        output_path = tmp_path / "results.json"
+
+        await cli._save_query_results(response, str(output_path), "json")
+
+        data = json.loads(output_path.read_text(encoding="utf-8"))
+        assert data["query"] == "댄스 챌린지"
+        assert data["results"][0]["rank"] == 1
+        assert data["results"][0]["video_id"] == "abc123"
+        assert data["results"][0]["published_at"] == sample_classified_video.published_at.isoformat()
+
+    @pytest.mark.asyncio
+    async def test_display_json_results(self, cli, capsys, sample_classified_video):
+        """JSON results are written to stdout with datetimes encoded natively"""
+        fields = ("video_id", "title", "channel_title", "view_count", "confidence", "published_at")
+        video = Mock(has_video_analysis=False, **{
+            field: getattr(sample_classified_video, field) for field in fields
+        })
+        response = Mock(
+            success=True,
+            total_found=1,
+            processing_time=0.5,
+            results=[video]
+        )
+        response.parsed_request.original_input = "댄스 챌린지"
+
+        print("header")
+        await cli._display_json_results(response, argparse.Namespace())
+
+        header, body = capsys.readouterr().out.split("\n", 1)
+        data = json.loads(body)
+        assert header == "header"
+        assert data["query"] == "댄스 챌린지"
+        assert data["results"][0]["rank"] == 1
+        assert "analysis" not in data["results"][0]
+        assert data["results"][0]["published_at"] == sample_classified_video.published_at.isoformat()
+
+    @pytest.mark.asyncio
+    async def test_save_markdown_results(self, cli, tmp_path):
+        """Markdown results are written verbatim"""
+        response = Mock(detailed_report="# 결과\n")
+        output_path = tmp_path / "results.md"
+
+        await cli._save_query_results(response, str(output_path), "markdown")
+
+        assert output_path.read_text(encoding="utf-8") == "# 결과\n"
+
+
+class TestInteractiveChat:
+    """Test suite for the interactive chat loop"""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("last_input", ["quit", EOFError()])
+    async def test_questions_answered_until_exit(self, cli, tmp_path, monkeypatch, last_input):
+        """Each question is processed; quit or Ctrl+D ends the session"""
+        monkeypatch.setattr(cli, "CHAT_HISTORY_FILE", str(tmp_path / "history"))
+        args = argparse.Namespace()
+        query_service = Mock()
+
+        with patch("builtins.input", side_effect=["댄스 챌린지", "", last_input]), \
+             patch.object(cli, "_process_single_query", AsyncMock()) as process:
+            await cli._interactive_chat_mode(args, query_service)
+
+        process.assert_awaited_once_with("댄스 챌린지", args, query_service)
+
+    @pytest.mark.asyncio
+    async def test_query_service_shared_between_queries(self, cli):
+        """One-shot queries reuse the process-wide query service"""
+        cli_module._get_query_service.cache_clear()
+        args = argparse.Namespace(interactive=False, query="댄스")
+
+        with patch("src.services.natural_query_service.create_natural_query_service") as create, \
+             patch.object(cli, "_process_single_query", AsyncMock()) as process:
+            await cli.chat_command(args)
+            await cli.chat_command(args)
+        cli_module._get_query_service.cache_clear()
+
+        create.assert_called_once()
+        assert process.await_args.args[2] is create.return_value
+
+    @pytest.mark.asyncio
+    async def test_read_line_does_not_block_loop(self):
+        """The event loop keeps running while a prompt waits for input"""
+        answered = asyncio.Event()
+
+        def slow_input(prompt):
+            asyncio.run_coroutine_threadsafe(answered.wait(), loop).result()
+            return "done"
+
+        loop = asyncio.get_running_loop()
+        with patch("builtins.input", side_effect=slow_input):
+            reader = asyncio.create_task(YouTubeTrendsCLI._read_line("> "))
+            await asyncio.sleep(0.01)
+            answered.set()
+            line = await reader
+
+        assert line == "done"
+
+
+class TestCollectCommand:
+    """Test suite for the collect command"""
+
+    @pytest.mark.asyncio
+    async def test_collects_with_own_collector(self, cli, sample_youtube_videos):
+        """The command opens a collector, uses it and closes it"""
+        collector = Mock()
+        collector.collect_by_category_keywords = AsyncMock(return_value=sample_youtube_videos)
+        collector.get_collection_stats.return_value = {"quota_used": 101}
+        collector.__aenter__ = AsyncMock(return_value=collector)
+        collector.__aexit__ = AsyncMock(return_value=False)
+        args = argparse.Namespace(
+            categories="dance, fitness",
+            max_per_category=10,
+            days=7,
+            top_n=5,
+            region="US",
+            output="unused.json"
+        )
+
+        with patch("src.agents.collector_agent.create_collector_agent", return_value=collector):
+            videos = await cli.collect_command(args, save=False)
+
+        assert videos == sample_youtube_videos
+        collector.__aexit__.assert_awaited_once()
+        assert collector.collect_by_category_keywords.await_args.kwargs["categories"] == ["dance", "fitness"]
+
+
+class TestShutdown:
+    """Test suite for signal-driven shutdown"""
+
+    @pytest.mark.asyncio
+    async def test_tracked_task_cancelled_on_shutdown(self, cli):
+        """Setting the shutdown event cancels the running task"""
+        cli._shutdown_event = asyncio.Event()
+        started = asyncio.Event()
+
+        async def long_running():
+            started.set()
+            await asyncio.sleep(10)
+
+        tracked = asyncio.ensure_future(cli._handle_task_with_tracking(long_running()))
+        await started.wait()
+        cli._shutdown_event.set()
+
+        with pytest.raises(asyncio.CancelledError):
+            await tracked
+        assert cli.shutdown_requested is True
+
+    @pytest.mark.asyncio
+    async def test_tracked_task_result_returned(self, cli):
+        """Without a shutdown request the coroutine result is passed through"""
+        cli._shutdown_event = asyncio.Event()
+
+        async def compute():
+            return 42
+
+        assert await cli._handle_task_with_tracking(compute()) == 42
+        assert cli.shutdown_requested is False
+
+
+class TestPipelineCommand:
+    """Test suite for the collect -> analyze -> report pipeline"""
+
+    @staticmethod
+    def _matching_video(video_id):
+        """Classified video that passes the pipeline's dance challenge filter"""
+        video = Mock(
+            category=VideoCategory.CHALLENGE,
+            has_video_analysis=True,
+            challenge_type_detailed=ChallengeType.DANCE,
+            title=f"Dance {video_id}"
+        )
+        video.enhanced_analysis.accessibility_analysis.easy_to_follow = True
+        return video
+
+    @pytest.mark.asyncio
+    async def test_stops_collecting_once_target_reached(self, cli):
+        """Collection overlaps classification and stops when enough videos match"""
+        attempts = 0
+
+        async def collect(**kwargs):
+            nonlocal attempts
+            attempts += 1
+            await asyncio.sleep(0.05)
+            return [Mock(video_id=f"video_{attempts}")]
+
+        async def classify(videos, include_video_content, video_content_categories):
+            await asyncio.sleep(0.01)
+            return [self._matching_video(video.video_id) for video in videos]
+
+        collector = Mock()
+        collector.collect_by_category_keywords = collect
+        collector.__aenter__ = AsyncMock(return_value=collector)
+        collector.__aexit__ = AsyncMock(return_value=None)
+        analyzer = Mock()
+        analyzer.classify_videos_with_enhanced_analysis = AsyncMock(side_effect=classify)
+        cli._analyzer = analyzer
+        args = argparse.Namespace(top_n=2, days=7, region="US", include_video_content=True)
+
+        with patch("src.agents.collector_agent.create_collector_agent", return_value=collector), \
+             patch.object(cli, "_save_classified_videos_to_file") as save, \
+             patch.object(cli, "report_command", AsyncMock()) as report:
+            await cli.pipeline_command(args)
+
+        final_videos = save.call_args.args[0]
+        assert len(final_videos) == 2
+        assert analyzer.classify_videos_with_enhanced_analysis.await_count == 2
+        # The third collection overlaps the second classification and is cancelled
+        assert attempts == 3
+        assert report.await_args.kwargs["classified_videos"] is final_videos
+        assert report.await_args.args[0] == cli_module.ReportArgs(
+            input="classified_videos.json",
+            category=VideoCategory.CHALLENGE.value,
+            output="trend_report.json",
+            format="text"
+        )
+        classify_kwargs = analyzer.classify_videos_with_enhanced_analysis.await_args.kwargs
+        assert classify_kwargs["video_content_categories"] == {VideoCategory.CHALLENGE}
+
+    @pytest.mark.asyncio
+    async def test_collection_error_surfaces_unwrapped(self, cli):
+        """A failing stage raises its own error rather than an ExceptionGroup"""
+        collector = Mock()
+        collector.collect_by_category_keywords = AsyncMock(side_effect=QuotaExceededError("daily quota used"))
+        collector.__aenter__ = AsyncMock(return_value=collector)
+        collector.__aexit__ = AsyncMock(return_value=None)
+        cli._analyzer = Mock()
+        args = argparse.Namespace(top_n=2, days=7, region="US", include_video_content=True)
+
+        with patch("src.agents.collector_agent.create_collector_agent", return_value=collector), \
+             pytest.raises(QuotaExceededError, match="daily quota used"):
+            await cli.pipeline_command(args)
+
+
+class TestParser:
+    """Test suite for the argument parser"""
+
+    def test_parser_is_built_once(self, cli):
+        """Repeated calls reuse the same parser"""
+        assert cli.create_parser() is cli.create_parser()
+
+    def test_analyze_arguments(self, cli):
+        """The analyze subcommand parses its options"""
+        args = cli.create_parser().parse_args(["analyze", "--concurrency", "8"])
+
+        assert args.command == "analyze"
+        assert args.concurrency == 8
+        assert args.input == "collected_videos.json"
+
+
+class TestReportCommand:
+    """Test suite for the report command"""
+
+    @pytest.mark.asyncio
+    async def test_report_uses_in_memory_videos(self, cli, tmp_path, sample_classified_videos):
+        """Videos passed by the pipeline are reported without reading the input file"""
+        analyzer = Mock()
+        analyzer.generate_comprehensive_analysis.return_value = Mock()
+        args = argparse.Namespace(
+            input=str(tmp_path / "missing.json"),
+            category=None,
+            output=str(tmp_path / "report.json"),
+            format="text"
+        )
+
+        with patch("src.agents.analyzer_agent.create_analyzer_agent", return_value=analyzer), \
+             patch.object(cli, "_display_comprehensive_analysis"):
+            report = await cli.report_command(args, classified_videos=sample_classified_videos)
+
+        assert report is analyzer.generate_comprehensive_analysis.return_value
+        analyzer.generate_comprehensive_analysis.assert_called_once_with(sample_classified_videos)
+
+    def test_analyzer_created_once(self, cli):
+        """Commands share a single analyzer agent"""
+        with patch("src.agents.analyzer_agent.create_analyzer_agent", side_effect=lambda: Mock()) as create:
+            first = cli._get_analyzer()
+            second = cli._get_analyzer()
+
+        assert first is second
+        create.assert_called_once()
+
+
+class TestAnalyzeCommand:
+    """Test suite for the analyze command"""
+
+    @pytest.mark.asyncio
+    async def test_cached_classifications_reused(self, cli, tmp_path, sample_youtube_videos):
+        """A second run only sends uncached videos to the analyzer"""
+        def classify(videos, **kwargs):
+            return [
+                EnhancedClassifiedVideo(
+                    video_id=video.video_id,
+                    title=video.snippet.title,
+                    category=VideoCategory.CHALLENGE,
+                    confidence=0.9,
+                    reasoning="test",
+                    published_at=video.snippet.published_at
+                )
+                for video in videos
+            ]
+
+        analyzer = Mock()
+        analyzer.llm_provider.model_used = "openai/gpt-4o-mini"
+        analyzer.classify_videos_with_enhanced_analysis = AsyncMock(side_effect=classify)
+        analyzer.get_analysis_stats.return_value = {}
+        args = argparse.Namespace(
+            concurrency=1, no_cache=False, cache_dir=str(tmp_path), output=None
+        )
+
+        with patch("src.agents.analyzer_agent.create_analyzer_agent", return_value=analyzer), \
+             patch.object(cli, "_show_progress"):
+            first = await cli.analyze_command(args, videos=sample_youtube_videos[:1], save=False)
+            second = await cli.analyze_command(args, videos=sample_youtube_videos, save=False)
+
+        assert [v.video_id for v in second] == [v.video_id for v in sample_youtube_videos]
+        assert second[0] == first[0]
+        retried = analyzer.classify_videos_with_enhanced_analysis.await_args_list[1].args[0]
+        assert retried == sample_youtube_videos[1:]
+
+
+class TestDisplayHelpers:
+    """Test suite for the text rendering helpers"""
+
+    @pytest.mark.asyncio
+    async def test_text_results_written_once(self, cli, capsys):
+        """The whole listing is emitted in a single write"""
+        video = Mock(
+            title="Dance", channel_title="Channel", view_count=1200,
+            confidence=0.9, video_id="abc123", has_video_analysis=False
+        )
+        response = Mock(
+            parsed_request=None, total_found=1, processing_time=0.25,
+            summary="", results=[video]
+        )
+
+        with patch.object(cli_module.sys.stdout, "write", wraps=cli_module.sys.stdout.write) as write:
+            await cli._display_text_results(response, argparse.Namespace())
+
+        output = capsys.readouterr().out
+        write.assert_called_once()
+        assert "1. Dance" in output
+        assert "👀 조회수: 1,200회" in output
+        assert output.endswith("\n\n")
+
+    def test_health_status_icons(self, cli, capsys):
+        """Overall and per-check statuses get their icons"""
+        from src.core.health import HealthStatus
+
+        with patch.object(cli_module.sys.stdout, "write", wraps=cli_module.sys.stdout.write) as write:
+            cli._display_health_status({
+                'status': 'degraded',
+                'timestamp': '2024-01-15T10:00:00',
+                'summary': {'total_checks': 2, 'healthy': 1, 'degraded': 1, 'unhealthy': 0},
+                'checks': [
+                    {'name': 'settings', 'status': HealthStatus.HEALTHY, 'message': 'ok', 'response_time': 0.5},
+                    {'name': 'youtube', 'status': HealthStatus.DEGRADED, 'message': 'slow', 'response_time': None}
+                ]
+            })
+
+        output = capsys.readouterr().out
+        write.assert_called_once()
+        assert output.startswith("⚠️  System Status: DEGRADED\n")
+        assert "   ✅ settings: ok\n      Response time: 0.50s\n" in output
+        assert "   ⚠️  youtube: slow\n" in output
+        assert "❓" not in output
+
+    def test_format_timestamp_matches_strftime(self):
+        """Timestamps render exactly as the old strftime format did"""
+        value = datetime(2024, 1, 5, 7, 3, 9, 123456)
+
+        assert cli_module._format_timestamp(value) == value.strftime('%Y-%m-%d %H:%M:%S')
+
+
+class TestShowProgress:
+    """Test suite for the progress bar"""
+
+    def test_redraws_are_throttled(self, cli, capsys):
+        """Small, rapid updates are skipped but the final state is drawn"""
+        for current in range(1001):
+            cli._show_progress("Classification", current, 1000)
+
+        output = capsys.readouterr().out
+        assert output.count("\r") < 1001
+        assert output.endswith("100.0% (1000/1000)")
+
+    def test_bar_clamped_past_total(self, cli, capsys):
+        """Overshooting the total draws a full bar instead of failing"""
+        cli._show_progress("Classification", 12, 10)
+
+        assert f"|{'█' * 30}| 120.0% (12/10)" in capsys.readouterr().out
+
+    def test_first_update_always_drawn(self, cli, capsys):
+        """The initial 0% bar is shown immediately"""
+        cli._show_progress("Classification", 0, 10)
+
+        assert "0.0% (0/10)" in capsys.readouterr().out
+
+
+class TestMain:
+    """Test suite for the CLI entry point"""
+
+    @pytest.mark.asyncio
+    async def test_dispatches_to_command(self):
+        """The subcommand name selects the handler"""
+        handler = AsyncMock()
+
+        async def run_tracked(coro):
+            return await coro
+
+        with patch.dict(cli_module.COMMANDS, {"report": handler}), \
+             patch.object(cli_module, "YouTubeTrendsCLI") as cli_cls:
+            cli_cls.return_value._handle_task_with_tracking = run_tracked
+            await cli_module.main(["report", "--format", "json"])
+
+        cli_instance, args = handler.await_args.args
+        assert cli_instance is cli_cls.return_value
+        assert args.format == "json"
+
+    @pytest.mark.asyncio
+    async def test_failed_command_flushes_logging(self):
+        """Logging is shut down on the exit path, even when the command fails"""
+        async def run_tracked(coro):
+            return await coro
+
+        with patch.dict(cli_module.COMMANDS, {"report": AsyncMock(side_effect=RuntimeError("boom"))}), \
+             patch.object(cli_module, "YouTubeTrendsCLI") as cli_cls, \
+             patch.object(cli_module, "shutdown_logging") as shutdown, \
+             pytest.raises(SystemExit):
+            cli_cls.return_value._handle_task_with_tracking = run_tracked
+            await cli_module.main(["report"])
+
+        shutdown.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_unhealthy_health_check_exit_code(self, capsys):
+        """An unhealthy check exits with status 1 instead of looking cancelled"""
+        health_status = {"status": "unhealthy", "timestamp": "2024-01-15T10:00:00", "checks": {}}
+
+        def setup_signal_handlers(self):
+            self._shutdown_event = asyncio.Event()
+
+        with patch.object(YouTubeTrendsCLI, "_setup_signal_handlers", setup_signal_handlers), \
+             patch("src.core.health.check_health", AsyncMock(return_value=health_status)), \
+             patch.object(cli_module, "shutdown_logging"), \
+             patch.object(cli_module.atexit, "register"), \
+             pytest.raises(SystemExit) as exit_info:
+            await cli_module.main(["health", "--format", "json"])
+
+        out = capsys.readouterr().out
+        assert exit_info.value.code == 1
+        assert json.loads(out)["status"] == "unhealthy"
+        assert "cancelled" not in out
+
+    @pytest.mark.asyncio
+    async def test_help_skips_cli_setup(self):
+        """--help exits before settings and signal handlers are set up"""
+        with patch.object(cli_module, "YouTubeTrendsCLI") as cli_cls, \
+             pytest.raises(SystemExit):
+            await cli_module.main(["--help"])
+
+        cli_cls.assert_not_called()
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("argv, quiet", [
+        (["--quiet", "report"], True),
+        (["health", "--format", "json"], True),
+        (["chat", "--output-format", "json", "hi"], True),
+        (["report", "--format", "json"], False),
+    ])
+    async def test_quiet_mode(self, monkeypatch, capsys, argv, quiet):
+        """--quiet and JSON written to stdout silence status lines"""
+        monkeypatch.setattr(cli_module, "_status", print)
+
+        async def run_tracked(coro):
+            return await coro
+
+        with patch.dict(cli_module.COMMANDS, {name: AsyncMock() for name in cli_module.COMMANDS}), \
+             patch.object(cli_module, "YouTubeTrendsCLI") as cli_cls:
+            cli_cls.return_value._handle_task_with_tracking = run_tracked
+            await cli_module.main(argv)
+        cli_module._status("status line")
+
+        assert (capsys.readouterr().out == "") is quiet
@@ -1,5 +1,6 @@
 """Tests for data collection agent"""
 
+import asyncio
 import pytest
 from unittest.mock import Mock, AsyncMock, patch
 from datetime import datetime
@@ -141,6 +142,59 @@ class TestCollectorAgent:
         assert len(result) == len(sample_youtube_videos)
         assert mock_youtube_client.search_trending_shorts.call_count == 2
     
+    @pytest.mark.asyncio
+    async def test_collect_top_videos_concurrent_queries(self, collector_agent, mock_youtube_client, sample_youtube_videos):
+        """Test queries run concurrently within the limit and merge in query order"""
+        in_flight = 0
+        peak = 0
+        
+        async def search(query, **kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            # Reason: the first query finishes last to check result ordering
+            await asyncio.sleep(0.02 if query == "dance" else 0.01)
+            in_flight -= 1
+            return [sample_youtube_videos[0]] if query == "dance" else sample_youtube_videos
+        
+        mock_youtube_client.search_trending_shorts.side_effect = search
+        mock_youtube_client.get_quota_usage.return_value = 100
+        
+        with patch.object(collector_agent.settings, "max_concurrent_api_calls", 2):
+            result = await collector_agent.collect_top_videos(
+                search_queries=["dance", "fitness", "tutorial"],
+                top_n=10
+            )
+        
+        assert peak == 2
+        assert mock_youtube_client.search_trending_shorts.call_count == 3
+        assert {v.video_id for v in result} == {v.video_id for v in sample_youtube_videos}
+    
+    @pytest.mark.asyncio
+    async def test_collect_top_videos_concurrent_quota_edge(self, collector_agent, mock_youtube_client, sample_youtube_videos):
+        """Test in-flight searches reserve quota so concurrency cannot overshoot the limit"""
+        quota_used = 9800
+        
+        async def search(query, **kwargs):
+            nonlocal quota_used
+            await asyncio.sleep(0.01)
+            # Reason: like YouTubeClient, usage is only counted once the response arrives
+            quota_used += 100
+            return sample_youtube_videos
+        
+        mock_youtube_client.search_trending_shorts.side_effect = search
+        mock_youtube_client.get_quota_usage.side_effect = lambda: quota_used
+        collector_agent.settings.max_daily_quota = 10000
+        
+        with patch.object(collector_agent.settings, "max_concurrent_api_calls", 4):
+            await collector_agent.collect_top_videos(
+                search_queries=["dance", "fitness", "tutorial", "comedy"],
+                top_n=10
+            )
+        
+        assert mock_youtube_client.search_trending_shorts.call_count == 2
+        assert quota_used == 10000
+    
     @pytest.mark.asyncio
     async def test_collect_by_request(self, collector_agent, mock_youtube_client, sample_youtube_videos):
         """Test collection using structured request"""
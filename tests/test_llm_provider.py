@@ -1,13 +1,19 @@
 """Comprehensive tests for LLM provider with batch processing and retry logic"""
 
+import asyncio
 import pytest
 from unittest.mock import Mock, AsyncMock, patch
 from datetime import datetime
+from cachetools import LRUCache
+from google.api_core import exceptions as google_exceptions
 
-from src.clients.llm_provider import LLMProvider, ClassificationResult
+from src.clients.llm_provider import (
+    LLMProvider, ClassificationResult, PROMPT_VERSION, RESULT_CACHE_SIZE, _is_retryable_error
+)
 from src.models.video_models import VideoCategory, YouTubeVideoRaw, VideoSnippet, VideoStatistics
 from src.models.classification_models import ClassificationResponse
-from src.core.exceptions import ClassificationError
+from src.core.exceptions import ClassificationError, LLMProviderError
+from src.core.rate_limiter import AsyncTokenBucket
 
 
 class TestLLMProviderBatching:
@@ -402,4 +408,404 @@ class TestLLMProviderBatching:
         
         # Should be truncated with ellipsis
         assert "A" * 200 + "..." in prompt
-        assert len([line for line in prompt.split('\n') if 'Description:' in line][0]) < 250
\ No newline at end of file
+        assert len([line for line in prompt.split('\n') if 'Description:' in line][0]) < 250
+
+class TestLLMProviderSetup:
+    """Test provider internals on instances built without a live agent"""
+    
+    @pytest.fixture
+    def sample_videos_factory(self):
+        """Build numbered sample videos"""
+        def build(count: int):
+            return [
+                YouTubeVideoRaw(
+                    video_id=f"video_{i+1}",
+                    snippet=VideoSnippet(
+                        title=f"Test Video {i+1}",
+                        description="",
+                        published_at=datetime.now(),
+                        channel_title="Test Channel",
+                        thumbnail_url="https://example.com/thumb.jpg"
+                    )
+                )
+                for i in range(count)
+            ]
+        return build
+    
+    @staticmethod
+    def _bare_provider(provider_name: str, model_name: str) -> LLMProvider:
+        """Build a provider without running __init__ (no agent is created)"""
+        provider = LLMProvider.__new__(LLMProvider)
+        provider.provider_name = provider_name
+        provider.model_name = model_name
+        provider.model_used = f"{provider_name}/{model_name}"
+        provider._result_cache = LRUCache(maxsize=RESULT_CACHE_SIZE)
+        provider.rate_limiter = AsyncTokenBucket(rate=1000, capacity=1000)
+        provider._redis = None
+        provider.settings = Mock(
+            llm_max_concurrency=8, classification_cache_ttl=60, llm_keyword_prefilter=False,
+            max_retry_delay=60.0
+        )
+        return provider
+    
+    @pytest.mark.parametrize("provider_name,expected", [
+        ("google-generativeai", "gemini-1.5-flash"),
+        ("openai", "openai:gemini-1.5-flash"),
+        ("anthropic", "anthropic:gemini-1.5-flash"),
+    ])
+    def test_resolve_model_string(self, provider_name, expected):
+        """Each supported provider maps to its pydantic-ai model string"""
+        provider = self._bare_provider(provider_name, "gemini-1.5-flash")
+        
+        assert provider._resolve_model_string() == expected
+    
+    def test_resolve_model_string_unsupported(self):
+        """Unknown providers are rejected"""
+        provider = self._bare_provider("gemini", "gemini-1.5-flash")
+        
+        with pytest.raises(LLMProviderError):
+            provider._resolve_model_string()
+    
+    def test_classification_prompt_is_shared(self):
+        """Every call returns the same module-level prompt object"""
+        first = self._bare_provider("openai", "gpt-4o-mini")._get_classification_prompt()
+        second = self._bare_provider("anthropic", "claude")._get_classification_prompt()
+        
+        assert first is second
+        assert "CLASSIFICATION CATEGORIES" in first
+    
+    def test_classification_input_truncates_description(self):
+        """Long descriptions are cut to 500 characters in the per-video input"""
+        provider = self._bare_provider("openai", "gpt-4o-mini")
+        video = YouTubeVideoRaw(
+            video_id="test_video",
+            snippet=VideoSnippet(
+                title="100% Dance",
+                description="A" * 600,
+                published_at=datetime.now(),
+                channel_title="Test Channel",
+                thumbnail_url="https://example.com/thumb.jpg"
+            )
+        )
+        
+        input_text = provider._prepare_classification_input(video)
+        
+        assert "Title: 100% Dance\nChannel: Test Channel\n" in input_text
+        assert "Description: " + "A" * 500 + "...\n" in input_text
+    
+    @pytest.mark.asyncio
+    async def test_classify_videos_batch_bounded_concurrency(self):
+        """Videos are classified concurrently up to the limit, in input order, skipping failures"""
+        provider = self._bare_provider("openai", "gpt-4o-mini")
+        in_flight = 0
+        peak = 0
+        
+        async def classify_video(video):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            if video.video_id == "video_3":
+                raise ClassificationError("failed")
+            return video.video_id
+        
+        provider.classify_video = classify_video
+        videos = [Mock(video_id=f"video_{i}") for i in range(6)]
+        
+        results = await provider.classify_videos_batch(videos, max_concurrency=2)
+        
+        assert results == ["video_0", "video_1", "video_2", "video_4", "video_5"]
+        assert peak == 2
+        
+        # Without an explicit limit the llm_max_concurrency setting applies
+        peak = 0
+        provider.settings.llm_max_concurrency = 3
+        await provider.classify_videos_batch(videos)
+        assert peak == 3
+    
+    @pytest.mark.asyncio
+    async def test_classify_video_reuses_cached_result(self):
+        """A video already classified by this model skips the agent call"""
+        provider = self._bare_provider("openai", "gpt-4o-mini")
+        provider.classification_agent = AsyncMock()
+        provider.classification_agent.run.return_value = Mock(data=ClassificationResult(
+            category=VideoCategory.CHALLENGE, confidence=0.9, reasoning="Dance", keywords=[]
+        ))
+        video = YouTubeVideoRaw(
+            video_id="test_video",
+            snippet=VideoSnippet(
+                title="Dance Challenge",
+                description="",
+                published_at=datetime.now(),
+                channel_title="Test Channel",
+                thumbnail_url="https://example.com/thumb.jpg"
+            )
+        )
+        
+        first = await provider.classify_video(video)
+        second = await provider.classify_video(video)
+        
+        assert second is first
+        assert first.model_used == "openai/gpt-4o-mini"
+        provider.classification_agent.run.assert_awaited_once()
+    
+    @pytest.mark.asyncio
+    async def test_batch_optimized_runs_batches_concurrently(self, sample_videos_factory):
+        """Batch prompts overlap up to the configured limit and results keep input order"""
+        provider = self._bare_provider("openai", "gpt-4o-mini")
+        provider.settings.llm_max_concurrency = 2
+        in_flight = 0
+        peak = 0
+        
+        async def run(prompt, deps):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return Mock(data=prompt)
+        
+        provider.classification_agent = Mock(run=run)
+        provider._parse_batch_classification_result = lambda data, batch: [v.video_id for v in batch]
+        videos = sample_videos_factory(7)
+        
+        results = await provider.classify_videos_batch_optimized(videos, batch_size=2)
+        
+        assert results == [v.video_id for v in videos]
+        assert peak == 2
+    
+    @pytest.mark.asyncio
+    async def test_batch_optimized_failure_cancels_other_batches(self, sample_videos_factory):
+        """A failing batch raises ClassificationError and stops the batches still running"""
+        provider = self._bare_provider("openai", "gpt-4o-mini")
+        provider.settings.llm_max_concurrency = 4
+        cancelled = []
+        
+        async def run(prompt, deps):
+            if deps.video.video_id == "video_1":
+                raise ValueError("bad response")
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.append(deps.video.video_id)
+                raise
+        
+        provider.classification_agent = Mock(run=run)
+        
+        with pytest.raises(ClassificationError):
+            await provider.classify_videos_batch_optimized(sample_videos_factory(4), batch_size=1)
+        await asyncio.sleep(0)
+        
+        assert sorted(cancelled) == ["video_2", "video_3", "video_4"]
+    
+    @pytest.mark.asyncio
+    async def test_classify_video_uses_shared_cache(self, sample_videos_factory):
+        """Redis hits skip the agent; fresh results are written back with the TTL"""
+        provider = self._bare_provider("openai", "gpt-4o-mini")
+        provider.classification_agent = AsyncMock()
+        provider.classification_agent.run.return_value = Mock(data=ClassificationResult(
+            category=VideoCategory.CHALLENGE, confidence=0.9, reasoning="Dance", keywords=[]
+        ))
+        store = {}
+        provider._redis = Mock(
+            get=AsyncMock(side_effect=lambda key: store.get(key)),
+            set=AsyncMock(side_effect=lambda key, value, ex: store.__setitem__(key, value))
+        )
+        video = sample_videos_factory(1)[0]
+        
+        fresh = await provider.classify_video(video)
+        provider._result_cache.clear()
+        cached = await provider.classify_video(video)
+        
+        assert cached == fresh
+        provider.classification_agent.run.assert_awaited_once()
+        key = f"cls:gpt-4o-mini:{PROMPT_VERSION}:video_1"
+        provider._redis.set.assert_awaited_once_with(key, fresh.model_dump_json(), ex=60)
+    
+    @pytest.mark.asyncio
+    async def test_shared_cache_errors_fall_back_to_llm(self, sample_videos_factory):
+        """An unreachable Redis does not fail classification"""
+        provider = self._bare_provider("openai", "gpt-4o-mini")
+        provider.classification_agent = AsyncMock()
+        provider.classification_agent.run.return_value = Mock(data=ClassificationResult(
+            category=VideoCategory.CHALLENGE, confidence=0.9, reasoning="Dance", keywords=[]
+        ))
+        provider._redis = Mock(
+            get=AsyncMock(side_effect=ConnectionError("down")),
+            set=AsyncMock(side_effect=ConnectionError("down"))
+        )
+        
+        response = await provider.classify_video(sample_videos_factory(1)[0])
+        
+        assert response.category == VideoCategory.CHALLENGE
+    
+    @pytest.mark.asyncio
+    async def test_shared_cache_bad_payload_falls_back_to_llm(self, sample_videos_factory):
+        """A corrupt cached entry is deleted and the video is classified live"""
+        provider = self._bare_provider("openai", "gpt-4o-mini")
+        provider.classification_agent = AsyncMock()
+        provider.classification_agent.run.return_value = Mock(data=ClassificationResult(
+            category=VideoCategory.CHALLENGE, confidence=0.9, reasoning="Dance", keywords=[]
+        ))
+        provider._redis = Mock(
+            get=AsyncMock(return_value=b'{"video_id": "video_1", "categ'),
+            set=AsyncMock(),
+            delete=AsyncMock()
+        )
+        
+        response = await provider.classify_video(sample_videos_factory(1)[0])
+        
+        assert response.confidence == 0.9
+        provider.classification_agent.run.assert_awaited_once()
+        key = f"cls:gpt-4o-mini:{PROMPT_VERSION}:video_1"
+        provider._redis.delete.assert_awaited_once_with(key)
+    
+    def test_batch_result_beyond_twenty_videos(self, sample_videos_factory):
+        """Batch results are not capped at a fixed number of video fields"""
+        provider = self._bare_provider("openai", "gpt-4o-mini")
+        videos = sample_videos_factory(25)
+        result = ClassificationResult.model_validate({
+            f"video_{i}": {"category": "Info/Advice", "confidence": 0.8, "reasoning": "Tutorial"}
+            for i in range(1, 26)
+        })
+        
+        responses = provider._parse_batch_classification_result(result, videos)
+        
+        assert [r.video_id for r in responses] == [v.video_id for v in videos]
+        assert responses[24].category == VideoCategory.INFO_ADVICE
+        assert responses[24].confidence == 0.8
+    
+    @pytest.mark.parametrize("category", ["Dance", ["Challenge"], None])
+    def test_batch_result_invalid_category_falls_back(self, sample_videos_factory, category):
+        """Unknown or non-string categories become Challenge without failing the batch"""
+        provider = self._bare_provider("openai", "gpt-4o-mini")
+        result = ClassificationResult.model_validate({
+            "video_1": {"category": category, "confidence": 0.7, "reasoning": "Unclear"}
+        })
+        
+        responses = provider._parse_batch_classification_result(result, sample_videos_factory(1))
+        
+        assert responses[0].category == VideoCategory.CHALLENGE
+        assert responses[0].confidence == 0.7
+    
+    def test_batch_result_malformed_entries_fall_back_per_video(self, sample_videos_factory):
+        """Malformed video entries get a fallback without discarding the valid ones"""
+        provider = self._bare_provider("openai", "gpt-4o-mini")
+        result = ClassificationResult.model_validate({
+            "video_1": "Challenge",
+            "video_2": {"category": "Challenge", "confidence": None, "reasoning": "Null"},
+            "video_3": {"category": "Challenge", "confidence": "high", "reasoning": "Text"},
+            "video_4": {"category": "Info/Advice", "confidence": 0.9, "reasoning": "Tutorial"}
+        })
+        
+        responses = provider._parse_batch_classification_result(result, sample_videos_factory(4))
+        
+        assert [r.video_id for r in responses] == ["video_1", "video_2", "video_3", "video_4"]
+        assert [r.reasoning for r in responses[:3]] == ["Fallback classification due to parsing error"] * 3
+        assert responses[3].category == VideoCategory.INFO_ADVICE
+        assert responses[3].confidence == 0.9
+    
+    def test_pack_batches_by_count_and_prompt_size(self, sample_videos_factory):
+        """Batches close at the count cap or when the token budget would be exceeded"""
+        provider = self._bare_provider("openai", "gpt-4o-mini")
+        short = sample_videos_factory(7)
+        long = sample_videos_factory(3)
+        for video in long:
+            video.snippet.title = "T" * 16000  # ~4000 tokens each
+        
+        assert [len(b) for b in provider._pack_batches(short, 3)] == [3, 3, 1]
+        assert [len(b) for b in provider._pack_batches(long, 50)] == [1, 1, 1]
+        assert [v for b in provider._pack_batches(short, 50) for v in b] == short
+
+    
+    @pytest.mark.asyncio
+    async def test_video_analysis_does_not_block_loop(self):
+        """Gemini video analysis awaits the async SDK call"""
+        provider = self._bare_provider("google-generativeai", "gemini-1.5-flash")
+        provider.video_analysis_model = Mock()
+        provider.video_analysis_model.generate_content_async = AsyncMock(return_value=Mock(text="Dance challenge"))
+        
+        result = await provider.analyze_youtube_video("abc123", analysis_type="quick")
+        
+        assert result["content"] == "Dance challenge"
+        assert result["success"] is True
+        provider.video_analysis_model.generate_content.assert_not_called()
+    
+    @pytest.mark.parametrize("title,expected", [
+        ("Viral dance challenge", VideoCategory.CHALLENGE),
+        ("How to cook rice: a quick tutorial with tips", VideoCategory.INFO_ADVICE),
+        ("Piano cover of my favourite song", VideoCategory.TRENDING_SOUNDS),
+        ("Dance tutorial", None),
+        ("Trap showcase", None),
+    ])
+    def test_fast_classify(self, sample_videos_factory, title, expected):
+        """Only a clear whole-word keyword lead skips the LLM"""
+        provider = self._bare_provider("openai", "gpt-4o-mini")
+        video = sample_videos_factory(1)[0]
+        video.snippet.title = title
+        
+        response = provider._fast_classify(video)
+        
+        if expected is None:
+            assert response is None
+        else:
+            assert response.category == expected
+            assert response.confidence == 0.85
+    
+    @pytest.mark.asyncio
+    async def test_batch_optimized_prefilter_skips_llm(self, sample_videos_factory):
+        """Keyword-classified videos are left out of the LLM batches but keep their position"""
+        provider = self._bare_provider("openai", "gpt-4o-mini")
+        provider.settings.llm_keyword_prefilter = True
+        videos = sample_videos_factory(3)
+        videos[1].snippet.title = "Viral dance challenge"
+        sent = []
+        
+        async def run(prompt, deps):
+            return Mock(data=prompt)
+        
+        def parse(data, batch):
+            sent.extend(v.video_id for v in batch)
+            return [
+                ClassificationResponse(
+                    video_id=v.video_id, category=VideoCategory.INFO_ADVICE, confidence=0.7,
+                    reasoning="LLM", alternative_categories=[], model_used="openai/gpt-4o-mini",
+                    processing_time=0.0
+                )
+                for v in batch
+            ]
+        
+        provider.classification_agent = Mock(run=run)
+        provider._parse_batch_classification_result = parse
+        
+        results = await provider.classify_videos_batch_optimized(videos)
+        
+        assert sent == ["video_1", "video_3"]
+        assert [r.video_id for r in results] == ["video_1", "video_2", "video_3"]
+        assert results[1].model_used == "keyword-prefilter"
+
+
+def _status_error(status_code: int, message: str = "error") -> Exception:
+    """Build an SDK-style exception carrying an HTTP status code"""
+    error = Exception(message)
+    error.status_code = status_code
+    return error
+
+
+class TestRetryableErrors:
+    """Test classification of provider failures for retry"""
+    
+    @pytest.mark.parametrize("error,expected", [
+        (google_exceptions.ServiceUnavailable("down"), True),
+        (google_exceptions.ResourceExhausted("quota"), True),
+        (google_exceptions.InvalidArgument("bad request"), False),
+        (_status_error(429), True),
+        (_status_error(503), True),
+        (_status_error(400, "video 503 not found"), False),
+        (Exception("503 Service Unavailable"), True),
+        (ValueError("invalid JSON"), False),
+    ])
+    def test_is_retryable_error(self, error, expected):
+        """HTTP status decides when present; the message is only a fallback"""
+        assert _is_retryable_error(error) is expected
@@ -0,0 +1,188 @@
+"""Tests for the custom FastAPI middleware"""
+
+import pytest
+from collections import deque
+from cachetools import TTLCache
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from src.api.middleware import (
+    RateLimitMiddleware, RequestLoggingMiddleware, SecurityHeadersMiddleware
+)
+
+
+def _build_app(middleware_cls, **options) -> FastAPI:
+    """Create a minimal app wrapped by a single middleware"""
+    app = FastAPI()
+
+    @app.get("/ping")
+    async def ping():
+        return {"ok": True}
+
+    @app.get("/boom")
+    async def boom():
+        raise RuntimeError("kaboom")
+
+    app.add_middleware(middleware_cls, **options)
+    return app
+
+
+class TestRequestLoggingMiddleware:
+    """Test suite for RequestLoggingMiddleware"""
+
+    def test_adds_process_time_header(self):
+        """Successful responses carry the X-Process-Time header"""
+        client = TestClient(_build_app(RequestLoggingMiddleware))
+
+        response = client.get("/ping")
+
+        assert response.status_code == 200
+        assert float(response.headers["X-Process-Time"]) >= 0
+
+    def test_logs_request_lifecycle(self, caplog):
+        """Incoming and completed requests are logged"""
+        client = TestClient(_build_app(RequestLoggingMiddleware))
+
+        with caplog.at_level("INFO", logger="src.api.middleware"):
+            client.get("/ping")
+
+        messages = [record.getMessage() for record in caplog.records]
+        assert any(m.startswith("Incoming request: GET /ping") for m in messages)
+        assert any("Request completed: GET /ping - Status: 200" in m for m in messages)
+
+    def test_unhandled_error_returns_500(self):
+        """Exceptions from the app are converted into a JSON 500"""
+        client = TestClient(_build_app(RequestLoggingMiddleware), raise_server_exceptions=False)
+
+        response = client.get("/boom")
+
+        assert response.status_code == 500
+        assert response.json()["detail"] == "kaboom"
+        assert response.json()["path"] == "/boom"
+
+
+class TestRateLimitMiddleware:
+    """Test suite for RateLimitMiddleware"""
+
+    def test_requests_under_limit_pass(self):
+        """Requests below the limit reach the endpoint"""
+        client = TestClient(_build_app(RateLimitMiddleware, calls_per_minute=3))
+
+        for _ in range(3):
+            response = client.get("/ping")
+            assert response.status_code == 200
+
+    def test_request_over_limit_rejected(self):
+        """The request exceeding the limit gets a 429"""
+        client = TestClient(_build_app(RateLimitMiddleware, calls_per_minute=2))
+
+        client.get("/ping")
+        client.get("/ping")
+        response = client.get("/ping")
+
+        assert response.status_code == 429
+        assert response.json()["error"] == "Rate limit exceeded"
+        assert response.json()["retry_after"] == 60
+
+    def test_forwarded_clients_limited_separately(self):
+        """Clients behind a trusted proxy are keyed by the address the proxy appended"""
+        client = TestClient(_build_app(
+            RateLimitMiddleware, calls_per_minute=1, trusted_proxies=["testclient"]
+        ))
+
+        first = client.get("/ping", headers={"X-Forwarded-For": "10.0.0.1"})
+        second = client.get("/ping", headers={"X-Forwarded-For": "10.0.0.2"})
+        repeat = client.get("/ping", headers={"X-Forwarded-For": "10.0.0.1"})
+
+        assert first.status_code == 200
+        assert second.status_code == 200
+        assert repeat.status_code == 429
+
+    def test_spoofed_forwarded_entry_ignored(self):
+        """A client-supplied leading X-Forwarded-For entry does not get a fresh bucket"""
+        client = TestClient(_build_app(
+            RateLimitMiddleware, calls_per_minute=1, trusted_proxies=["testclient"]
+        ))
+
+        first = client.get("/ping", headers={"X-Forwarded-For": "1.1.1.1, 10.0.0.1"})
+        spoofed = client.get("/ping", headers={"X-Forwarded-For": "2.2.2.2, 10.0.0.1"})
+
+        assert first.status_code == 200
+        assert spoofed.status_code == 429
+
+    def test_untrusted_peer_header_ignored(self):
+        """X-Forwarded-For from a peer that is not a trusted proxy is ignored"""
+        client = TestClient(_build_app(RateLimitMiddleware, calls_per_minute=1))
+
+        first = client.get("/ping", headers={"X-Forwarded-For": "10.0.0.1"})
+        rotated = client.get("/ping", headers={"X-Forwarded-For": "10.0.0.2"})
+
+        assert first.status_code == 200
+        assert rotated.status_code == 429
+
+    def test_blocked_client_short_circuits(self):
+        """Once blocked, further requests are rejected from the ephemeral cache"""
+        app = _build_app(RateLimitMiddleware, calls_per_minute=1)
+        client = TestClient(app)
+
+        client.get("/ping")
+        assert client.get("/ping").status_code == 429
+
+        # Reason: find the middleware instance to inspect its blocked cache
+        middleware = app.middleware_stack
+        while not isinstance(middleware, RateLimitMiddleware):
+            middleware = middleware.app
+        assert len(middleware._blocked) == 1
+        recorded = sum(len(times) for times in middleware.requests.values())
+
+        assert client.get("/ping").status_code == 429
+        assert sum(len(times) for times in middleware.requests.values()) == recorded
+
+    def test_client_windows_are_bounded(self):
+        """Per-client windows live in a size-bounded cache"""
+        middleware = RateLimitMiddleware(FastAPI(), calls_per_minute=5)
+        middleware.requests = TTLCache(maxsize=2, ttl=120)
+
+        for index in range(5):
+            middleware.requests[f"10.0.0.{index}"] = deque([0.0])
+
+        assert len(middleware.requests) == 2
+
+    @pytest.mark.asyncio
+    async def test_expired_timestamps_are_dropped(self):
+        """Timestamps older than a minute no longer count towards the limit"""
+        middleware = RateLimitMiddleware(FastAPI(), calls_per_minute=2)
+
+        assert await middleware._record_request("10.0.0.1", 0.0)
+        assert await middleware._record_request("10.0.0.1", 1.0)
+        assert not await middleware._record_request("10.0.0.1", 30.0)
+        assert await middleware._record_request("10.0.0.1", 60.5)
+        assert list(middleware.requests["10.0.0.1"]) == [1.0, 60.5]
+
+
+class TestSecurityHeadersMiddleware:
+    """Test suite for SecurityHeadersMiddleware"""
+
+    def test_adds_security_headers(self):
+        """All static security headers are present on responses"""
+        client = TestClient(_build_app(SecurityHeadersMiddleware))
+
+        response = client.get("/ping")
+
+        assert response.status_code == 200
+        assert response.json() == {"ok": True}
+        assert response.headers["X-Content-Type-Options"] == "nosniff"
+        assert response.headers["X-Frame-Options"] == "DENY"
+        assert response.headers["X-XSS-Protection"] == "1; mode=block"
+        assert response.headers["Referrer-Policy"] == "strict-origin-when-cross-origin"
+        assert response.headers["X-API-Version"] == "1.0.0"
+
+    def test_headers_on_error_responses(self):
+        """Headers are added to 404 responses too"""
+        client = TestClient(_build_app(SecurityHeadersMiddleware))
+
+        response = client.get("/missing")
+
+        assert response.status_code == 404
+        assert response.headers["X-Frame-Options"] == "DENY"
+        assert len(response.headers.get_list("X-Frame-Options")) == 1
@@ -0,0 +1,215 @@
+"""Tests for the monitoring API routes"""
+
+import pytest
+from unittest.mock import Mock, AsyncMock, patch
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from src.api import monitoring_routes
+
+
+@pytest.fixture
+def mock_storage():
+    """Trend storage with canned query results"""
+    storage = Mock()
+    storage.get_recent_alerts = AsyncMock(return_value=[])
+    storage.get_trending_keywords = AsyncMock(return_value=[])
+    storage.get_category_analytics = AsyncMock(return_value={})
+    storage.get_storage_stats = AsyncMock(return_value={"total_alerts_stored": 3})
+    storage.data_version.return_value = "1-100"
+    return storage
+
+
+@pytest.fixture
+def mock_notification_service():
+    """Notification service with canned statistics"""
+    service = Mock()
+    service.get_notification_stats = AsyncMock(return_value={"total_notifications_sent": 7})
+    return service
+
+
+@pytest.fixture
+def client(mock_storage, mock_notification_service):
+    """Test client for an app serving only the monitoring router"""
+    app = FastAPI()
+    app.include_router(monitoring_routes.router)
+    app.include_router(monitoring_routes.internal_router)
+
+    detector = Mock()
+    detector.get_stats.return_value = {
+        "detector_stats": {"trends_detected": 2, "last_detection": None},
+        "configuration": {}
+    }
+    scheduler = Mock()
+    scheduler.is_running = False
+    scheduler.get_all_jobs_status.return_value = {
+        "scheduler_running": False,
+        "total_jobs": 0,
+        "statistics": {"next_execution": None},
+        "jobs": {}
+    }
+
+    # Reason: cached results must not leak between tests
+    monitoring_routes._build_dashboard_data.cache_clear()
+    monitoring_routes._build_monitoring_status.cache_clear()
+    monitoring_routes._load_category_analytics.cache_clear()
+
+    with patch.object(monitoring_routes, "get_trend_storage", AsyncMock(return_value=mock_storage)), \
+         patch.object(monitoring_routes, "get_notification_service", return_value=mock_notification_service), \
+         patch.object(monitoring_routes, "get_trend_detector", return_value=detector), \
+         patch.object(monitoring_routes, "get_scheduler", return_value=scheduler):
+        yield TestClient(app)
+
+
+class TestDashboardData:
+    """Test suite for the dashboard data endpoint"""
+
+    def test_dashboard_aggregates_all_sources(self, client, mock_storage):
+        """Dashboard payload includes every service's data"""
+        response = client.get("/api/monitoring/dashboard/data")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["storage_stats"] == {"total_alerts_stored": 3}
+        assert data["notification_stats"] == {"total_notifications_sent": 7}
+        assert data["detector_stats"]["detector_stats"]["trends_detected"] == 2
+        assert data["monitoring_status"]["scheduler_running"] is False
+        assert response.headers["Cache-Control"] == "max-age=5"
+        mock_storage.get_recent_alerts.assert_awaited_once_with(hours=24)
+        mock_storage.get_category_analytics.assert_awaited_once_with(days=30)
+
+    def test_dashboard_polls_share_cached_result(self, client, mock_storage):
+        """Repeated polls within the TTL reuse one backend roll-up"""
+        client.get("/api/monitoring/dashboard/data")
+        client.get("/api/monitoring/dashboard/data")
+
+        assert mock_storage.get_storage_stats.await_count == 1
+
+    def test_dashboard_storage_failure(self, client, mock_storage):
+        """A failing query turns into a 500"""
+        mock_storage.get_storage_stats.side_effect = RuntimeError("db down")
+
+        response = client.get("/api/monitoring/dashboard/data")
+
+        assert response.status_code == 500
+        assert response.json()["detail"] == "Failed to get dashboard data"
+
+
+class TestMonitoringStatus:
+    """Test suite for the monitoring status endpoint"""
+
+    def test_status_combines_service_stats(self, client):
+        """Status reflects scheduler, detector and notification statistics"""
+        response = client.get("/api/monitoring/status")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["scheduler_running"] is False
+        assert data["total_trends_detected"] == 2
+        assert data["total_alerts_sent"] == 7
+        assert data["last_detection"] is None
+
+    def test_status_failure(self, client, mock_notification_service):
+        """Service errors are reported as a 500"""
+        mock_notification_service.get_notification_stats.side_effect = RuntimeError("boom")
+
+        response = client.get("/api/monitoring/status")
+
+        assert response.status_code == 500
+
+
+class TestCategoryAnalytics:
+    """Test suite for the category analytics endpoint"""
+
+    def test_analytics_cached_per_period(self, client, mock_storage):
+        """Analytics results are cached separately for each period"""
+        mock_storage.get_category_analytics.return_value = {
+            "dance": {"total_alerts": 10, "alert_types": {"viral": 10}, "average_confidence": 0.8}
+        }
+
+        first = client.get("/api/monitoring/analytics?days=30")
+        client.get("/api/monitoring/analytics?days=30")
+        client.get("/api/monitoring/analytics?days=7")
+
+        assert first.status_code == 200
+        assert first.json()[0]["trend_momentum"] == 0.5
+        assert first.headers["Cache-Control"] == "max-age=60"
+        assert mock_storage.get_category_analytics.await_count == 2
+
+
+class TestRecentAlerts:
+    """Test suite for the recent alerts endpoint"""
+
+    def test_alerts_shaped_from_storage_rows(self, client, mock_storage):
+        """Storage rows are returned in the response schema, extra columns dropped"""
+        mock_storage.get_recent_alerts.return_value = [{
+            "alert_id": "a1",
+            "alert_type": "viral",
+            "title": "Dance",
+            "description": "Going viral",
+            "video_id": "v1",
+            "channel_title": "Channel",
+            "confidence_score": 0.9,
+            "detected_at": "2024-01-15 10:00:00.123456",
+            "category": "challenge",
+            "keywords": ["dance"],
+            "youtube_url": "https://www.youtube.com/watch?v=v1",
+            "current_stats": {"view_count": 1},
+            "thumbnail_url": ""
+        }]
+
+        response = client.get("/api/monitoring/alerts?hours=12&limit=5")
+
+        assert response.status_code == 200
+        alert = response.json()[0]
+        assert alert["alert_id"] == "a1"
+        assert alert["detected_at"] == "2024-01-15T10:00:00.123456"
+        assert "current_stats" not in alert
+        mock_storage.get_recent_alerts.assert_awaited_once_with(hours=12, alert_type=None, limit=5)
+
+    def test_alerts_limit_validated(self, client):
+        """Limits above the maximum are rejected"""
+        response = client.get("/api/monitoring/alerts?limit=500")
+
+        assert response.status_code == 422
+
+
+class TestInternalRoutes:
+    """Test suite for the undocumented polling endpoints"""
+
+    def test_internal_routes_hidden_from_schema(self, client):
+        """Polling endpoints are served but not documented"""
+        paths = client.get("/openapi.json").json()["paths"]
+
+        assert "/api/monitoring/status" in paths
+        assert "/api/monitoring/health" not in paths
+        assert "/api/monitoring/dashboard/data" not in paths
+        assert client.get("/api/monitoring/jobs").status_code == 200
+
+
+class TestConditionalStats:
+    """Test suite for ETag handling on slow-changing stats endpoints"""
+
+    def test_storage_stats_not_modified(self, client, mock_storage):
+        """A matching If-None-Match returns 304 without querying storage"""
+        first = client.get("/api/monitoring/storage/stats")
+        etag = first.headers["ETag"]
+
+        second = client.get("/api/monitoring/storage/stats", headers={"If-None-Match": etag})
+
+        assert first.status_code == 200
+        assert second.status_code == 304
+        assert second.headers["ETag"] == etag
+        assert mock_storage.get_storage_stats.await_count == 1
+
+    def test_storage_stats_changed_after_write(self, client, mock_storage):
+        """A database write (from any process) invalidates the previous ETag"""
+        etag = client.get("/api/monitoring/storage/stats").headers["ETag"]
+        mock_storage.data_version.return_value = "2-200"
+
+        response = client.get("/api/monitoring/storage/stats", headers={"If-None-Match": etag})
+
+        assert response.status_code == 200
+        assert response.headers["ETag"] != etag
+        assert response.json() == {"total_alerts_stored": 3}
@@ -0,0 +1,100 @@
+"""Tests for the client-side rate limiter"""
+
+import time
+import pytest
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from unittest.mock import Mock, patch
+
+from src.core.rate_limiter import AsyncTokenBucket, backoff_delay, get_retry_after, get_status_code
+
+
+def _http_error(headers: dict) -> Exception:
+    """Build an exception carrying a response with the given headers"""
+    error = Exception("429 Too Many Requests")
+    error.response = Mock(headers=headers)
+    return error
+
+
+class TestAsyncTokenBucket:
+    """Test suite for AsyncTokenBucket"""
+
+    @pytest.mark.asyncio
+    async def test_burst_within_capacity_does_not_wait(self):
+        """Requests up to the capacity are served immediately"""
+        bucket = AsyncTokenBucket(rate=1, capacity=3)
+
+        with patch("src.core.rate_limiter.asyncio.sleep") as sleep:
+            for _ in range(3):
+                await bucket.acquire()
+
+        sleep.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_empty_bucket_waits_for_refill(self):
+        """Once drained, callers are paced at the refill rate"""
+        bucket = AsyncTokenBucket(rate=50, capacity=1)
+        await bucket.acquire()
+
+        started = time.monotonic()
+        await bucket.acquire()
+        await bucket.acquire()
+
+        assert time.monotonic() - started >= 0.03
+
+    def test_rate_must_be_positive(self):
+        """A zero rate would never refill"""
+        with pytest.raises(ValueError):
+            AsyncTokenBucket(rate=0)
+
+
+class TestRetryAfter:
+    """Test suite for Retry-After handling"""
+
+    def test_seconds_header(self):
+        """Numeric Retry-After values are used as-is"""
+        assert get_retry_after(_http_error({"retry-after": "7"})) == 7.0
+
+    def test_http_date_header(self):
+        """HTTP-date Retry-After values become a delay from now"""
+        retry_at = datetime.now(timezone.utc) + timedelta(seconds=30)
+
+        delay = get_retry_after(_http_error({"retry-after": format_datetime(retry_at, usegmt=True)}))
+
+        assert 25 <= delay <= 30
+
+    @pytest.mark.parametrize("error", [
+        Exception("503 Service Unavailable"),
+        _http_error({}),
+        _http_error({"retry-after": "soon"}),
+    ])
+    def test_missing_or_invalid(self, error):
+        """Errors without a usable header yield None"""
+        assert get_retry_after(error) is None
+
+    def test_status_code_from_error_or_response(self):
+        """Status codes are read from SDK errors and from HTTP responses"""
+        sdk_error = Exception("rate limited")
+        sdk_error.status_code = 429
+        http_error = _http_error({})
+        http_error.response.status_code = 503
+
+        assert get_status_code(sdk_error) == 429
+        assert get_status_code(http_error) == 503
+        assert get_status_code(Exception("plain")) is None
+
+    def test_backoff_prefers_retry_after(self):
+        """The server's delay overrides exponential backoff"""
+        assert backoff_delay(0, _http_error({"retry-after": "12"})) == 12.0
+
+    def test_backoff_clamps_retry_after(self):
+        """An excessive Retry-After is capped at the maximum delay"""
+        assert backoff_delay(0, _http_error({"retry-after": "86400"}), max_delay=30.0) == 30.0
+        assert backoff_delay(0, _http_error({"retry-after": "86400"})) == 60.0
+
+    @pytest.mark.parametrize("attempt", [0, 1, 2])
+    def test_backoff_jitter_range(self, attempt):
+        """Without a header the delay is 50-100% of 2**attempt seconds"""
+        delay = backoff_delay(attempt, Exception("429"))
+
+        assert 0.5 * 2 ** attempt <= delay <= 2 ** attempt
@@ -0,0 +1,144 @@
+"""Tests for the SQLite trend storage"""
+
+import json
+import pytest
+import pytest_asyncio
+from datetime import datetime, timedelta
+
+from src.services.trend_detector import TrendAlert
+from src.services.trend_storage import TrendStorage
+
+
+def _make_alert(index: int, alert_type: str = "viral", minutes_ago: int = 0) -> TrendAlert:
+    """Build a trend alert detected `minutes_ago` minutes in the past"""
+    return TrendAlert(
+        alert_id=f"alert_{index}",
+        alert_type=alert_type,
+        title=f"Video {index}",
+        description="Trending video",
+        video_id=f"video_{index}",
+        channel_title="Channel",
+        current_stats={"view_count": 1000 * index},
+        growth_metrics={"growth_rate": 1.5},
+        confidence_score=0.9,
+        detected_at=datetime.now() - timedelta(minutes=minutes_ago),
+        category="challenge",
+        keywords=["dance", "challenge"],
+        youtube_url=f"https://www.youtube.com/watch?v=video_{index}",
+        thumbnail_url=""
+    )
+
+
+@pytest_asyncio.fixture
+async def storage(tmp_path):
+    """Initialized storage backed by a temporary database"""
+    trend_storage = TrendStorage(db_path=str(tmp_path / "trends.db"))
+    await trend_storage.initialize()
+    return trend_storage
+
+
+class TestTrendStorage:
+    """Test suite for TrendStorage"""
+
+    @pytest.mark.asyncio
+    async def test_store_and_get_recent_alerts(self, storage):
+        """Stored alerts come back newest first with JSON fields decoded"""
+        await storage.store_trend_alerts([_make_alert(1, minutes_ago=10), _make_alert(2)])
+
+        alerts = await storage.get_recent_alerts(hours=1)
+
+        assert [a["alert_id"] for a in alerts] == ["alert_2", "alert_1"]
+        assert alerts[0]["keywords"] == ["dance", "challenge"]
+        assert alerts[0]["current_stats"] == {"view_count": 2000}
+
+    @pytest.mark.asyncio
+    async def test_get_recent_alerts_limit(self, storage):
+        """The limit is applied in the query and keeps the newest alerts"""
+        await storage.store_trend_alerts(
+            [_make_alert(i, minutes_ago=i) for i in range(5)]
+        )
+
+        alerts = await storage.get_recent_alerts(hours=1, limit=2)
+
+        assert [a["alert_id"] for a in alerts] == ["alert_0", "alert_1"]
+
+    @pytest.mark.asyncio
+    async def test_get_recent_alerts_filters_type(self, storage):
+        """Alert type filter is combined with the limit"""
+        await storage.store_trend_alerts([
+            _make_alert(1, alert_type="viral"),
+            _make_alert(2, alert_type="rising"),
+            _make_alert(3, alert_type="rising", minutes_ago=5)
+        ])
+
+        alerts = await storage.get_recent_alerts(hours=1, alert_type="rising", limit=1)
+
+        assert [a["alert_id"] for a in alerts] == ["alert_2"]
+
+    @pytest.mark.asyncio
+    async def test_get_recent_alerts_missing_database(self, tmp_path):
+        """Query failures return an empty list"""
+        broken = TrendStorage(db_path=str(tmp_path / "missing" / "trends.db"))
+
+        assert await broken.get_recent_alerts(hours=1) == []
+
+    @pytest.mark.asyncio
+    async def test_store_trend_alerts_batch_updates_keywords(self, storage):
+        """A batch insert stores every alert and commits keyword trends"""
+        stored = await storage.store_trend_alerts([_make_alert(i) for i in range(3)])
+
+        keywords = await storage.get_trending_keywords(days=1)
+
+        assert stored == 3
+        assert storage.stats["total_alerts_stored"] == 3
+        assert {k["keyword"]: k["frequency"] for k in keywords} == {"dance": 3, "challenge": 3}
+
+    @pytest.mark.asyncio
+    async def test_store_trend_alerts_falls_back_per_alert(self, storage):
+        """A bad alert only drops itself when the batch insert fails"""
+        bad_alert = _make_alert(2)
+        bad_alert.current_stats = {"unserializable": object()}
+
+        stored = await storage.store_trend_alerts([_make_alert(1), bad_alert, _make_alert(3)])
+
+        alerts = await storage.get_recent_alerts(hours=1)
+        assert stored == 2
+        assert {a["alert_id"] for a in alerts} == {"alert_1", "alert_3"}
+
+    @pytest.mark.asyncio
+    async def test_store_trend_alerts_empty(self, storage):
+        """Storing an empty list is a no-op"""
+        version = storage.data_version()
+        assert await storage.store_trend_alerts([]) == 0
+        assert storage.data_version() == version
+
+    @pytest.mark.asyncio
+    async def test_data_version_tracks_other_writers(self, storage):
+        """Writes through another instance (e.g. another process) change the version"""
+        version = storage.data_version()
+
+        other_writer = TrendStorage(db_path=storage.db_path)
+        await other_writer.store_trend_alerts([_make_alert(1)])
+
+        assert storage.data_version() != version
+
+    @pytest.mark.asyncio
+    async def test_export_data(self, storage, tmp_path):
+        """Export writes alerts and keyword trends as JSON"""
+        await storage.store_trend_alerts([_make_alert(1), _make_alert(2)])
+        output_path = tmp_path / "export.json"
+
+        success = await storage.export_data(str(output_path), days=1)
+
+        assert success is True
+        exported = json.loads(output_path.read_text(encoding="utf-8"))
+        assert exported["period_days"] == 1
+        assert {a["alert_id"] for a in exported["alerts"]} == {"alert_1", "alert_2"}
+        assert {k["keyword"] for k in exported["keywords"]} == {"dance", "challenge"}
+
+    @pytest.mark.asyncio
+    async def test_export_data_unwritable_path(self, storage, tmp_path):
+        """Write failures are reported as False"""
+        output_path = tmp_path / "missing_dir" / "export.json"
+
+        assert await storage.export_data(str(output_path), days=1) is False